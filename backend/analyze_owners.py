@@ -2,10 +2,11 @@
 Analyze owner names across all years to identify mapping needs
 """
 
-import json
 from pathlib import Path
 from collections import defaultdict
 
+from raw_storage import load_season
+
 RAW_DATA_DIR = Path(__file__).parent.parent / 'data' / 'raw'
 
 def analyze_owners():
@@ -17,13 +18,10 @@ def analyze_owners():
 
     # Load all season files
     for year in range(2010, 2025):
-        season_file = RAW_DATA_DIR / f'season_{year}.json'
-        if not season_file.exists():
+        data = load_season(year, raw_dir=RAW_DATA_DIR)
+        if data is None:
             continue
 
-        with open(season_file, 'r') as f:
-            data = json.load(f)
-
         for team in data.get('teams', []):
             owner = team.get('owner', 'Unknown')
             if owner and owner != 'Unknown':
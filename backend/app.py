@@ -10,6 +10,7 @@ from flask import Flask, jsonify, send_file
 from flask_cors import CORS
 from data_processor import FantasyDataProcessor
 from excel_generator import ExcelGenerator
+from head_to_head import HeadToHead
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for React frontend
@@ -155,15 +156,15 @@ def get_all_head_to_head():
 
 @app.route('/api/head-to-head/<team1>/<team2>', methods=['GET'])
 def get_head_to_head(team1, team2):
-    """Get head-to-head record between two teams"""
-    h2h = load_json_file('head_to_head.json')
+    """Get head-to-head record between two teams, overall and split into regular season and playoffs"""
+    matrix = load_json_file('head_to_head_matrix.json')
     matchups = load_json_file('matchups.json')
 
-    if not all([h2h, matchups]):
+    if not all([matrix, matchups]):
         return jsonify({'error': 'Data not found'}), 404
 
     # Get record
-    record = h2h.get(team1, {}).get(team2, {'wins': 0, 'losses': 0, 'ties': 0, 'points_for': 0, 'points_against': 0})
+    h2h = HeadToHead.from_dict(matrix)
 
     # Get all matchups between these teams
     team_matchups = [
@@ -175,11 +176,33 @@ def get_head_to_head(team1, team2):
     return jsonify({
         'team1': team1,
         'team2': team2,
-        'record': record,
+        'record': h2h.record(team1, team2),
+        'regular_season': h2h.record(team1, team2, 'regular_season'),
+        'playoffs': h2h.record(team1, team2, 'playoffs'),
         'matchups': team_matchups
     })
 
 
+@app.route('/api/luck', methods=['GET'])
+def get_all_luck():
+    """Get all-play records, expected wins and luck for every team-season"""
+    luck = load_json_file('luck.json')
+    if luck is None:
+        return jsonify({'error': 'Luck data not found'}), 404
+
+    return jsonify(luck)
+
+
+@app.route('/api/luck/<int:year>', methods=['GET'])
+def get_luck(year):
+    """Get all-play records, expected wins and luck for a specific season"""
+    luck = load_json_file('luck.json')
+    if luck is None:
+        return jsonify({'error': 'Luck data not found'}), 404
+
+    return jsonify([row for row in luck if row['year'] == year])
+
+
 @app.route('/api/standings', methods=['GET'])
 def get_all_standings():
     """Get standings for all seasons"""
@@ -235,6 +258,16 @@ def get_records():
     return jsonify(records)
 
 
+@app.route('/api/leaderboards', methods=['GET'])
+def get_leaderboards():
+    """Get the top and bottom entries of every record category"""
+    leaderboards = load_json_file('leaderboards.json')
+    if leaderboards is None:
+        return jsonify({'error': 'Leaderboards not found'}), 404
+
+    return jsonify(leaderboards)
+
+
 @app.route('/api/export/excel', methods=['GET'])
 def export_excel():
     """Generate and download Excel file"""
@@ -260,15 +293,15 @@ def refresh_data():
 
         # Extract new data
         extractor = ESPNDataExtractor()
+        extractor.install_transport()
         successful, failed = extractor.extract_all_seasons(force_refresh=True)
 
         if not successful:
             return jsonify({'error': 'Failed to extract data'}), 500
 
-        # Process data
+        # Process data, reusing the saved results of seasons whose raw data didn't change
         processor = FantasyDataProcessor()
-        processor.load_raw_data()
-        processor.process_all()
+        processor.process_incremental()
         processor.save_processed_data()
 
         return jsonify({
@@ -302,11 +335,14 @@ if __name__ == '__main__':
     print("   GET  /api/matchups/team/<team_name>")
     print("   GET  /api/head-to-head")
     print("   GET  /api/head-to-head/<team1>/<team2>")
+    print("   GET  /api/luck")
+    print("   GET  /api/luck/<year>")
     print("   GET  /api/standings")
     print("   GET  /api/standings/<year>")
     print("   GET  /api/playoffs")
     print("   GET  /api/playoffs/<year>")
     print("   GET  /api/records")
+    print("   GET  /api/leaderboards")
     print("   GET  /api/export/excel")
     print("   POST /api/refresh")
     print("\n" + "=" * 60 + "\n")
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Benchmark ESPN extraction against a local stub of espn_api's League.
+
+No network or ESPN cookies are needed: data_extractor.League is replaced by a
+stub that sleeps for a fixed latency on every simulated API round trip, and raw
+files are written to a temporary directory.
+
+Usage:
+    python benchmark_extraction.py
+    python benchmark_extraction.py --seasons 12 --latency 0.05 --workers 1 4 8
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+from espn_api.football.constant import POSITION_MAP
+
+import data_extractor
+
+
+class StubPlayer:
+    """Minimal stand-in for espn_api BoxPlayer / Player"""
+
+    def __init__(self, player_id, position, rng):
+        self.name = f"Player {player_id}" + (' D/ST' if position == 'D/ST' else '')
+        self.playerId = player_id
+        self.position = position
+        self.lineupSlot = position
+        self.proTeam = 'FA'
+        self.injured = False
+        self.injuryStatus = 'ACTIVE'
+        self.points = round(rng.uniform(0, 30), 2)
+        self.projected_points = round(rng.uniform(0, 25), 2)
+        self.avg_points = self.points
+        self.total_points = self.points * 14
+
+
+class StubTeam:
+    """Minimal stand-in for espn_api Team"""
+
+    def __init__(self, team_id, rng):
+        self.team_id = team_id
+        self.team_name = f"Team {team_id}"
+        self.team_abbrev = f"T{team_id}"
+        self.owners = [{'displayName': f"owner{team_id}", 'firstName': 'Owner', 'lastName': str(team_id)}]
+        self.wins = rng.randint(0, 14)
+        self.losses = 14 - self.wins
+        self.ties = 0
+        self.points_for = round(rng.uniform(1200, 1800), 2)
+        self.points_against = round(rng.uniform(1200, 1800), 2)
+        self.standing = team_id
+        self.playoff_seed = team_id if team_id <= 6 else None
+        self.final_standing = team_id
+        self.schedule = []
+        positions = ['QB', 'QB', 'RB', 'RB', 'RB', 'WR', 'WR', 'WR', 'TE', 'D/ST', 'K', 'RB', 'WR', 'QB', 'TE', 'WR']
+        self.roster = [StubPlayer(team_id * 100 + i, pos, rng) for i, pos in enumerate(positions)]
+
+
+class StubLeague:
+    """
+    Stand-in for espn_api.football.League.
+
+    Construction and every box_scores() call sleep for `latency` seconds to
+    simulate an ESPN round trip. Setting `live_week` makes the current calendar
+    year an in-progress season whose current week is `live_week`.
+    """
+
+    latency = 0.02
+    team_count = 12
+    reg_season_count = 14
+    playoff_round_lengths = (1, 2)  # the final spans two scoring periods
+    live_week = None
+    calls = 0
+    _calls_lock = threading.Lock()
+
+    def __init__(self, league_id, year, espn_s2=None, swid=None):
+        self._round_trip()
+        rng = random.Random(year)
+        self.year = year
+        self.league_id = league_id
+        matchup_periods = {str(week): [week] for week in range(1, self.reg_season_count + 1)}
+        week = self.reg_season_count
+        for period_id, length in enumerate(self.playoff_round_lengths, start=self.reg_season_count + 1):
+            matchup_periods[str(period_id)] = list(range(week + 1, week + length + 1))
+            week += length
+        self.finalScoringPeriod = week
+        self.current_week = self.finalScoringPeriod
+        if self.live_week and year == datetime.now().year:
+            self.current_week = self.live_week
+        self.settings = SimpleNamespace(
+            name='Stub League',
+            reg_season_count=self.reg_season_count,
+            playoff_team_count=6,
+            team_count=self.team_count,
+            matchup_periods=matchup_periods,
+        )
+        self.teams = [StubTeam(team_id, rng) for team_id in range(1, self.team_count + 1)]
+        self.espn_request = StubRequests(self)
+        self.draft = []
+        for round_num in range(1, 4):
+            for round_pick, team in enumerate(self.teams, start=1):
+                self.draft.append(SimpleNamespace(
+                    playerName=f"Pick {round_num}.{round_pick}",
+                    playerId=year * 1000 + round_num * 100 + round_pick,
+                    team=team,
+                    round_num=round_num,
+                    round_pick=round_pick,
+                    bid_amount=rng.randint(1, 60),
+                    keeper_status=False,
+                ))
+
+    @classmethod
+    def _round_trip(cls):
+        with cls._calls_lock:
+            cls.calls += 1
+        time.sleep(cls.latency)
+
+    def box_scores(self, week=None):
+        self._round_trip()
+        if self.year < data_extractor.BOX_SCORE_FIRST_YEAR:
+            raise Exception("Cant use box score before 2019")  # as espn_api does
+        if week is None or week > self.current_week:
+            return []
+        return self._matchups(week)
+
+    def _matchups(self, week):
+        rng = random.Random(self.year * 100 + week)
+        box_scores = []
+        for i in range(0, len(self.teams), 2):
+            home, away = self.teams[i], self.teams[i + 1]
+            box_scores.append(SimpleNamespace(
+                home_team=home,
+                away_team=away,
+                home_score=round(rng.uniform(60, 160), 2),
+                away_score=round(rng.uniform(60, 160), 2),
+                home_lineup=home.roster,
+                away_lineup=away.roster,
+            ))
+        return box_scores
+
+
+class StubRequests:
+    """Stand-in for espn_api's EspnFantasyRequests serving raw schedule views"""
+
+    def __init__(self, league):
+        self.league = league
+
+    @staticmethod
+    def _raw_side(team, score, week):
+        entries = []
+        for player in team.roster:
+            slot_id = POSITION_MAP[player.position]
+            entries.append({
+                'lineupSlotId': slot_id,
+                'playerPoolEntry': {
+                    'appliedStatTotal': player.points,
+                    'player': {
+                        'id': player.playerId,
+                        'fullName': player.name,
+                        'eligibleSlots': [slot_id],
+                        'stats': [{'scoringPeriodId': week, 'statSourceId': 1,
+                                   'appliedTotal': player.projected_points}],
+                    },
+                },
+            })
+        return {'teamId': team.team_id, 'totalPoints': score, 'rosterForMatchupPeriod': {'entries': entries}}
+
+    def league_get(self, params=None, headers=None, extend=''):
+        StubLeague._round_trip()
+        period_ids = json.loads(headers['x-fantasy-filter'])['schedule']['filterMatchupPeriodIds']['value']
+        schedule = []
+        for period_id in period_ids:
+            # A multi-week round reports its cumulative score, unlike box_scores(first week)
+            weeks = self.league.settings.matchup_periods[str(period_id)]
+            rounds = zip(*(self.league._matchups(week) for week in weeks))
+            for matchups in rounds:
+                home_score = round(sum(matchup.home_score for matchup in matchups), 2)
+                away_score = round(sum(matchup.away_score for matchup in matchups), 2)
+                schedule.append({
+                    'matchupPeriodId': period_id,
+                    'home': self._raw_side(matchups[0].home_team, home_score, min(weeks)),
+                    'away': self._raw_side(matchups[0].away_team, away_score, min(weeks)),
+                })
+        return {'schedule': schedule}
+
+
+def run_extraction(workers, seasons, force_refresh=True, batch_views=False):
+    """Run extract_all_seasons against the stub and return (elapsed, calls, result, extractor)"""
+    StubLeague.calls = 0
+    extractor = data_extractor.ESPNDataExtractor(league_id=1, espn_s2='stub', swid='stub',
+                                                 batch_views=batch_views)
+    # One season before box scores exist, where batch_views must not add data
+    start_year = data_extractor.BOX_SCORE_FIRST_YEAR - 1
+    started = time.perf_counter()
+    result = extractor.extract_all_seasons(
+        start_year=start_year,
+        end_year=start_year + seasons - 1,
+        force_refresh=force_refresh,
+        workers=workers,
+    )
+    return time.perf_counter() - started, StubLeague.calls, result, extractor
+
+
+def run_in_season_refresh(live_week):
+    """
+    Extract the current year at live_week - 1, then refresh it at live_week
+    both incrementally and from scratch. Returns the two timings and call counts
+    and whether the merged data matches the full re-extraction.
+    """
+    year = datetime.now().year
+    extractor = data_extractor.ESPNDataExtractor(league_id=1, espn_s2='stub', swid='stub')
+
+    StubLeague.live_week = live_week - 1
+    extractor.extract_all_seasons(start_year=year, end_year=year, force_refresh=True)
+
+    StubLeague.live_week = live_week
+    runs = {}
+    for mode in ('incremental', 'full'):
+        StubLeague.calls = 0
+        started = time.perf_counter()
+        extractor.extract_all_seasons(start_year=year, end_year=year,
+                                      force_refresh=(mode == 'full'), incremental=True)
+        runs[mode] = (time.perf_counter() - started, StubLeague.calls, extractor.load_season_data(year))
+
+    incremental_data, full_data = runs['incremental'][2], runs['full'][2]
+    matches = all(incremental_data[key] == full_data[key] for key in ('matchups', 'player_stats', 'teams'))
+    StubLeague.live_week = None
+    return runs['incremental'][:2], runs['full'][:2], matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ESPN extraction against a stub League')
+    parser.add_argument('--seasons', type=int, default=8, help='Number of seasons to extract (default: 8)')
+    parser.add_argument('--latency', type=float, default=0.02, help='Simulated seconds per API round trip (default: 0.02)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4], help='Worker counts to compare (default: 1 4)')
+    args = parser.parse_args()
+
+    StubLeague.latency = args.latency
+    data_extractor.League = StubLeague
+
+    timings = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_extractor.RAW_DATA_DIR = Path(tmp_dir)
+        for workers in args.workers:
+            elapsed, calls, (successful, failed), extractor = run_extraction(workers, args.seasons)
+            saved = extractor.box_score_stats['saved']
+            timings.append((workers, elapsed, calls, saved, len(successful), len(failed)))
+        incremental, full, matches = run_in_season_refresh(live_week=10)
+
+        # Same seasons through raw batched schedule views, compared with the box score output
+        # (the stub's final spans two scoring periods, so a multi-week round is covered)
+        box_score_seasons = {year: extractor.load_season_data(year) for year in successful}
+        batch_elapsed, batch_calls, _, extractor = run_extraction(1, args.seasons, batch_views=True)
+        batch_matches = all(
+            extractor.load_season_data(year)[key] == data[key]
+            for year, data in box_score_seasons.items()
+            for key in ('matchups', 'player_stats')
+        )
+
+    print("\n" + "=" * 60)
+    print(f"  EXTRACTION BENCHMARK ({args.seasons} seasons, {args.latency * 1000:.0f}ms latency)")
+    print("=" * 60)
+    baseline = timings[0][1]
+    for workers, elapsed, calls, saved, ok, failed in timings:
+        print(f"  workers={workers:<3} {elapsed:7.2f}s  {calls:4d} API calls ({saved} saved by cache)  "
+              f"{ok} ok / {failed} failed  ({baseline / elapsed:.1f}x)")
+    print(f"  batch_views {batch_elapsed:7.2f}s  {batch_calls:4d} API calls  "
+          f"({'matches' if batch_matches else 'DIFFERS FROM'} box scores, {baseline / batch_elapsed:.1f}x)")
+    print("-" * 60)
+    print(f"  In-season refresh (week 10):")
+    print(f"    full        {full[0]:7.2f}s  {full[1]:4d} API calls")
+    print(f"    incremental {incremental[0]:7.2f}s  {incremental[1]:4d} API calls  "
+          f"({'matches' if matches else 'DIFFERS FROM'} full refresh)")
+    print("=" * 60 + "\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Benchmark FantasyDataProcessor on a synthetic league.
+
+No raw files are needed: a seeded generator builds seasons shaped like the
+extractor's output (teams, matchups, draft, rosters and weekly player stats),
+and the data is processed both stage by stage and fused (each season visited
+once for every stage), checking that both give the same output. --stages also
+times each stage of the staged run; --incremental writes the league to a
+temporary raw directory and times an incremental re-run after the last season
+changes; --jobs N adds staged and fused runs with the per-season work in N
+worker processes; --memory traces peak memory with tracemalloc and compares
+player_stats held as PlayerStat records with the dicts they are saved as.
+
+Usage:
+    python benchmark_processing.py
+    python benchmark_processing.py --seasons 50 --teams 12 --repeat 5
+    python benchmark_processing.py --stages
+    python benchmark_processing.py --incremental
+    python benchmark_processing.py --jobs 4
+    python benchmark_processing.py --memory
+"""
+
+import argparse
+import contextlib
+import copy
+import gc
+import io
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import data_processor
+
+from data_processor import STAGES, FantasyDataProcessor, PlayerStat
+from raw_storage import save_season
+
+FIRST_YEAR = 1976
+REG_SEASON_WEEKS = 14
+PLAYOFF_WEEKS = 3
+LINEUP = ['QB', 'QB', 'RB', 'RB', 'WR', 'WR', 'TE', 'RB/WR/TE', 'D/ST', 'K']
+BENCH = ['BE'] * 6
+POSITIONS = ['QB', 'RB', 'WR', 'TE', 'D/ST', 'K']
+
+
+def generate_season(year, team_count, owners, rng):
+    """One season of raw data in the extractor's format"""
+    season_owners = rng.sample(owners, team_count)
+    teams = []
+    for team_id, owner in enumerate(season_owners, start=1):
+        teams.append({
+            'team_id': team_id,
+            'team_name': f"{owner.split()[0]}'s Team {year % 7}",
+            'owner': owner,
+            'wins': 0,
+            'losses': 0,
+            'ties': 0,
+            'points_for': 0.0,
+            'points_against': 0.0,
+        })
+
+    # Each player belongs to one team for the whole season
+    rosters = {}
+    player_pool = {}
+    for team in teams:
+        players = []
+        for slot_number, slot in enumerate(LINEUP + BENCH):
+            position = rng.choice(POSITIONS) if slot in ('BE', 'RB/WR/TE') else slot
+            player_id = year * 10000 + team['team_id'] * 100 + slot_number
+            players.append({'player_id': player_id, 'player_name': f"Player {player_id}",
+                            'position': position, 'slot': slot})
+        player_pool[team['team_id']] = players
+        rosters[str(team['team_id'])] = [{'player_name': p['player_name'], 'player_id': p['player_id'],
+                                         'position': p['position']} for p in players]
+
+    matchups = []
+    player_stats = []
+    for week in range(1, REG_SEASON_WEEKS + PLAYOFF_WEEKS + 1):
+        order = teams[:]
+        rng.shuffle(order)
+        for home, away in zip(order[::2], order[1::2]):
+            scores = {}
+            for team in (home, away):
+                total = 0.0
+                for player in player_pool[team['team_id']]:
+                    points = round(rng.uniform(-2, 35), 2)
+                    if player['slot'] != 'BE':
+                        total += points
+                    if week <= REG_SEASON_WEEKS:
+                        player_stats.append({
+                            'week': week,
+                            'team_id': team['team_id'],
+                            'team_name': team['team_name'],
+                            'player_name': player['player_name'],
+                            'player_id': player['player_id'],
+                            'position': player['position'],
+                            'slot': player['slot'],
+                            'points': points,
+                            'projected_points': round(rng.uniform(0, 25), 2),
+                        })
+                scores[team['team_id']] = round(total, 2)
+
+            home_score, away_score = scores[home['team_id']], scores[away['team_id']]
+            matchups.append({
+                'week': week,
+                'home_team': home['team_name'],
+                'away_team': away['team_name'],
+                'home_score': home_score,
+                'away_score': away_score,
+                'home_team_id': home['team_id'],
+                'away_team_id': away['team_id'],
+                'is_playoff': week > REG_SEASON_WEEKS,
+            })
+            if week > REG_SEASON_WEEKS:
+                continue
+            for team, scored, allowed in ((home, home_score, away_score), (away, away_score, home_score)):
+                team['points_for'] += scored
+                team['points_against'] += allowed
+                if scored > allowed:
+                    team['wins'] += 1
+                elif scored < allowed:
+                    team['losses'] += 1
+                else:
+                    team['ties'] += 1
+
+    ranked = sorted(teams, key=lambda t: (t['wins'], t['points_for']), reverse=True)
+    finish = list(range(1, team_count + 1))
+    rng.shuffle(finish)
+    for standing, team in enumerate(ranked, start=1):
+        team['standing'] = standing
+        team['playoff_seed'] = standing if standing <= 6 else None
+        team['final_standing'] = finish[standing - 1]
+        team['points_for'] = round(team['points_for'], 2)
+        team['points_against'] = round(team['points_against'], 2)
+
+    draft = []
+    for round_num in range(1, len(LINEUP + BENCH) + 1):
+        for round_pick, team in enumerate(teams, start=1):
+            player = player_pool[team['team_id']][round_num - 1]
+            draft.append({
+                'player_name': player['player_name'],
+                'player_id': player['player_id'],
+                'team_id': team['team_id'],
+                'team_name': team['team_name'],
+                'round_num': round_num,
+                'round_pick': round_pick,
+                'bid_amount': rng.randint(0, 70),
+                'keeper_status': rng.random() < 0.05,
+            })
+
+    return {
+        'year': year,
+        'league_name': 'Synthetic League',
+        'teams': teams,
+        'matchups': matchups,
+        'draft': draft,
+        'rosters': rosters,
+        'player_stats': player_stats,
+        'settings': {'reg_season_count': REG_SEASON_WEEKS, 'team_count': team_count},
+    }
+
+
+def generate_league(seasons, team_count, seed=0):
+    """{year: season_data} for a league of `seasons` consecutive seasons"""
+    rng = random.Random(seed)
+    owners = [f"Owner{i} Name{i}" for i in range(team_count * 2)]
+    return {year: generate_season(year, team_count, owners, rng)
+            for year in range(FIRST_YEAR, FIRST_YEAR + seasons)}
+
+
+def run_processing(raw_data, fused=False, jobs=1):
+    """Process a copy of raw_data; returns (elapsed, processed_data)"""
+    processor = FantasyDataProcessor()
+    processor.raw_data = copy.deepcopy(raw_data)
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        processor.process_all(jobs=jobs, fused=fused)
+    elapsed = time.perf_counter() - started
+    processor.processed_data['metadata'].pop('processed_at')
+    return elapsed, processor.processed_data
+
+
+def time_stages(raw_data):
+    """
+    Run the staged pass on a copy of raw_data; returns {stage: elapsed}, each
+    stage's season parts and their merge
+    """
+    processor = FantasyDataProcessor()
+    processor.raw_data = copy.deepcopy(raw_data)
+    timings = {}
+
+    def timed(stage, method):
+        def run():
+            started = time.perf_counter()
+            method()
+            timings[stage] = time.perf_counter() - started
+        return run
+
+    # process() looks stages up on the instance, so it runs the timed ones
+    for stage in STAGES:
+        setattr(processor, stage, timed(stage, getattr(processor, stage)))
+    with contextlib.redirect_stdout(io.StringIO()):
+        processor.process()
+    return timings
+
+
+def traced(build):
+    """(result of build(), bytes it allocated and still holds, peak bytes allocated during it)"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, held, peak
+
+
+def measure_memory(raw_data):
+    """
+    Peak memory of processing a copy of raw_data (the copy itself not
+    counted), and the memory held by the processed player_stats as PlayerStat
+    records and as dicts. Returns (peak, records, dicts) in bytes.
+    """
+    processor = FantasyDataProcessor()
+    processor.raw_data = copy.deepcopy(raw_data)
+    with contextlib.redirect_stdout(io.StringIO()):
+        _, _, peak = traced(processor.process_all)
+
+    # Both forms share the interned strings and numbers, so only the containers differ
+    player_stats = processor.processed_data['player_stats']
+    _, records, _ = traced(lambda: [PlayerStat(*stat.to_row()) for stat in player_stats])
+    _, dicts, _ = traced(lambda: [stat.to_dict() for stat in player_stats])
+    return peak, records, dicts
+
+
+def run_incremental(raw_data):
+    """
+    Time a full run from raw files against an incremental re-run after the
+    last season's raw file changes. Returns (full elapsed,
+    incremental elapsed, whether the two outputs match).
+    """
+    def timed(process):
+        processor = FantasyDataProcessor()
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            process(processor)
+        elapsed = time.perf_counter() - started
+        processor.processed_data['metadata'].pop('processed_at')
+        return elapsed, processor.processed_data
+
+    def full(processor):
+        processor.load_raw_data()
+        processor.process_all()
+
+    raw_data = copy.deepcopy(raw_data)
+    last_year = max(raw_data)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_processor.RAW_DATA_DIR = Path(tmp_dir) / 'raw'
+        data_processor.PARTIALS_DIR = Path(tmp_dir) / 'partials'
+        for year, season_data in raw_data.items():
+            save_season(year, season_data, 'json', raw_dir=data_processor.RAW_DATA_DIR)
+        timed(lambda processor: processor.process_incremental())
+
+        # A new week of the in-progress season
+        raw_data[last_year]['matchups'][-1]['home_score'] += 1.0
+        save_season(last_year, raw_data[last_year], 'json', raw_dir=data_processor.RAW_DATA_DIR)
+        full_elapsed, full_data = timed(full)
+        incremental_elapsed, incremental_data = timed(lambda processor: processor.process_incremental())
+    return full_elapsed, incremental_elapsed, full_data == incremental_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark data processing on a synthetic league')
+    parser.add_argument('--seasons', type=int, default=50, help='Number of seasons to generate (default: 50)')
+    parser.add_argument('--teams', type=int, default=12, help='Teams per season (default: 12)')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per mode; the fastest is reported (default: 5)')
+    parser.add_argument('--stages', action='store_true', help='Also time each stage of the staged pass')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Also time an incremental re-run after the last season changes')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Also time staged and fused runs with the per-season work in this many processes')
+    parser.add_argument('--memory', action='store_true', help='Also trace peak memory with tracemalloc')
+    args = parser.parse_args()
+
+    print(f"Generating {args.seasons} seasons of {args.teams} teams...")
+    raw_data = generate_league(args.seasons, args.teams)
+
+    # Alternate the modes so machine noise affects them alike
+    modes = {'staged, 1 process': (False, 1), 'fused, 1 process': (True, 1)}
+    if args.jobs > 1:
+        modes[f'staged, {args.jobs} processes'] = (False, args.jobs)
+        modes[f'fused, {args.jobs} processes'] = (True, args.jobs)
+    timings = {mode: [] for mode in modes}
+    results = {}
+    for _ in range(args.repeat):
+        for mode, (fused, jobs) in modes.items():
+            gc.collect()
+            elapsed, results[mode] = run_processing(raw_data, fused, jobs)
+            timings[mode].append(elapsed)
+    timings = {mode: min(runs) for mode, runs in timings.items()}
+
+    stage_timings = {}
+    if args.stages:
+        for _ in range(args.repeat):
+            gc.collect()
+            for stage, elapsed in time_stages(raw_data).items():
+                stage_timings[stage] = min(stage_timings.get(stage, elapsed), elapsed)
+
+    incremental = run_incremental(raw_data) if args.incremental else None
+    memory = measure_memory(raw_data) if args.memory else None
+
+    print("\n" + "=" * 60)
+    print(f"  PROCESSING BENCHMARK ({args.seasons} seasons, {args.teams} teams, best of {args.repeat})")
+    print("=" * 60)
+    baseline = 'staged, 1 process'
+    for mode, elapsed in timings.items():
+        if mode == baseline:
+            print(f"  {mode:<27} {elapsed:7.2f}s")
+            continue
+        print(f"  {mode:<27} {elapsed:7.2f}s  ({timings[baseline] / elapsed:.2f}x, "
+              f"{'matches' if results[mode] == results[baseline] else 'DIFFERS FROM'} staged output)")
+    if incremental:
+        full_elapsed, incremental_elapsed, incremental_matches = incremental
+        print("-" * 60)
+        print(f"  Last season changed (reading raw files):")
+        print(f"    full              {full_elapsed:7.2f}s")
+        print(f"    incremental       {incremental_elapsed:7.2f}s  ({full_elapsed / incremental_elapsed:.1f}x, "
+              f"{'matches' if incremental_matches else 'DIFFERS FROM'} full run)")
+    if memory:
+        peak, records, dicts = memory
+        print("-" * 60)
+        print(f"  Memory (tracemalloc, raw data not counted):")
+        print(f"    peak                {peak / 2**20:7.1f} MB")
+        print(f"    player_stats        {records / 2**20:7.1f} MB as records, {dicts / 2**20:.1f} MB as dicts "
+              f"({records / dicts:.0%})")
+    if stage_timings:
+        print("-" * 60)
+        for stage, elapsed in stage_timings.items():
+            print(f"    {stage:<30} {elapsed * 1000:8.1f}ms")
+    print("=" * 60 + "\n")
+
+
+if __name__ == '__main__':
+    main()
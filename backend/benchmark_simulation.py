@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark PlayoffSimulator on a synthetic league.
+
+A season from benchmark_processing's seeded generator is processed, and its
+schedule is reshuffled with a plain Python loop (one random pairing per
+simulated week) and with the vectorized simulator at a few batch sizes, plus
+worker processes with --jobs. Each run reports simulations per second; the
+pooled run is checked to give the same odds as the serial one for its seed.
+
+Usage:
+    python benchmark_simulation.py
+    python benchmark_simulation.py --simulations 50000 --teams 12 --jobs 4
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import time
+
+import numpy as np
+
+from benchmark_processing import generate_league
+from data_processor import FantasyDataProcessor
+from playoff_simulator import BATCH_SIZE, PlayoffSimulator
+
+SEED = 2025
+
+
+def season_scores(teams):
+    """weeks x teams regular season scores of one synthetic season"""
+    processor = FantasyDataProcessor()
+    processor.raw_data = generate_league(1, teams)
+    with contextlib.redirect_stdout(io.StringIO()):
+        processor.process(['matchups'])
+    return FantasyDataProcessor.season_score_matrix(processor.processed_data['matchups'])['scores']
+
+
+def simulate_loop(scores, simulations, seed=SEED):
+    """Reference implementation: one Python-level shuffle per simulated week; returns mean wins"""
+    rng = random.Random(seed)
+    weeks, teams = scores.shape
+    rows = scores.tolist()
+    totals = [0.0] * teams
+    for _ in range(simulations):
+        for week in rows:
+            order = list(range(teams))
+            rng.shuffle(order)
+            for home, away in zip(order[::2], order[1::2]):
+                if week[home] > week[away]:
+                    totals[home] += 1
+                elif week[away] > week[home]:
+                    totals[away] += 1
+                else:
+                    totals[home] += 0.5
+                    totals[away] += 0.5
+    return [total / simulations for total in totals]
+
+
+def timed(run):
+    """(elapsed, result of run())"""
+    started = time.perf_counter()
+    result = run()
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Monte Carlo playoff odds on a synthetic season')
+    parser.add_argument('--simulations', type=int, default=20000, help='Simulated seasons per run (default: 20000)')
+    parser.add_argument('--teams', type=int, default=12, help='Teams in the season (default: 12)')
+    parser.add_argument('--loop-simulations', type=int, default=2000,
+                        help='Simulated seasons for the plain Python loop (default: 2000)')
+    parser.add_argument('--jobs', type=int, default=1, help='Also run batches in this many processes')
+    args = parser.parse_args()
+
+    scores = season_scores(args.teams)
+    print(f"Simulating a {scores.shape[0]}-week season of {args.teams} teams...")
+
+    runs = []
+    loop_elapsed, loop_wins = timed(lambda: simulate_loop(scores, args.loop_simulations))
+    runs.append(('python loop', args.loop_simulations, loop_elapsed))
+
+    results = {}
+    configs = [(f'numpy, batches of {size}', size, 1) for size in (500, BATCH_SIZE, 10000)]
+    if args.jobs > 1:
+        configs.append((f'numpy, batches of {BATCH_SIZE}, {args.jobs} jobs', BATCH_SIZE, args.jobs))
+    for label, batch_size, jobs in configs:
+        simulator = PlayoffSimulator(args.simulations, seed=SEED, batch_size=batch_size, jobs=jobs)
+        elapsed, results[label] = timed(lambda: simulator.run(scores))
+        runs.append((label, args.simulations, elapsed))
+
+    # The same seed and batch size give the same odds in any number of processes
+    serial = results[f'numpy, batches of {BATCH_SIZE}']
+    matches = None
+    if args.jobs > 1:
+        matches = all(np.array_equal(a, b) for a, b in zip(serial, results[configs[-1][0]]))
+    mean_wins = serial[1] / args.simulations
+    drift = max(abs(mean - loop) for mean, loop in zip(mean_wins, loop_wins))
+
+    baseline = args.loop_simulations / loop_elapsed
+    print("\n" + "=" * 64)
+    print("  PLAYOFF SIMULATION BENCHMARK")
+    print("=" * 64)
+    for label, simulations, elapsed in runs:
+        rate = simulations / elapsed
+        print(f"  {label:<36} {rate:>10,.0f} sims/s  ({rate / baseline:.0f}x)")
+    print("-" * 64)
+    if matches is not None:
+        print(f"  Pooled odds {'match' if matches else 'DIFFER FROM'} serial odds for seed {SEED}")
+    print(f"  Mean wins within {drift:.2f} of the Python loop")
+    print("=" * 64 + "\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Benchmark Sleeper extraction against a local HTTP stub of the Sleeper API.
+
+No network access is needed: a threaded HTTP server on localhost serves a
+synthetic league and sleeps for a fixed latency on every request. The same
+season is extracted with one-off connections, with a pooled keep-alive session,
+and with the pooled session fetching weeks concurrently, and the outputs are
+checked to be identical. Each run starts with an empty player cache; a final
+run shows the cost of loading the cached slim player index instead.
+
+Usage:
+    python benchmark_sleeper.py
+    python benchmark_sleeper.py --latency 0.05 --workers 8
+"""
+
+import argparse
+import json
+import random
+import re
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+import sleeper_extractor
+from request_scheduler import RequestScheduler
+from sleeper_extractor import SleeperExtractor
+
+LEAGUE_ID = 'stub'
+TEAM_COUNT = 12
+WEEKS = 17
+PLAYER_COUNT = 10000  # roughly the size of the real /players/nfl dump
+
+
+def build_league(seed=2025):
+    """Synthetic responses keyed by request path"""
+    rng = random.Random(seed)
+    users = [{'user_id': f'u{i}', 'display_name': f'owner{i}', 'metadata': {'team_name': f'Team {i}'}}
+             for i in range(1, TEAM_COUNT + 1)]
+    rosters = [{'roster_id': i, 'owner_id': f'u{i}',
+                'settings': {'wins': rng.randint(0, 14), 'losses': 0, 'ties': 0,
+                             'fpts': rng.randint(1200, 1800), 'fpts_against': rng.randint(1200, 1800)}}
+               for i in range(1, TEAM_COUNT + 1)]
+
+    base = f'/v1/league/{LEAGUE_ID}'
+    routes = {
+        base: {'name': 'Stub League', 'season': '2025', 'status': 'complete', 'settings': {'playoff_teams': 6}},
+        f'{base}/users': users,
+        f'{base}/rosters': rosters,
+        f'{base}/drafts': [{'draft_id': 'd1'}],
+        '/v1/draft/d1/picks': [
+            {'roster_id': i % TEAM_COUNT + 1, 'player_id': str(i), 'round': i // TEAM_COUNT + 1,
+             'draft_slot': i % TEAM_COUNT + 1, 'pick_no': i + 1, 'is_keeper': False,
+             'metadata': {'first_name': 'Player', 'last_name': str(i), 'amount': str(rng.randint(1, 60))}}
+            for i in range(TEAM_COUNT * 3)
+        ],
+        '/v1/players/nfl': {
+            str(i): {'position': rng.choice(['QB', 'RB', 'WR', 'TE']), 'first_name': 'Player', 'last_name': str(i),
+                     'full_name': f'Player {i}', 'team': 'FA', 'status': 'Active', 'age': rng.randint(21, 38),
+                     'fantasy_positions': ['QB'], 'injury_status': None, 'search_rank': i}
+            for i in range(PLAYER_COUNT)
+        },
+        f'{base}/winners_bracket': [
+            {'r': 3, 'm': 1, 'w': 1, 'l': 2, 'p': 1},
+            {'r': 3, 'm': 2, 'w': 3, 'l': 4, 'p': 3},
+        ],
+        f'{base}/losers_bracket': [],
+    }
+    for week in range(1, 19):
+        if week > WEEKS:
+            routes[f'{base}/matchups/{week}'] = []
+            continue
+        routes[f'{base}/matchups/{week}'] = [
+            {'roster_id': roster_id, 'matchup_id': (roster_id + 1) // 2, 'points': round(rng.uniform(60, 160), 2)}
+            for roster_id in range(1, TEAM_COUNT + 1)
+        ]
+    return routes
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves build_league() routes with keep-alive and a fixed latency"""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+    routes = {}
+    latency = 0.02
+    connections = 0
+    _lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with StubHandler._lock:
+            StubHandler.connections += 1
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        path = re.sub(r'\?.*$', '', self.path)
+        if path not in self.routes:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        body = json.dumps(self.routes[path]).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def use_player_cache(cache_dir):
+    """Point the Sleeper player dump and index cache at cache_dir"""
+    sleeper_extractor.PLAYERS_DUMP_PATH = cache_dir / 'players_nfl.json.gz'
+    sleeper_extractor.PLAYER_INDEX_PATH = cache_dir / 'players_index.json'
+
+
+def run_extraction(base_url, session, max_workers, player_cache):
+    """
+    Extract the stub season with the player cache in player_cache (a directory);
+    returns (elapsed, connections opened, season data)
+    """
+    use_player_cache(Path(player_cache))
+    extractor = SleeperExtractor(LEAGUE_ID, scheduler=RequestScheduler(rate=None, max_concurrency=max_workers),
+                                 session=session, max_workers=max_workers)
+    extractor.base_url = base_url
+    StubHandler.connections = 0
+    started = time.perf_counter()
+    data = extractor.extract_season_data(2025)
+    elapsed = time.perf_counter() - started
+    data.pop('extracted_at')
+    return elapsed, StubHandler.connections, data
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Sleeper extraction against a local HTTP stub')
+    parser.add_argument('--latency', type=float, default=0.02, help='Simulated seconds per request (default: 0.02)')
+    parser.add_argument('--workers', type=int, default=8, help='Concurrent requests for the pooled run (default: 8)')
+    args = parser.parse_args()
+
+    StubHandler.routes = build_league()
+    StubHandler.latency = args.latency
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_address[1]}/v1'
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_dir = Path(tmp_dir)
+            runs = [
+                ('one-off connections, serial', run_extraction(base_url, requests, 1, tmp_dir / 'a')),
+                ('pooled session, serial', run_extraction(base_url, None, 1, tmp_dir / 'b')),
+                (f'pooled session, {args.workers} workers', run_extraction(base_url, None, args.workers, tmp_dir / 'c')),
+                # Same cache as the previous run, so the player dump is not downloaded again
+                ('  + cached player index', run_extraction(base_url, None, args.workers, tmp_dir / 'c')),
+            ]
+    finally:
+        server.shutdown()
+
+    baseline_elapsed, _, baseline_data = runs[0][1]
+    print("\n" + "=" * 60)
+    print(f"  SLEEPER EXTRACTION BENCHMARK ({args.latency * 1000:.0f}ms latency)")
+    print("=" * 60)
+    for label, (elapsed, connections, data) in runs:
+        print(f"  {label:<32} {elapsed:6.2f}s  {connections:3d} connections  "
+              f"({baseline_elapsed / elapsed:.1f}x, {'matches' if data == baseline_data else 'DIFFERS'})")
+    print("=" * 60 + "\n")
+
+
+if __name__ == '__main__':
+    main()
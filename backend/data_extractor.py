@@ -7,11 +7,20 @@ and caches it locally for processing.
 
 import os
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+import requests
 from espn_api.football import League
+from espn_api.football.constant import POSITION_MAP
 from dotenv import load_dotenv
 
+from http_cache import install_espn_transport, season_closed_at
+from raw_storage import DEFAULT_FORMAT, load_season, save_season
+from request_scheduler import get_shared_scheduler
+
 # Load environment variables
 load_dotenv()
 
@@ -24,19 +33,64 @@ BASE_DIR = Path(__file__).parent.parent
 RAW_DATA_DIR = BASE_DIR / 'data' / 'raw'
 RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+# Matchup periods requested per raw schedule call in batch_views mode
+BATCH_MATCHUP_PERIODS = 6
+# espn_api's box_scores refuses earlier seasons, so batch_views only fetches from here on
+BOX_SCORE_FIRST_YEAR = 2019
+
 
 class ESPNDataExtractor:
     """Extracts and caches data from ESPN Fantasy Football API"""
 
-    def __init__(self, league_id=LEAGUE_ID, espn_s2=ESPN_S2, swid=ESPN_SWID):
+    def __init__(self, league_id=LEAGUE_ID, espn_s2=ESPN_S2, swid=ESPN_SWID, http_cache=None,
+                 scheduler=None, batch_views=False, raw_format=DEFAULT_FORMAT):
+        """
+        Args:
+            league_id: ESPN league ID
+            espn_s2: espn_s2 cookie (private leagues)
+            swid: SWID cookie (private leagues)
+            http_cache: Optional http_cache.ResponseCache that records or replays
+                every request espn_api makes
+            scheduler: request_scheduler.RequestScheduler that rate limits and
+                retries requests (defaults to the process-wide shared scheduler)
+            batch_views: If True, fetch matchups and lineups for several weeks per
+                request from ESPN's raw schedule views instead of one box_scores
+                call per week (falls back to box scores if the raw fetch fails).
+                Only seasons box_scores supports (BOX_SCORE_FIRST_YEAR on) are
+                batched, so both paths extract the same seasons.
+            raw_format: Storage format for season files: 'json', 'gzip' or 'zstd'
+
+        espn_api sends every request through one module-wide transport, so
+        constructing an extractor doesn't touch it: call install_transport()
+        once per process (main and run_pipeline do) to route espn_api's
+        requests through this extractor's cache and scheduler.
+        """
         self.league_id = league_id
         self.espn_s2 = espn_s2
         self.swid = swid
+        self.http_cache = http_cache
+        self.scheduler = scheduler or get_shared_scheduler()
+        self.batch_views = batch_views
+        self.raw_format = raw_format
+
+        # Cache hits are served before the scheduler, so they never use up a token
+        self.transport = self.scheduler.wrap(requests.get)
+        if http_cache:
+            self.transport = http_cache.wrap(self.transport)
+
+        # Per-league, per-week box score memo shared by the matchup and player loops
+        self._box_score_cache = {}
+        self._box_score_lock = threading.Lock()
+        self.box_score_stats = {'fetched': 0, 'saved': 0}
 
         if not espn_s2 or not swid:
             print("WARNING: ESPN_S2 and ESPN_SWID not set. Will only work for public leagues.")
             print("See COOKIE_INSTRUCTIONS.md for how to get these values.")
 
+    def install_transport(self):
+        """Route every request espn_api makes in this process through this extractor's cache and scheduler"""
+        install_espn_transport(self.transport)
+
     def get_league(self, year):
         """Get league object for a specific year"""
         try:
@@ -51,14 +105,275 @@ class ESPNDataExtractor:
             print(f"Error fetching league for {year}: {e}")
             return None
 
-    def extract_season_data(self, year):
-        """Extract all data for a specific season"""
+    def get_box_scores(self, league, week):
+        """
+        Get box scores for a week, fetching each (league, week) only once
+
+        Failed fetches are memoized too, so a week that errors in the matchup
+        loop is not requested again by the player performance loop.
+        """
+        with self._box_score_lock:
+            league_cache = self._box_score_cache.setdefault(league, {})
+            cached = league_cache.get(week)
+            if cached is not None:
+                self.box_score_stats['saved'] += 1
+
+        if cached is None:
+            try:
+                cached = (league.box_scores(week), None)
+            except Exception as e:
+                cached = (None, e)
+            with self._box_score_lock:
+                league_cache[week] = cached
+                self.box_score_stats['fetched'] += 1
+
+        box_scores, error = cached
+        if error is not None:
+            raise error
+        return box_scores
+
+    def clear_box_scores(self, league):
+        """Drop memoized box scores for a league once its season is extracted"""
+        with self._box_score_lock:
+            self._box_score_cache.pop(league, None)
+
+    @staticmethod
+    def _last_played_week(league):
+        """Latest scoring period ESPN has data for, or None if unknown"""
+        current_week = getattr(league, 'current_week', None)
+        return current_week or None
+
+    def get_regular_season_weeks(self, league):
+        """Regular season weeks that have started (ESPN returns the current week for future ones)"""
+        last_week = league.settings.reg_season_count
+        last_played = self._last_played_week(league)
+        if last_played:
+            last_week = min(last_week, last_played)
+        return range(1, last_week + 1)
+
+    def get_playoff_round_ends(self, league):
+        """
+        Last scoring period of every playoff round that has started, keyed by
+        the round's first scoring period (its week label)
+
+        Playoff rounds are the matchup periods after the regular season. Falls
+        back to the teams' schedule length when the settings carry no matchup
+        periods.
+        """
+        settings = league.settings
+        reg_season_count = settings.reg_season_count
+        matchup_periods = getattr(settings, 'matchup_periods', None) or {}
+
+        round_ends = {}
+        for period_id, scoring_periods in matchup_periods.items():
+            if int(period_id) > reg_season_count and scoring_periods:
+                round_ends[min(scoring_periods)] = max(scoring_periods)
+
+        if not matchup_periods:
+            schedule_length = max((len(getattr(team, 'schedule', [])) for team in league.teams), default=0)
+            round_length = getattr(settings, 'playoff_matchup_period_length', 1) or 1
+            playoff_rounds = max(schedule_length - reg_season_count, 0)
+            for i in range(playoff_rounds):
+                first_week = reg_season_count + 1 + i * round_length
+                round_ends[first_week] = first_week + round_length - 1
+
+        last_played = self._last_played_week(league)
+        return {week: round_ends[week] for week in sorted(round_ends) if not last_played or week <= last_played}
+
+    def get_playoff_weeks(self, league):
+        """
+        First scoring period of every playoff round that has started
+
+        A round can span several scoring periods and ESPN reports the round's
+        cumulative score for each of them, so only its first scoring period is
+        requested.
+        """
+        return list(self.get_playoff_round_ends(league))
+
+    def get_matchup_period_weeks(self, league):
+        """
+        Map each started single-week matchup period to (week label, is_playoff)
+
+        Regular season matchup periods are single weeks, and so are one-week
+        playoff rounds. A raw schedule view reports a multi-week round's
+        cumulative score and lineup rather than its first scoring period's,
+        like box_scores does, so those rounds are left out and fetched as box
+        scores.
+        """
+        reg_season_count = league.settings.reg_season_count
+        period_weeks = {week: (week, False) for week in self.get_regular_season_weeks(league)}
+
+        round_ends = self.get_playoff_round_ends(league)
+        for period_id, scoring_periods in (getattr(league.settings, 'matchup_periods', None) or {}).items():
+            period_id = int(period_id)
+            if period_id > reg_season_count and scoring_periods and len(scoring_periods) == 1 \
+                    and scoring_periods[0] in round_ends:
+                period_weeks[period_id] = (scoring_periods[0], True)
+
+        return period_weeks
+
+    def fetch_schedule_views(self, league, matchup_period_ids):
+        """Fetch raw schedule entries with box score lineups for several matchup periods at once"""
+        filters = {'schedule': {'filterMatchupPeriodIds': {'value': list(matchup_period_ids)}}}
+        headers = {'x-fantasy-filter': json.dumps(filters)}
+        params = {'view': ['mMatchupScore', 'mBoxscore']}
+        data = league.espn_request.league_get(params=params, headers=headers)
+        return data.get('schedule', [])
+
+    @staticmethod
+    def _raw_player_stat(entry, week, team):
+        """Build a player_stats record from a raw roster entry, mirroring espn_api's BoxPlayer"""
+        player = entry['playerPoolEntry']['player']
+
+        # Main position is the first non-flex eligible slot (D/ST names contain a slash)
+        name = player.get('fullName', '')
+        position = None
+        for slot_id in player.get('eligibleSlots', []):
+            slot = POSITION_MAP.get(slot_id, '/')
+            if (slot_id != 25 and '/' not in slot) or '/' in name:
+                position = slot
+                break
+
+        points = entry['playerPoolEntry'].get('appliedStatTotal', 0)
+        projected_points = 0
+        for stat in player.get('stats', []):
+            if stat.get('scoringPeriodId') != week:
+                continue
+            if stat.get('statSourceId') == 0:
+                points = stat.get('appliedTotal', points)
+            elif stat.get('statSourceId') == 1:
+                projected_points = stat.get('appliedTotal', 0)
+
+        return {
+            'week': week,
+            'team_id': team.team_id,
+            'team_name': team.team_name,
+            'player_name': name,
+            'player_id': player.get('id'),
+            'position': position,
+            'slot': POSITION_MAP.get(entry.get('lineupSlotId'), ''),
+            'points': round(points, 2),
+            'projected_points': round(projected_points, 2),
+        }
+
+    def extract_batched_weeks(self, league, skip_weeks=()):
+        """
+        Build matchups and player_stats for every started week from raw schedule
+        views, fetching BATCH_MATCHUP_PERIODS matchup periods per request
+
+        Returns (weeks, matchups, player_stats), or None if a request failed.
+        Player stats are only collected for the regular season, like the box
+        score path.
+        """
+        period_weeks = {period_id: label for period_id, label in self.get_matchup_period_weeks(league).items()
+                        if label[0] not in skip_weeks}
+        teams_by_id = {team.team_id: team for team in league.teams}
+        period_ids = sorted(period_weeks)
+
+        schedule = []
+        try:
+            for i in range(0, len(period_ids), BATCH_MATCHUP_PERIODS):
+                schedule.extend(self.fetch_schedule_views(league, period_ids[i:i + BATCH_MATCHUP_PERIODS]))
+        except Exception as e:
+            print(f"    Warning: Raw schedule fetch failed, falling back to box scores: {e}")
+            return None
+
+        matchups = []
+        player_stats = []
+        for item in sorted(schedule, key=lambda m: m.get('matchupPeriodId', 0)):
+            period_id = item.get('matchupPeriodId')
+            if period_id not in period_weeks or 'away' not in item or 'home' not in item:
+                continue  # Unrequested period or a bye
+            week, is_playoff = period_weeks[period_id]
+
+            sides = {}
+            for side in ('home', 'away'):
+                side_data = item[side]
+                score = side_data.get('totalPointsLive', side_data.get('totalPoints', 0))
+                sides[side] = (teams_by_id.get(side_data.get('teamId')), round(score, 2))
+            if not sides['home'][0] or not sides['away'][0]:
+                continue
+
+            matchups.append({
+                'week': week,
+                'is_playoff': is_playoff,
+                'home_team': sides['home'][0].team_name,
+                'home_team_id': sides['home'][0].team_id,
+                'home_score': sides['home'][1],
+                'away_team': sides['away'][0].team_name,
+                'away_team_id': sides['away'][0].team_id,
+                'away_score': sides['away'][1],
+            })
+
+            if not is_playoff:
+                for side in ('home', 'away'):
+                    roster = item[side].get('rosterForMatchupPeriod') or item[side].get('rosterForCurrentScoringPeriod') or {}
+                    for entry in roster.get('entries', []):
+                        player_stats.append(self._raw_player_stat(entry, week, sides[side][0]))
+
+        player_stats.sort(key=lambda p: p['week'])
+        weeks = {week for week, _ in period_weeks.values()}
+        print(f"    ✓ Fetched {len(weeks)} weeks in {-(-len(period_ids) // BATCH_MATCHUP_PERIODS)} raw requests")
+        return weeks, matchups, player_stats
+
+    @staticmethod
+    def is_season_complete(cached):
+        """True if a cached season was extracted after that season ended"""
+        extracted_at = cached.get('extracted_at')
+        if not extracted_at:
+            return False
+        return datetime.fromisoformat(extracted_at) >= season_closed_at(cached['year'])
+
+    def get_final_weeks(self, cached):
+        """
+        Weeks in a cached season whose results can no longer change
+
+        A week is final if it was already extracted and had finished by the time
+        of that extraction: its last scoring period is earlier than the cached
+        current_week, or the whole season was over. A playoff round is stored
+        under its first scoring period but ends at playoff_round_ends[week];
+        rounds from older caches without round ends are treated as live, as is
+        the latest extracted week of caches without current_week.
+        """
+        cached_weeks = {m['week'] for m in cached.get('matchups', [])}
+        cached_weeks |= {s['week'] for s in cached.get('player_stats', [])}
+        if not cached_weeks or self.is_season_complete(cached):
+            return cached_weeks
+
+        current_week = cached.get('current_week')
+        if current_week is None:
+            current_week = max(cached_weeks)
+
+        # JSON keys come back as strings
+        round_ends = {int(week): last_week for week, last_week in cached.get('playoff_round_ends', {}).items()}
+        playoff_weeks = {m['week'] for m in cached.get('matchups', []) if m.get('is_playoff')}
+        final_weeks = set()
+        for week in cached_weeks:
+            last_week = round_ends.get(week, None if week in playoff_weeks else week)
+            if last_week is not None and last_week < current_week:
+                final_weeks.add(week)
+        return final_weeks
+
+    def extract_season_data(self, year, cached=None):
+        """
+        Extract all data for a specific season
+
+        Args:
+            year: Season to extract
+            cached: Previously saved season data. When given, only weeks that
+                are missing or were still live at that extraction are fetched,
+                and final weeks are carried over from the cache.
+        """
         print(f"\nFetching data for {year} season...")
 
         league = self.get_league(year)
         if not league:
             return None
 
+        final_weeks = self.get_final_weeks(cached) if cached else set()
+        if final_weeks:
+            print(f"  Incremental: reusing {len(final_weeks)} final weeks from cache")
+
         season_data = {
             'year': year,
             'league_name': league.settings.name if hasattr(league.settings, 'name') else 'Unknown League',
@@ -68,6 +383,8 @@ class ESPNDataExtractor:
             'rosters': {},
             'player_stats': [],
             'settings': {},
+            'current_week': getattr(league, 'current_week', None),
+            'playoff_round_ends': self.get_playoff_round_ends(league),
             'extracted_at': datetime.now().isoformat()
         }
 
@@ -82,6 +399,14 @@ class ESPNDataExtractor:
         except Exception as e:
             print(f"  Warning: Could not extract some settings: {e}")
 
+        # Starting and bench slot -> count, for optimal lineups. Read on its own
+        # so a build without it keeps the settings above.
+        try:
+            slot_counts = getattr(league.settings, 'position_slot_counts', None) or {}
+            season_data['settings']['lineup_slot_counts'] = {slot: count for slot, count in slot_counts.items() if count}
+        except Exception as e:
+            print(f"  Warning: Could not extract lineup slot counts: {e}")
+
         # Extract teams
         print(f"  Extracting {len(league.teams)} teams...")
         for team in league.teams:
@@ -133,13 +458,26 @@ class ESPNDataExtractor:
 
             season_data['teams'].append(team_data)
 
+        # Weeks already covered (from the cache or a batched raw fetch) are skipped below
+        skip_weeks = set(final_weeks)
+        if self.batch_views and year >= BOX_SCORE_FIRST_YEAR:
+            print(f"  Fetching matchups and lineups from raw schedule views...")
+            batched = self.extract_batched_weeks(league, skip_weeks=final_weeks)
+            if batched:
+                weeks, matchups, player_stats = batched
+                season_data['matchups'].extend(matchups)
+                season_data['player_stats'].extend(player_stats)
+                skip_weeks |= weeks
+
         # Extract matchups for all weeks
         print(f"  Extracting matchups...")
         try:
             # Get regular season weeks
-            for week in range(1, league.settings.reg_season_count + 1):
+            for week in self.get_regular_season_weeks(league):
+                if week in skip_weeks:
+                    continue
                 try:
-                    box_scores = league.box_scores(week)
+                    box_scores = self.get_box_scores(league, week)
                     for matchup in box_scores:
                         matchup_data = {
                             'week': week,
@@ -155,13 +493,12 @@ class ESPNDataExtractor:
                 except Exception as e:
                     print(f"    Warning: Could not get matchups for week {week}: {e}")
 
-            # Get playoff weeks if they exist
-            playoff_start = league.settings.reg_season_count + 1
-            total_weeks = playoff_start + 3  # Usually 2-3 playoff weeks
-
-            for week in range(playoff_start, total_weeks + 1):
+            # Get playoff weeks that have been played, one request per playoff round
+            for week in self.get_playoff_weeks(league):
+                if week in skip_weeks:
+                    continue
                 try:
-                    box_scores = league.box_scores(week)
+                    box_scores = self.get_box_scores(league, week)
                     if box_scores:  # Only add if there are matchups
                         for matchup in box_scores:
                             matchup_data = {
@@ -175,33 +512,16 @@ class ESPNDataExtractor:
                                 'away_score': matchup.away_score,
                             }
                             season_data['matchups'].append(matchup_data)
-                except:
-                    # Silently skip weeks with no data (playoffs may not exist yet)
-                    pass
+                except Exception as e:
+                    print(f"    Warning: Could not get playoff matchups for week {week}: {e}")
 
         except Exception as e:
             print(f"  Warning: Error extracting matchups: {e}")
 
-        # Deduplicate playoff matchups (ESPN API bug causes week 17-18 duplicates)
-        print(f"  Deduplicating matchups...")
-        original_count = len(season_data['matchups'])
-        seen_matchups = set()
-        deduplicated_matchups = []
-
-        for matchup in season_data['matchups']:
-            # Create a unique key for each matchup
-            teams = tuple(sorted([matchup['home_team_id'], matchup['away_team_id']]))
-            scores = tuple(sorted([matchup['home_score'], matchup['away_score']]))
-            key = (teams, scores, matchup.get('is_playoff', False))
-
-            if key not in seen_matchups:
-                seen_matchups.add(key)
-                deduplicated_matchups.append(matchup)
-
-        season_data['matchups'] = deduplicated_matchups
-        removed = original_count - len(deduplicated_matchups)
-        if removed > 0:
-            print(f"    ✓ Removed {removed} duplicate matchups")
+        # Carry over final weeks from the cache, keeping matchups in week order
+        if final_weeks:
+            reused = [m for m in cached.get('matchups', []) if m['week'] in final_weeks]
+            season_data['matchups'] = sorted(reused + season_data['matchups'], key=lambda m: m['week'])
 
         # Extract draft data
         print(f"  Extracting draft data...")
@@ -252,9 +572,11 @@ class ESPNDataExtractor:
         # Extract weekly player performance from box scores
         print(f"  Extracting player performance data...")
         try:
-            for week in range(1, league.settings.reg_season_count + 1):
+            for week in self.get_regular_season_weeks(league):
+                if week in skip_weeks:
+                    continue
                 try:
-                    box_scores = league.box_scores(week)
+                    box_scores = self.get_box_scores(league, week)
                     for matchup in box_scores:
                         # Home team lineup
                         for player in matchup.home_lineup:
@@ -286,38 +608,69 @@ class ESPNDataExtractor:
                             }
                             season_data['player_stats'].append(player_stat)
                 except Exception as e:
-                    # Skip weeks with no data
-                    pass
+                    # Box score failures are memoized, so this never refetches a failed week
+                    print(f"    Warning: Skipping player stats for week {week}: {e}")
+
+            if final_weeks:
+                reused = [p for p in cached.get('player_stats', []) if p['week'] in final_weeks]
+                season_data['player_stats'] = sorted(reused + season_data['player_stats'], key=lambda p: p['week'])
             print(f"    ✓ Extracted {len(season_data['player_stats'])} player performances")
         except Exception as e:
             print(f"    Warning: Error extracting player stats: {e}")
 
+        self.clear_box_scores(league)
+
         print(f"  ✓ Extracted {len(season_data['teams'])} teams, {len(season_data['matchups'])} matchups, {len(season_data['draft'])} draft picks")
 
         return season_data
 
     def save_season_data(self, year, data):
-        """Save season data to JSON file"""
+        """Save season data in the configured raw format (see raw_storage)"""
         if not data:
             print(f"No data to save for {year}")
             return
 
-        output_file = RAW_DATA_DIR / f'season_{year}.json'
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        output_file = save_season(year, data, fmt=self.raw_format, raw_dir=RAW_DATA_DIR)
 
         print(f"✓ Saved data to {output_file}")
 
     def load_season_data(self, year):
-        """Load cached season data from JSON file"""
-        input_file = RAW_DATA_DIR / f'season_{year}.json'
-        if not input_file.exists():
-            return None
+        """Load cached season data from whichever raw format exists"""
+        return load_season(year, raw_dir=RAW_DATA_DIR)
+
+    def _extract_year(self, year, force_refresh=False, incremental=False):
+        """Extract and save a single season, returning True on success"""
+        cached = None if force_refresh else self.load_season_data(year)
+
+        # Check if already cached
+        if cached and not incremental:
+            print(f"\n{year}: Data already cached (use force_refresh=True to re-fetch)")
+            return True
+        if cached and self.is_season_complete(cached):
+            print(f"\n{year}: Season complete and cached")
+            return True
+
+        # Fetch and save
+        try:
+            data = self.extract_season_data(year, cached=cached)
+        except Exception as e:
+            print(f"\n{year}: Extraction failed: {e}")
+            return False
 
-        with open(input_file, 'r') as f:
-            return json.load(f)
+        if not data:
+            return False
+
+        self.save_season_data(year, data)
+        return True
 
-    def extract_all_seasons(self, start_year=None, end_year=None, force_refresh=False):
+    def _timed_extract_year(self, year, force_refresh=False, incremental=False):
+        """Run _extract_year and return (success, elapsed seconds)"""
+        started = time.perf_counter()
+        ok = self._extract_year(year, force_refresh, incremental)
+        return ok, time.perf_counter() - started
+
+    def extract_all_seasons(self, start_year=None, end_year=None, force_refresh=False, workers=1,
+                            incremental=False):
         """
         Extract data for all seasons
 
@@ -325,39 +678,58 @@ class ESPNDataExtractor:
             start_year: First year to extract (defaults to 2007 - Valley Natives league start)
             end_year: Last year to extract (defaults to current year)
             force_refresh: If True, re-fetch even if cached data exists
+            workers: Number of seasons to extract in parallel (1 = one at a time)
+            incremental: If True, skip completed cached seasons and only fetch
+                missing or live weeks of in-progress ones (ignored with force_refresh)
         """
         current_year = datetime.now().year
         start_year = start_year or 2007
         end_year = end_year or current_year
+        workers = max(1, workers or 1)
+        years = list(range(start_year, end_year + 1))
 
         print(f"=== ESPN Fantasy Football Data Extraction ===")
         print(f"League ID: {self.league_id}")
         print(f"Years: {start_year} - {end_year}")
+        if workers > 1:
+            print(f"Workers: {workers}")
         print(f"=" * 46)
 
-        successful = []
-        failed = []
-
-        for year in range(start_year, end_year + 1):
-            # Check if already cached
-            if not force_refresh and self.load_season_data(year):
-                print(f"\n{year}: Data already cached (use force_refresh=True to re-fetch)")
-                successful.append(year)
-                continue
-
-            # Fetch and save
-            data = self.extract_season_data(year)
-            if data:
-                self.save_season_data(year, data)
-                successful.append(year)
-            else:
-                failed.append(year)
+        results = {}
+
+        if workers == 1:
+            for year in years:
+                results[year] = self._extract_year(year, force_refresh, incremental)
+        else:
+            # Each season gets its own League object, so seasons can be fetched
+            # independently; a failure in one year never affects the others.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {}
+                for year in years:
+                    futures[executor.submit(self._timed_extract_year, year, force_refresh, incremental)] = year
+
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    year = futures[future]
+                    ok, elapsed = future.result()
+                    results[year] = ok
+                    status = '✓' if ok else '✗'
+                    print(f"  [{completed}/{len(years)}] {status} {year} finished in {elapsed:.1f}s")
+
+        # Report in year order regardless of completion order
+        successful = [year for year in years if results[year]]
+        failed = [year for year in years if not results[year]]
 
         print(f"\n{'=' * 46}")
         print(f"Extraction Complete!")
         print(f"  Successful: {len(successful)} seasons")
         if failed:
             print(f"  Failed: {len(failed)} seasons - {failed}")
+        if self.box_score_stats['fetched']:
+            print(f"  Box score requests: {self.box_score_stats['fetched']} "
+                  f"({self.box_score_stats['saved']} saved by cache)")
+        print(f"  {self.scheduler.report()}")
+        if self.http_cache:
+            print(f"  {self.http_cache.report()}")
         print(f"{'=' * 46}\n")
 
         return successful, failed
@@ -366,6 +738,7 @@ class ESPNDataExtractor:
 def main():
     """Main entry point for data extraction"""
     extractor = ESPNDataExtractor()
+    extractor.install_transport()
 
     # Extract all available years from league start (2007) to current year
     extractor.extract_all_seasons()
@@ -4,52 +4,380 @@ Data Processor for ESPN Fantasy Football
 Transforms raw ESPN API data into structured formats for analysis and visualization.
 """
 
+import gc
+import hashlib
+import heapq
 import json
+import math
+import operator
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
+from itertools import product
+
+import numpy as np
+
+from head_to_head import HeadToHead
+from owner_aliases import OWNER_NAME_MAPPING, USERNAME_MAPPING
+from raw_storage import available_years, load_season, season_hash
 
 BASE_DIR = Path(__file__).parent.parent
 RAW_DATA_DIR = BASE_DIR / 'data' / 'raw'
 PROCESSED_DATA_DIR = BASE_DIR / 'data' / 'processed'
 PROCESSED_DATA_DIR.mkdir(parents=True, exist_ok=True)
+PARTIALS_DIR = PROCESSED_DATA_DIR / 'partials'
+
+# Bump whenever a SEASON_STAGES method's output changes so saved partials are rebuilt
+PARTIAL_VERSION = 14
+
+# Records kept as the best single entry across all seasons: name -> (field, max/min)
+MATCHUP_RECORD_FIELDS = {
+    'highest_score': ('score', max),
+    'lowest_score': ('score', min),
+    'highest_scoring_loss': ('score', max),
+    'most_combined_points': ('combined_points', max),
+    'lowest_scoring_win': ('score', min),
+}
+# Season records over standings; the min ones only count full seasons
+SEASON_RECORD_FIELDS = {
+    'most_points_season': ('points_for', max),
+    'most_wins_season': ('wins', max),
+    'most_points_against_season': ('points_against', max),
+    'fewest_wins_season': ('wins', min),
+    'fewest_points_season': ('points_for', min),
+}
+# Every record in output order, with whether a larger or smaller value wins.
+# A season's best entry only replaces the running one when strictly better,
+# so the first entry wins ties, like max()/min() over all seasons at once.
+RECORD_DIRECTIONS = {
+    'highest_score': max,
+    'lowest_score': min,
+    'biggest_blowout': max,
+    'closest_game': min,
+    'most_points_season': max,
+    'most_wins_season': max,
+    'most_points_against_season': max,
+    'fewest_wins_season': min,
+    'fewest_points_season': min,
+    'longest_win_streak': max,  # from the streak leaderboards
+    'longest_loss_streak': max,
+    'highest_scoring_loss': max,
+    'most_combined_points': max,
+    'lowest_scoring_win': min,
+    'best_team_worst_result': max,  # from the champion leaderboards
+    'worst_team_best_result': max,
+    'best_champion': max,
+    'unluckiest_reg_season_winner': max,
+}
 
-# Owner display name to actual name mapping
-OWNER_NAME_MAPPING = {
-    'scson': 'Chris Vitale',
-    'Kcoff07': 'Kellen Coffis',
-    'Jamie Coffis': 'Jamie Coffis',
-    'touchcoffis86': 'Jamie Coffis',  # Old username (2010-2019)
-    'gchildnl': 'Garrett Ulrich',
-    'gswens83': 'Greg Swenson',
-    'JeremySettles13': 'Jeremy Settles',
-    '2muchdutch': 'Nick Smielak',
-    'RapmasterRordogg': 'Rory McKee',
-    'jmluna5020': 'Jacob Luna',
-    '17whitaker': 'Bryan Whitaker',
-    'brom66': 'Brendan Romele',
-    'Brendan Romale': 'Brendan Romele',  # Fix typo in raw data
-    'Ryan Milhous': 'Ryan Milhous',
-    'kweezy31': 'Kyle Morris',  # 2010-2019
-    'HIS TIGHTNESS': 'Ben Beck',
-    'kpop027': 'Kyle Poppen',
-    'Benbasketball101': 'Ben Beck',  # Alternative username for Ben Beck
-    'bvitale1313': 'Brian Vitale',  # 2010-2014
-    'bryanvitale': 'Brian Vitale',  # 2017
-    '12inchnick': 'Nick Smielak',  # 2010-2012
-    'TPUSNESS': 'Tyler Fullerton',  # 2010-2014
-    'pkentstoll': 'Peter Kent-Stoll',
-    'DylanAndr3ws': 'Dylan Andrews',
-    'SLVBaller3189': 'Tanner Clark',
-    'ilovebammer24': 'Tanner Clark'
+# Lineup slots that hold no starter
+BENCH_SLOTS = ('BE', 'Bench', 'IR')
+# Positions each flex starting slot accepts (ESPN names, plus Sleeper's);
+# any other starting slot only takes players of its own position
+FLEX_SLOT_POSITIONS = {
+    'RB/WR/TE': ('RB', 'WR', 'TE'),
+    'FLEX': ('RB', 'WR', 'TE'),
+    'RB/WR': ('RB', 'WR'),
+    'WRRB_FLEX': ('RB', 'WR'),
+    'WR/TE': ('WR', 'TE'),
+    'REC_FLEX': ('WR', 'TE'),
+    'OP': ('QB', 'RB', 'WR', 'TE'),  # superflex (2-QB era)
+    'SUPER_FLEX': ('QB', 'RB', 'WR', 'TE'),
+    'DL': ('DT', 'DE', 'DL'),
+    'DB': ('CB', 'S', 'DB'),
+    'DP': ('DT', 'DE', 'LB', 'DL', 'CB', 'S', 'DB'),
+}
+# Most shape x position-class-group checks _lineup_shapes runs for one group
+# of slots (bounds memory); larger groups are filled greedily instead
+MAX_LINEUP_CHECKS = 4_000_000
+
+# All-play and luck fields of a team-season (calculate_luck) carried into the
+# owners output, per season and summed all-time
+LUCK_FIELDS = ('all_play_wins', 'all_play_losses', 'all_play_ties', 'expected_wins', 'luck')
+
+# Entries kept at each end of every leaderboard (top and bottom)
+LEADERBOARD_SIZE = 10
+
+# Single-game leaderboards; the top entry of each list is the matching record
+MATCHUP_LEADERBOARDS = {
+    'score': ('highest_score', 'lowest_score'),
+    'combined_points': ('most_combined_points', None),
+    'point_differential': ('biggest_blowout', 'closest_game'),
+    'losing_score': ('highest_scoring_loss', None),
+    'winning_score': (None, 'lowest_scoring_win'),
 }
+# Season leaderboards over standings; bottom lists only rank full seasons
+SEASON_LEADERBOARDS = {
+    'season_points_for': ('points_for', 'most_points_season', 'fewest_points_season'),
+    'season_wins': ('wins', 'most_wins_season', 'fewest_wins_season'),
+    'season_points_against': ('points_against', 'most_points_against_season', None),
+}
+# Records that weigh a season's results against its points ranks; each has a
+# top leaderboard of the same name whose first entry is the record
+CHAMPION_LEADERBOARDS = ('best_team_worst_result', 'worst_team_best_result', 'best_champion',
+                         'unluckiest_reg_season_winner')
+
+
+class Leaderboard:
+    """
+    The `size` best values of a stream, kept in a bounded heap
+
+    Entries added first win ties, like max()/min() over the same stream, so
+    the first ranked entry is the one max()/min() would pick.
+    """
+
+    def __init__(self, size=LEADERBOARD_SIZE, largest=True):
+        self.size = size
+        self.sign = 1 if largest else -1
+        self._heap = []  # (signed value, -arrival, value, entry) with the worst kept entry first
+        self._added = 0
+
+    def add(self, value, entry):
+        self._added += 1
+        key = self.sign * value
+        if len(self._heap) < self.size:
+            heapq.heappush(self._heap, (key, -self._added, value, entry))
+        elif self._heap and key > self._heap[0][0]:  # an equal value arrived later, so it loses
+            heapq.heapreplace(self._heap, (key, -self._added, value, entry))
+
+    def ranked(self):
+        """Kept entries, best first"""
+        return [entry for _, _, _, entry in sorted(self._heap, reverse=True)]
+
+    def in_arrival_order(self):
+        """Kept [value, entry] pairs in the order they were added, for merging later"""
+        return [[value, entry] for _, _, value, entry in sorted(self._heap, key=lambda item: -item[1])]
+
+# Staged pipeline in run order: stage -> (inputs, outputs). Inputs are
+# processed_data components, raw season sections ('raw:<section>') or settings
+# ('owner_names' for the owner name mappings, 'leaderboard_size'); process() reruns
+# a stage only when the hash of its inputs changed since it last ran.
+STAGES = {
+    'process_teams': (('raw:teams', 'owner_names'), ('teams',)),
+    'process_matchups': (('raw:matchups',), ('matchups',)),
+    'calculate_luck': (('matchups', 'raw:teams', 'owner_names'), ('luck',)),
+    'process_owners': (('raw:teams', 'owner_names', 'luck'), ('owners',)),
+    'process_standings': (('raw:teams', 'owner_names'), ('standings',)),
+    'process_playoffs': (('raw:teams', 'raw:settings', 'owner_names'), ('playoffs',)),
+    'process_head_to_head': (('matchups', 'raw:teams', 'owner_names'), ('head_to_head', 'head_to_head_matrix')),
+    'calculate_records': (('matchups', 'standings', 'raw:teams', 'owner_names', 'leaderboard_size'),
+                          ('records', 'leaderboards')),
+    'process_draft': (('raw:draft', 'raw:teams', 'owner_names'), ('draft',)),
+    'process_rosters': (('raw:rosters', 'raw:teams', 'owner_names'), ('rosters',)),
+    'process_player_stats': (('raw:player_stats', 'raw:settings', 'raw:teams', 'owner_names'),
+                             ('player_stats', 'optimal_lineups')),
+    'enrich_draft_with_positions': (('draft', 'player_stats'), ('draft',)),  # Add positions to draft picks
+    'calculate_best_draft_picks': (('draft', 'player_stats'), ('best_draft_picks', 'worst_draft_picks')),
+    'add_metadata': (('raw:league_name', 'teams', 'owners', 'matchups'), ('metadata',)),
+}
+# Every stage is split into a per-season method and a merge: stage -> method
+# returning one season's part from (year, season_data, parts), where
+# season_data holds the raw sections the stage reads and parts maps each
+# component input to that season's part of the stage that produced it. A
+# part is the season's share of the stage's outputs (rows, running totals,
+# head-to-head cells, streak runs, record and leaderboard candidates), and
+# the stage method merges the parts of every season into processed_data.
+# Parts are cached per season (see _season_parts), saved for incremental
+# runs and computed in worker processes.
+SEASON_STAGES = {
+    'process_teams': '_season_teams',
+    'process_matchups': '_season_matchups',
+    'calculate_luck': '_season_luck',
+    'process_owners': '_season_owner_rows',
+    'process_standings': '_season_standings',
+    'process_playoffs': '_season_playoffs',
+    'process_head_to_head': '_season_head_to_head',
+    'calculate_records': '_season_records',
+    'process_draft': '_season_draft',
+    'process_rosters': '_season_rosters',
+    'process_player_stats': '_season_player_stats',
+    'enrich_draft_with_positions': '_season_enriched_draft',
+    'calculate_best_draft_picks': '_season_draft_values',
+    'add_metadata': '_season_metadata',
+}
+
+
+def _stage_producers():
+    """stage -> {component input: the earlier stage whose output it is}"""
+    producers = {}
+    latest = {}
+    for stage, (inputs, outputs) in STAGES.items():
+        producers[stage] = {name: latest[name] for name in inputs if name in latest}
+        latest.update(dict.fromkeys(outputs, stage))
+    return producers
+
+
+STAGE_PRODUCERS = _stage_producers()
+# Raw season sections some stage reads
+RAW_SECTIONS = tuple(dict.fromkeys(name[len('raw:'):] for inputs, _ in STAGES.values()
+                                   for name in inputs if name.startswith('raw:')))
+
+# Fields of a processed player_stats record, in saved order: the extractor's
+# fields, then the season and the owner
+PLAYER_STAT_FIELDS = ('week', 'team_id', 'team_name', 'player_name', 'player_id', 'position', 'slot',
+                      'points', 'projected_points', 'year', 'owner')
+_RAW_STAT_FIELDS = PLAYER_STAT_FIELDS[:-2]
+_RAW_STAT_KEYS = frozenset(_RAW_STAT_FIELDS)
+_PLAYER_STAT_KEYS = frozenset(PLAYER_STAT_FIELDS)
+_raw_stat_values = operator.itemgetter(*_RAW_STAT_FIELDS)
+
+
+class PlayerStat:
+    """
+    One player-week of processed_data['player_stats']
+
+    Held in slots with shared (interned) strings rather than as a dict, which
+    takes about a quarter of the memory; records only become dicts when saved
+    (to_dict). Keys outside PLAYER_STAT_FIELDS ride along in `extra`, and
+    `owner` is left out of the dict when the team has no known owner.
+    """
+
+    __slots__ = PLAYER_STAT_FIELDS + ('extra',)
+
+    def __init__(self, week, team_id, team_name, player_name, player_id, position, slot, points,
+                 projected_points, year, owner=None, extra=None):
+        # Names, positions and slots repeat every week, so share one copy of each
+        intern = sys.intern
+        self.week = week
+        self.team_id = team_id
+        self.team_name = intern(team_name) if type(team_name) is str else team_name
+        self.player_name = intern(player_name) if type(player_name) is str else player_name
+        self.player_id = player_id
+        self.position = intern(position) if type(position) is str else position
+        self.slot = intern(slot) if type(slot) is str else slot
+        self.points = points
+        self.projected_points = projected_points
+        self.year = year
+        self.owner = intern(owner) if type(owner) is str else owner
+        self.extra = extra
+
+    @staticmethod
+    def row(stat, year, owner=None):
+        """A stat dict as a JSON-friendly list of constructor arguments"""
+        if stat.keys() == _RAW_STAT_KEYS:  # the extractor's records
+            return [*_raw_stat_values(stat), year, owner, None]
+
+        extra = {key: value for key, value in stat.items() if key not in _PLAYER_STAT_KEYS} or None
+        return [*(stat.get(field) for field in _RAW_STAT_FIELDS), year, owner, extra]
+
+    @classmethod
+    def from_dict(cls, stat):
+        """Record for a saved player_stats entry"""
+        return cls(*cls.row(stat, stat.get('year'), stat.get('owner')))
+
+    def to_row(self):
+        return [self.week, self.team_id, self.team_name, self.player_name, self.player_id, self.position,
+                self.slot, self.points, self.projected_points, self.year, self.owner, self.extra]
+
+    def __reduce__(self):
+        # Pickle as a row of field values, restored without __init__ so saved
+        # partials and worker results load fast: strings repeated within one
+        # pickle already come back as a single shared object
+        return _restore_player_stat, tuple(self.to_row())
+
+    def to_dict(self):
+        stat = {
+            'week': self.week,
+            'team_id': self.team_id,
+            'team_name': self.team_name,
+            'player_name': self.player_name,
+            'player_id': self.player_id,
+            'position': self.position,
+            'slot': self.slot,
+            'points': self.points,
+            'projected_points': self.projected_points,
+        }
+        if self.extra:
+            stat.update(self.extra)
+        stat['year'] = self.year
+        if self.owner is not None:
+            stat['owner'] = self.owner
+        return stat
+
+    def __eq__(self, other):
+        if not isinstance(other, PlayerStat):
+            return NotImplemented
+        return self.to_row() == other.to_row()
+
+    def __repr__(self):
+        return f"PlayerStat({self.to_dict()!r})"
+
+
+def _restore_player_stat(*row):
+    """PlayerStat from its pickled row (see PlayerStat.__reduce__)"""
+    stat = PlayerStat.__new__(PlayerStat)
+    (stat.week, stat.team_id, stat.team_name, stat.player_name, stat.player_id, stat.position, stat.slot,
+     stat.points, stat.projected_points, stat.year, stat.owner, stat.extra) = row
+    return stat
+
+
+def _content_hash(value):
+    """SHA-256 of a value's pickle; equal pickles mean equal content"""
+    return hashlib.sha256(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+
+
+def _json_default(value):
+    """json.dump fallback that turns records into dicts one at a time as they are written"""
+    if isinstance(value, PlayerStat):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _owner_aliases_json():
+    """Every owner name mapping as one JSON string, for cache keys"""
+    return json.dumps([USERNAME_MAPPING, OWNER_NAME_MAPPING], sort_keys=True)
+
+
+class OwnerIdentity:
+    """
+    Dense integer ids for owners
+
+    Owners are numbered in the order they first appear (season by season, in
+    team order), so aggregations can key on small ints and decode names only
+    when building output.
+    """
+
+    def __init__(self):
+        self.owner_names = []  # owner id -> normalized name
+        self.owner_ids = {}  # normalized name -> owner id
+
+    def owner_id(self, name):
+        """Id of a normalized owner name, assigned on first sight"""
+        owner_id = self.owner_ids.get(name)
+        if owner_id is None:
+            owner_id = self.owner_ids[name] = len(self.owner_names)
+            self.owner_names.append(name)
+        return owner_id
 
 
 class FantasyDataProcessor:
     """Process raw ESPN Fantasy Football data into structured formats"""
 
-    def __init__(self):
+    def __init__(self, leaderboard_size=LEADERBOARD_SIZE):
+        """
+        Args:
+            leaderboard_size: Entries kept at each end of every leaderboard (at least 1)
+        """
         self.raw_data = {}
+        self._season_years = None  # seasons to process when not all are loaded (see process_incremental)
+        self._file_section_hashes = {}  # year -> section hashes saved with partials of an unchanged raw file
+        self.leaderboard_size = max(1, leaderboard_size)
+        self._season_owners = {}  # year -> owner lookups (see season_owners)
+        self._season_owners_key = None  # raw teams and owner mapping the lookups were built from
+        self._stage_cache = {}  # stage -> (input hash, outputs) of its last merge (see process)
+        self._season_cache = {}  # (stage, year) -> (input hash, part) (see _season_parts)
+        self._section_hashes = None  # (year, section) -> hash of a raw section during process()
+        self._part_keys = None  # (stage, year) -> input hash of a part during process()
+        self._setting_values = None  # _settings() during process()
+        self._jobs = 1  # worker processes for per-season work during process()
+        self._pool = None  # their ProcessPoolExecutor, started on first use
+        self.changed_seasons = set()  # seasons whose per-season work the last process() redid
         self.processed_data = {
             'teams': {},
             'owners': {},
@@ -57,7 +385,10 @@ class FantasyDataProcessor:
             'standings': [],
             'playoffs': [],
             'head_to_head': {},
+            'head_to_head_matrix': {},
+            'luck': [],
             'records': {},
+            'leaderboards': {},
             'draft': [],
             'rosters': [],
             'player_stats': [],
@@ -75,29 +406,75 @@ class FantasyDataProcessor:
             display_name: The ESPN username/display name
             year: Optional year for year-specific mappings
         """
-        return OWNER_NAME_MAPPING.get(display_name, display_name)
+        # Sleeper usernames go through the Sleeper mapping first, so either
+        # source's name for an owner ends at the same actual name
+        name = USERNAME_MAPPING.get(display_name, display_name)
+        return OWNER_NAME_MAPPING.get(name, name)
+
+    def season_owners(self, year, season_data=None):
+        """
+        Owner lookups for one season, built once and shared by every stage
+
+        Args:
+            year: Season year
+            season_data: The season's raw data (defaults to the loaded season)
+
+        Returns:
+            dict with 'owners' (normalized owner of each team, in team order),
+            'by_team_id' (team_id -> owner, first team wins on duplicate ids) and
+            'by_name' (team_name -> owner, last team wins on duplicate names)
+        """
+        index = self._season_owners.get(year)
+        if index is None:
+            teams = (season_data if season_data is not None else self._season_data(year)).get('teams', [])
+            owners = [self.normalize_owner_name(team['owner'], year) for team in teams]
+            by_team_id = {}
+            for team, owner in zip(teams, owners):
+                by_team_id.setdefault(team['team_id'], owner)
+            index = {
+                'owners': owners,
+                'by_team_id': by_team_id,
+                'by_name': {team['team_name']: owner for team, owner in zip(teams, owners)},
+            }
+            self._season_owners[year] = index
+        return index
+
+    @staticmethod
+    def _team_owner(owners, team_id, team_name):
+        """
+        Owner of a team in a season's owner lookups (season_owners), joined on
+        team id since team names can repeat. A team id the season doesn't have
+        falls back to the team name, and a team the season doesn't know at all
+        counts as its own owner.
+        """
+        owner = owners['by_team_id'].get(team_id)
+        if owner is None:
+            owner = owners['by_name'].get(team_name, team_name)
+        return owner
 
     def load_raw_data(self, years=None):
-        """Load raw data for specified years"""
+        """Load raw data for specified years (any raw storage format)"""
         if years is None:
             # Load all available years
-            json_files = sorted(RAW_DATA_DIR.glob('season_*.json'))
-            years = [int(f.stem.split('_')[1]) for f in json_files]
+            years = available_years(RAW_DATA_DIR)
 
         for year in years:
-            file_path = RAW_DATA_DIR / f'season_{year}.json'
-            if file_path.exists():
-                with open(file_path, 'r') as f:
-                    self.raw_data[year] = json.load(f)
+            season_data = load_season(year, raw_dir=RAW_DATA_DIR)
+            if season_data is not None:
+                self.raw_data[year] = season_data
+                self._season_owners.pop(year, None)
+                self._file_section_hashes.pop(year, None)
+                if self._season_years is not None and year not in self._season_years:
+                    self._season_years.append(year)
                 print(f"Loaded data for {year}")
             else:
                 print(f"Warning: No data found for {year}")
 
         return len(self.raw_data)
 
-    def process_teams(self):
-        """Process team information across all seasons"""
-        teams_by_id = defaultdict(lambda: {
+    @staticmethod
+    def _new_team_totals():
+        return {
             'team_names': set(),
             'owners': set(),
             'seasons': [],
@@ -108,78 +485,95 @@ class FantasyDataProcessor:
             'playoff_appearances': 0,
             'total_points_for': 0,
             'total_points_against': 0
-        })
-
-        for year, season_data in self.raw_data.items():
-            for team in season_data.get('teams', []):
-                team_id = team['team_id']
-                team_info = teams_by_id[team_id]
+        }
 
-                # Normalize owner name
-                normalized_owner = self.normalize_owner_name(team['owner'], year)
+    @staticmethod
+    def _team_season(year, team, owner):
+        """One season of a team, as listed in its seasons"""
+        return {
+            'year': year,
+            'team_name': team['team_name'],
+            'owner': owner,
+            'wins': team['wins'],
+            'losses': team['losses'],
+            'ties': team['ties'],
+            'points_for': team['points_for'],
+            'points_against': team['points_against'],
+            'standing': team['standing'],
+            'final_standing': team['final_standing'],
+            'playoff_seed': team.get('playoff_seed')
+        }
 
-                # Track names and owners (teams may change)
-                team_info['team_names'].add(team['team_name'])
-                team_info['owners'].add(normalized_owner)
+    @staticmethod
+    def _add_team_season(team_info, season):
+        """Fold one season of a team (_team_season) into its running totals"""
+        # Track names and owners (teams may change)
+        team_info['team_names'].add(season['team_name'])
+        team_info['owners'].add(season['owner'])
+
+        # Add season stats
+        team_info['seasons'].append(season)
+
+        # Aggregate stats
+        team_info['total_wins'] += season['wins']
+        team_info['total_losses'] += season['losses']
+        team_info['total_ties'] += season['ties']
+        team_info['total_points_for'] += season['points_for']
+        team_info['total_points_against'] += season['points_against']
+
+        # Check if champion (final_standing == 1)
+        if season['final_standing'] == 1:
+            team_info['championships'] += 1
+
+        # Check if made playoffs (top 6 teams in regular season standing)
+        # Skip 2006 as we don't have complete data for that year
+        if season['year'] != 2006 and season['standing'] <= 6:
+            team_info['playoff_appearances'] += 1
 
-                # Add season stats
-                season_stats = {
-                    'year': year,
-                    'team_name': team['team_name'],
-                    'owner': normalized_owner,
-                    'wins': team['wins'],
-                    'losses': team['losses'],
-                    'ties': team['ties'],
-                    'points_for': team['points_for'],
-                    'points_against': team['points_against'],
-                    'standing': team['standing'],
-                    'final_standing': team['final_standing'],
-                    'playoff_seed': team.get('playoff_seed')
-                }
-                team_info['seasons'].append(season_stats)
+    @staticmethod
+    def _summarize_team(team_id, info):
+        """Final team entry from running totals"""
+        return {
+            'team_id': team_id,
+            'team_names': list(info['team_names']),
+            'current_name': list(info['team_names'])[-1] if info['team_names'] else 'Unknown',
+            'owners': list(info['owners']),
+            'current_owner': list(info['owners'])[-1] if info['owners'] else 'Unknown',
+            'seasons_active': len(info['seasons']),
+            'seasons': sorted(info['seasons'], key=lambda x: x['year']),
+            'all_time': {
+                'wins': info['total_wins'],
+                'losses': info['total_losses'],
+                'ties': info['total_ties'],
+                'points_for': round(info['total_points_for'], 2),
+                'points_against': round(info['total_points_against'], 2),
+                'championships': info['championships'],
+                'playoff_appearances': info['playoff_appearances']
+            }
+        }
 
-                # Aggregate stats
-                team_info['total_wins'] += team['wins']
-                team_info['total_losses'] += team['losses']
-                team_info['total_ties'] += team['ties']
-                team_info['total_points_for'] += team['points_for']
-                team_info['total_points_against'] += team['points_against']
+    def _season_teams(self, year, season_data, parts):
+        """One season of every team: {'teams': [(team_id, season), ...]} in team order"""
+        owners = self.season_owners(year, season_data)['owners']
+        return {'teams': [(team['team_id'], self._team_season(year, team, owner))
+                          for team, owner in zip(season_data.get('teams', []), owners)]}
 
-                # Check if champion (final_standing == 1)
-                if team['final_standing'] == 1:
-                    team_info['championships'] += 1
+    def process_teams(self):
+        """Process team information across all seasons"""
+        teams_by_id = defaultdict(self._new_team_totals)
 
-                # Check if made playoffs (top 6 teams in regular season standing)
-                # Skip 2006 as we don't have complete data for that year
-                if year != 2006 and team['standing'] <= 6:
-                    team_info['playoff_appearances'] += 1
+        for part in self._season_parts('process_teams').values():
+            for team_id, season in part['teams']:
+                self._add_team_season(teams_by_id[team_id], season)
 
         # Convert to final format
-        for team_id, info in teams_by_id.items():
-            self.processed_data['teams'][team_id] = {
-                'team_id': team_id,
-                'team_names': list(info['team_names']),
-                'current_name': list(info['team_names'])[-1] if info['team_names'] else 'Unknown',
-                'owners': list(info['owners']),
-                'current_owner': list(info['owners'])[-1] if info['owners'] else 'Unknown',
-                'seasons_active': len(info['seasons']),
-                'seasons': sorted(info['seasons'], key=lambda x: x['year']),
-                'all_time': {
-                    'wins': info['total_wins'],
-                    'losses': info['total_losses'],
-                    'ties': info['total_ties'],
-                    'points_for': round(info['total_points_for'], 2),
-                    'points_against': round(info['total_points_against'], 2),
-                    'championships': info['championships'],
-                    'playoff_appearances': info['playoff_appearances']
-                }
-            }
+        self.processed_data['teams'] = {team_id: self._summarize_team(team_id, info) for team_id, info in teams_by_id.items()}
 
         print(f"Processed {len(self.processed_data['teams'])} teams")
 
-    def process_owners(self):
-        """Process owner-based statistics (aggregates data by owner across all teams/years)"""
-        owners_stats = defaultdict(lambda: {
+    @staticmethod
+    def _new_owner_totals():
+        return {
             'seasons': [],
             'total_wins': 0,
             'total_losses': 0,
@@ -191,660 +585,924 @@ class FantasyDataProcessor:
             'playoff_appearances': 0,
             'total_points_for': 0,
             'total_points_against': 0,
+            **{f'total_{field}': 0 for field in LUCK_FIELDS},
             'years_active': set(),
             'championship_years': [],
             'second_place_years': [],
             'third_place_years': [],
             'toilet_bowl_years': []
-        })
-
-        # First pass: find the last place standing for each year (for toilet bowl calculation)
-        last_place_by_year = {}
-        for year, season_data in self.raw_data.items():
-            teams = season_data.get('teams', [])
-            if teams:
-                # Last place is the highest standing number (worst rank)
-                last_place_by_year[year] = max(team['standing'] for team in teams)
-
-        # Aggregate stats by owner across all seasons
-        for year, season_data in self.raw_data.items():
-            for team in season_data.get('teams', []):
-                owner = self.normalize_owner_name(team['owner'], year)
-                owner_info = owners_stats[owner]
-
-                # Track year
-                owner_info['years_active'].add(year)
-
-                # Add season stats
-                season_stats = {
-                    'year': year,
-                    'team_name': team['team_name'],
-                    'wins': team['wins'],
-                    'losses': team['losses'],
-                    'ties': team['ties'],
-                    'points_for': team['points_for'],
-                    'points_against': team['points_against'],
-                    'standing': team['standing'],
-                    'final_standing': team['final_standing'],
-                    'playoff_seed': team.get('playoff_seed')
-                }
-                owner_info['seasons'].append(season_stats)
-
-                # Aggregate totals
-                owner_info['total_wins'] += team['wins']
-                owner_info['total_losses'] += team['losses']
-                owner_info['total_ties'] += team['ties']
-                owner_info['total_points_for'] += team['points_for']
-                owner_info['total_points_against'] += team['points_against']
-
-                # Count championships, 2nd place, 3rd place, and playoff appearances
-                if team['final_standing'] == 1:
-                    owner_info['championships'] += 1
-                    owner_info['championship_years'].append(year)
-                elif team['final_standing'] == 2:
-                    owner_info['second_place'] += 1
-                    owner_info['second_place_years'].append(year)
-                elif team['final_standing'] == 3:
-                    owner_info['third_place'] += 1
-                    owner_info['third_place_years'].append(year)
-
-                # Count toilet bowl (last place in regular season)
-                # Skip 2006 as we don't have complete data for that year
-                if year != 2006 and team['standing'] == last_place_by_year.get(year):
-                    owner_info['toilet_bowl'] += 1
-                    owner_info['toilet_bowl_years'].append(year)
-
-                # Count playoff appearances (top 6 teams in regular season standing)
-                # Special handling for 2006: only count for Kellen Coffis (1st) and Chris Vitale (2nd)
-                if year == 2006:
-                    # Only count 2006 playoffs for 1st and 2nd place (Kellen and Chris)
-                    if team['final_standing'] in [1, 2]:
-                        owner_info['playoff_appearances'] += 1
-                elif team['standing'] <= 6:
-                    owner_info['playoff_appearances'] += 1
+        }
 
-        # Convert to final format
-        self.processed_data['owners'] = {}
-        for owner_name, info in owners_stats.items():
-            years_list = sorted(list(info['years_active']))
-            seasons_played = len(info['years_active'])
-
-            # Calculate ranking points: 7 for 1st, 3 for 2nd, 1 for 3rd, -1 for toilet bowl
-            ranking_points = (info['championships'] * 7) + (info['second_place'] * 3) + (info['third_place'] * 1) - (info['toilet_bowl'] * 1)
-
-            # Calculate percentages
-            toilet_bowl_pct = round((info['toilet_bowl'] / seasons_played) * 100, 1) if seasons_played > 0 else 0
-            top_3_pct = round(((info['championships'] + info['second_place'] + info['third_place']) / seasons_played) * 100, 1) if seasons_played > 0 else 0
-
-            # For playoff appearance %, exclude 2006 from denominator unless owner is Kellen or Chris
-            playoff_seasons_denominator = seasons_played
-            if 2006 in info['years_active'] and owner_name not in ['Kellen Coffis', 'Chris Vitale']:
-                playoff_seasons_denominator = seasons_played - 1
-
-            playoff_appearance_pct = round((info['playoff_appearances'] / playoff_seasons_denominator) * 100, 1) if playoff_seasons_denominator > 0 else 0
-
-            self.processed_data['owners'][owner_name] = {
-                'owner': owner_name,
-                'seasons_played': seasons_played,
-                'years_active': years_list,
-                'first_season': min(years_list) if years_list else None,
-                'last_season': max(years_list) if years_list else None,
-                'seasons': sorted(info['seasons'], key=lambda x: x['year']),
-                'all_time': {
-                    'wins': info['total_wins'],
-                    'losses': info['total_losses'],
-                    'ties': info['total_ties'],
-                    'win_percentage': round(info['total_wins'] / (info['total_wins'] + info['total_losses']) * 100, 1) if (info['total_wins'] + info['total_losses']) > 0 else 0,
-                    'points_for': round(info['total_points_for'], 2),
-                    'points_against': round(info['total_points_against'], 2),
-                    'championships': info['championships'],
-                    'second_place': info['second_place'],
-                    'third_place': info['third_place'],
-                    'toilet_bowl': info['toilet_bowl'],
-                    'playoff_appearances': info['playoff_appearances'],
-                    'championship_years': sorted(info['championship_years']),
-                    'second_place_years': sorted(info['second_place_years']),
-                    'third_place_years': sorted(info['third_place_years']),
-                    'toilet_bowl_years': sorted(info['toilet_bowl_years']),
-                    'ranking_points': ranking_points,
-                    'toilet_bowl_pct': toilet_bowl_pct,
-                    'top_3_pct': top_3_pct,
-                    'playoff_appearance_pct': playoff_appearance_pct
-                }
+    @staticmethod
+    def _owner_season(year, team, luck=None):
+        """
+        One team-season of an owner, as listed in their seasons
+
+        Args:
+            luck: The team-season's calculate_luck row, if it played any
+                regular season matchups
+        """
+        return {
+            'year': year,
+            'team_name': team['team_name'],
+            'wins': team['wins'],
+            'losses': team['losses'],
+            'ties': team['ties'],
+            'points_for': team['points_for'],
+            'points_against': team['points_against'],
+            'standing': team['standing'],
+            'final_standing': team['final_standing'],
+            'playoff_seed': team.get('playoff_seed'),
+            **{field: luck[field] if luck else None for field in LUCK_FIELDS}
+        }
+
+    @staticmethod
+    def _add_owner_season(owner_info, season, last_place):
+        """
+        Fold one team-season (_owner_season) into an owner's running totals
+
+        Args:
+            last_place: Highest (worst) regular season standing that year
+        """
+        year = season['year']
+
+        # Track year
+        owner_info['years_active'].add(year)
+
+        # Add season stats
+        owner_info['seasons'].append(season)
+
+        # Aggregate totals
+        owner_info['total_wins'] += season['wins']
+        owner_info['total_losses'] += season['losses']
+        owner_info['total_ties'] += season['ties']
+        owner_info['total_points_for'] += season['points_for']
+        owner_info['total_points_against'] += season['points_against']
+        if season['luck'] is not None:
+            for field in LUCK_FIELDS:
+                owner_info[f'total_{field}'] += season[field]
+
+        # Count championships, 2nd place, 3rd place, and playoff appearances
+        if season['final_standing'] == 1:
+            owner_info['championships'] += 1
+            owner_info['championship_years'].append(year)
+        elif season['final_standing'] == 2:
+            owner_info['second_place'] += 1
+            owner_info['second_place_years'].append(year)
+        elif season['final_standing'] == 3:
+            owner_info['third_place'] += 1
+            owner_info['third_place_years'].append(year)
+
+        # Count toilet bowl (last place in regular season)
+        # Skip 2006 as we don't have complete data for that year
+        if year != 2006 and season['standing'] == last_place:
+            owner_info['toilet_bowl'] += 1
+            owner_info['toilet_bowl_years'].append(year)
+
+        # Count playoff appearances (top 6 teams in regular season standing)
+        # Special handling for 2006: only count for Kellen Coffis (1st) and Chris Vitale (2nd)
+        if year == 2006:
+            # Only count 2006 playoffs for 1st and 2nd place (Kellen and Chris)
+            if season['final_standing'] in [1, 2]:
+                owner_info['playoff_appearances'] += 1
+        elif season['standing'] <= 6:
+            owner_info['playoff_appearances'] += 1
+
+    @staticmethod
+    def _summarize_owner(owner_name, info):
+        """Final owner entry from running totals"""
+        years_list = sorted(list(info['years_active']))
+        seasons_played = len(info['years_active'])
+
+        # Calculate ranking points: 7 for 1st, 3 for 2nd, 1 for 3rd, -1 for toilet bowl
+        ranking_points = (info['championships'] * 7) + (info['second_place'] * 3) + (info['third_place'] * 1) - (info['toilet_bowl'] * 1)
+
+        # Calculate percentages
+        toilet_bowl_pct = round((info['toilet_bowl'] / seasons_played) * 100, 1) if seasons_played > 0 else 0
+        top_3_pct = round(((info['championships'] + info['second_place'] + info['third_place']) / seasons_played) * 100, 1) if seasons_played > 0 else 0
+
+        # For playoff appearance %, exclude 2006 from denominator unless owner is Kellen or Chris
+        playoff_seasons_denominator = seasons_played
+        if 2006 in info['years_active'] and owner_name not in ['Kellen Coffis', 'Chris Vitale']:
+            playoff_seasons_denominator = seasons_played - 1
+
+        playoff_appearance_pct = round((info['playoff_appearances'] / playoff_seasons_denominator) * 100, 1) if playoff_seasons_denominator > 0 else 0
+
+        return {
+            'owner': owner_name,
+            'seasons_played': seasons_played,
+            'years_active': years_list,
+            'first_season': min(years_list) if years_list else None,
+            'last_season': max(years_list) if years_list else None,
+            'seasons': sorted(info['seasons'], key=lambda x: x['year']),
+            'all_time': {
+                'wins': info['total_wins'],
+                'losses': info['total_losses'],
+                'ties': info['total_ties'],
+                'win_percentage': round(info['total_wins'] / (info['total_wins'] + info['total_losses']) * 100, 1) if (info['total_wins'] + info['total_losses']) > 0 else 0,
+                'points_for': round(info['total_points_for'], 2),
+                'points_against': round(info['total_points_against'], 2),
+                'championships': info['championships'],
+                'second_place': info['second_place'],
+                'third_place': info['third_place'],
+                'toilet_bowl': info['toilet_bowl'],
+                'playoff_appearances': info['playoff_appearances'],
+                'championship_years': sorted(info['championship_years']),
+                'second_place_years': sorted(info['second_place_years']),
+                'third_place_years': sorted(info['third_place_years']),
+                'toilet_bowl_years': sorted(info['toilet_bowl_years']),
+                'ranking_points': ranking_points,
+                'toilet_bowl_pct': toilet_bowl_pct,
+                'top_3_pct': top_3_pct,
+                'playoff_appearance_pct': playoff_appearance_pct,
+                'all_play_wins': info['total_all_play_wins'],
+                'all_play_losses': info['total_all_play_losses'],
+                'all_play_ties': info['total_all_play_ties'],
+                'all_play_win_percentage': round(info['total_all_play_wins'] / (info['total_all_play_wins'] + info['total_all_play_losses']) * 100, 1) if (info['total_all_play_wins'] + info['total_all_play_losses']) > 0 else 0,
+                'expected_wins': round(info['total_expected_wins'], 2),
+                'luck': round(info['total_luck'], 2)
             }
+        }
+
+    def _season_owner_rows(self, year, season_data, parts):
+        """
+        One season of every owner: {'owners': [(owner, season), ...]} in team
+        order, and the season's 'last_place' standing (for the toilet bowl)
+        """
+        teams = season_data.get('teams', [])
+        owners = self.season_owners(year, season_data)['owners']
+        luck_by_team = self._luck_by_team(parts['luck']['luck'])
+        return {
+            'owners': [(owner, self._owner_season(year, team, luck_by_team.get((year, team['team_id']))))
+                       for team, owner in zip(teams, owners)],
+            # Last place is the highest standing number (worst rank)
+            'last_place': max((team['standing'] for team in teams), default=None),
+        }
+
+    def process_owners(self):
+        """Process owner-based statistics (aggregates data by owner across all teams/years)"""
+        owners_stats = defaultdict(self._new_owner_totals)
+
+        # Aggregate stats by owner id across all seasons
+        identity = OwnerIdentity()
+        for part in self._season_parts('process_owners').values():
+            for owner, season in part['owners']:
+                self._add_owner_season(owners_stats[identity.owner_id(owner)], season, part['last_place'])
+
+        # Convert to final format
+        owner_names = identity.owner_names
+        self.processed_data['owners'] = {owner_names[owner_id]: self._summarize_owner(owner_names[owner_id], info)
+                                         for owner_id, info in owners_stats.items()}
 
         print(f"Processed {len(self.processed_data['owners'])} unique owners")
 
+    @staticmethod
+    def _process_matchup(year, matchup):
+        """Flat matchup entry with rounded scores and the winner"""
+        return {
+            'year': year,
+            'week': matchup['week'],
+            'is_playoff': matchup.get('is_playoff', False),
+            'home_team': matchup['home_team'],
+            'home_team_id': matchup['home_team_id'],
+            'home_score': round(matchup['home_score'], 2),
+            'away_team': matchup['away_team'],
+            'away_team_id': matchup['away_team_id'],
+            'away_score': round(matchup['away_score'], 2),
+            'winner': matchup['home_team'] if matchup['home_score'] > matchup['away_score']
+                     else matchup['away_team'] if matchup['away_score'] > matchup['home_score']
+                     else 'TIE',
+            'point_differential': abs(round(matchup['home_score'] - matchup['away_score'], 2))
+        }
+
+    def _season_matchups(self, year, season_data, parts):
+        """One season's processed matchups"""
+        return {'matchups': [self._process_matchup(year, matchup) for matchup in season_data.get('matchups', [])]}
+
     def process_matchups(self):
         """Process all matchups into a flat list"""
-        for year, season_data in self.raw_data.items():
-            for matchup in season_data.get('matchups', []):
-                processed_matchup = {
-                    'year': year,
-                    'week': matchup['week'],
-                    'is_playoff': matchup.get('is_playoff', False),
-                    'home_team': matchup['home_team'],
-                    'home_team_id': matchup['home_team_id'],
-                    'home_score': round(matchup['home_score'], 2),
-                    'away_team': matchup['away_team'],
-                    'away_team_id': matchup['away_team_id'],
-                    'away_score': round(matchup['away_score'], 2),
-                    'winner': matchup['home_team'] if matchup['home_score'] > matchup['away_score']
-                             else matchup['away_team'] if matchup['away_score'] > matchup['home_score']
-                             else 'TIE',
-                    'point_differential': abs(round(matchup['home_score'] - matchup['away_score'], 2))
-                }
-                self.processed_data['matchups'].append(processed_matchup)
+        self.processed_data['matchups'] = [matchup for part in self._season_parts('process_matchups').values()
+                                           for matchup in part['matchups']]
 
         print(f"Processed {len(self.processed_data['matchups'])} matchups")
 
+    @staticmethod
+    def _standing_entry(year, team, owner):
+        return {
+            'year': year,
+            'team_name': team['team_name'],
+            'owner': owner,
+            'wins': team['wins'],
+            'losses': team['losses'],
+            'ties': team['ties'],
+            'points_for': round(team['points_for'], 2),
+            'points_against': round(team['points_against'], 2),
+            'standing': team['standing'],
+            'final_standing': team['final_standing'],
+            'playoff_seed': team.get('playoff_seed')
+        }
+
+    @staticmethod
+    def _rank_season(standings):
+        """
+        Add points_rank and wins_rank to one season's standing rows
+
+        Args:
+            standings: The season's rows in standing order. Ranks are 1-based;
+                equal points keep standing order, and equal wins are broken
+                by points_for, then standing order.
+        """
+        for rank, standing in enumerate(sorted(standings, key=lambda x: x['points_for'], reverse=True), start=1):
+            standing['points_rank'] = rank
+        for rank, standing in enumerate(sorted(standings, key=lambda x: (x['wins'], x['points_for']), reverse=True), start=1):
+            standing['wins_rank'] = rank
+
+    def _season_standings(self, year, season_data, parts):
+        """One season's standing rows in standing order, with their rank index"""
+        owners = self.season_owners(year, season_data)['owners']
+        standings = [self._standing_entry(year, team, owner) for team, owner in zip(season_data.get('teams', []), owners)]
+        standings.sort(key=lambda x: x['standing'])
+        # Rank index published with each row (and used by calculate_records)
+        self._rank_season(standings)
+        return {'standings': standings}
+
     def process_standings(self):
         """Process season standings"""
-        for year, season_data in self.raw_data.items():
-            for team in season_data.get('teams', []):
-                standing_entry = {
-                    'year': year,
-                    'team_name': team['team_name'],
-                    'owner': self.normalize_owner_name(team['owner'], year),
-                    'wins': team['wins'],
-                    'losses': team['losses'],
-                    'ties': team['ties'],
-                    'points_for': round(team['points_for'], 2),
-                    'points_against': round(team['points_against'], 2),
-                    'standing': team['standing'],
-                    'final_standing': team['final_standing'],
-                    'playoff_seed': team.get('playoff_seed')
-                }
-                self.processed_data['standings'].append(standing_entry)
-
         # Sort by year and standing
-        self.processed_data['standings'].sort(key=lambda x: (x['year'], x['standing']))
+        self.processed_data['standings'] = sorted((standing for part in self._season_parts('process_standings').values()
+                                                   for standing in part['standings']),
+                                                  key=lambda x: (x['year'], x['standing']))
 
         print(f"Processed {len(self.processed_data['standings'])} season standings")
 
-    def process_playoffs(self):
-        """Process playoff results"""
-        for year, season_data in self.raw_data.items():
-            # Find the champion (final_standing == 1)
-            champion = None
-            champion_owner = None
-            runner_up = None
-            runner_up_owner = None
-            third_place = None
-            third_place_owner = None
-
-            teams = season_data.get('teams', [])
-            for team in teams:
-                if team['final_standing'] == 1:
-                    champion = team['team_name']
-                    champion_owner = self.normalize_owner_name(team['owner'], year)
-                elif team['final_standing'] == 2:
-                    runner_up = team['team_name']
-                    runner_up_owner = self.normalize_owner_name(team['owner'], year)
-                elif team['final_standing'] == 3:
-                    third_place = team['team_name']
-                    third_place_owner = self.normalize_owner_name(team['owner'], year)
-
-            playoff_entry = {
-                'year': year,
-                'champion': champion,
-                'champion_owner': champion_owner,
-                'runner_up': runner_up,
-                'runner_up_owner': runner_up_owner,
-                'third_place': third_place,
-                'third_place_owner': third_place_owner,
-                'playoff_teams': [{'team_name': t['team_name'], 'owner': self.normalize_owner_name(t['owner'], year)} for t in teams if t.get('playoff_seed')]
-            }
+    @staticmethod
+    def _playoff_entry(year, teams, owners, settings=None):
+        """
+        Champion, runner-up, third place and playoff teams for a season
+
+        Args:
+            teams: The season's raw teams
+            owners: Normalized owner of each team, in the same order
+            settings: The season's raw league settings, for the number of
+                playoff teams (ESPN playoff_team_count, Sleeper playoff_teams)
+        """
+        # Find the champion (final_standing == 1)
+        champion = None
+        champion_owner = None
+        runner_up = None
+        runner_up_owner = None
+        third_place = None
+        third_place_owner = None
+
+        for team, owner in zip(teams, owners):
+            if team['final_standing'] == 1:
+                champion = team['team_name']
+                champion_owner = owner
+            elif team['final_standing'] == 2:
+                runner_up = team['team_name']
+                runner_up_owner = owner
+            elif team['final_standing'] == 3:
+                third_place = team['team_name']
+                third_place_owner = owner
+
+        settings = settings or {}
+        playoff_teams = [{'team_name': t['team_name'], 'owner': owner} for t, owner in zip(teams, owners) if t.get('playoff_seed')]
+        return {
+            'year': year,
+            'champion': champion,
+            'champion_owner': champion_owner,
+            'runner_up': runner_up,
+            'runner_up_owner': runner_up_owner,
+            'third_place': third_place,
+            'third_place_owner': third_place_owner,
+            'playoff_teams': playoff_teams,
+            'playoff_team_count': settings.get('playoff_team_count') or settings.get('playoff_teams') or len(playoff_teams)
+        }
 
-            self.processed_data['playoffs'].append(playoff_entry)
+    def _season_playoffs(self, year, season_data, parts):
+        """One season's playoff entry"""
+        return {'playoffs': self._playoff_entry(year, season_data.get('teams', []),
+                                                self.season_owners(year, season_data)['owners'],
+                                                season_data.get('settings'))}
 
-        self.processed_data['playoffs'].sort(key=lambda x: x['year'])
+    def process_playoffs(self):
+        """Process playoff results"""
+        self.processed_data['playoffs'] = sorted((part['playoffs'] for part in self._season_parts('process_playoffs').values()),
+                                                 key=lambda x: x['year'])
 
         print(f"Processed {len(self.processed_data['playoffs'])} playoff seasons")
 
+    def _season_head_to_head(self, year, season_data, parts):
+        """One season's head-to-head cells: {'head_to_head': HeadToHead}"""
+        matchups = parts['matchups']['matchups']
+        owners = self.season_owners(year, season_data)
+        return {'head_to_head': HeadToHead.from_games(
+            [self._team_owner(owners, matchup['home_team_id'], matchup['home_team']) for matchup in matchups],
+            [self._team_owner(owners, matchup['away_team_id'], matchup['away_team']) for matchup in matchups],
+            [matchup['home_score'] for matchup in matchups],
+            [matchup['away_score'] for matchup in matchups],
+            [matchup['is_playoff'] for matchup in matchups])}
+
     def process_head_to_head(self):
         """Calculate head-to-head records between all owners"""
-        # Build mapping of team_name -> owner for each year
-        team_to_owner = {}
-        for year, season_data in self.raw_data.items():
-            for team in season_data.get('teams', []):
-                key = (year, team['team_name'])
-                team_to_owner[key] = self.normalize_owner_name(team['owner'], year)
-
-        # Calculate H2H by owner
-        h2h = defaultdict(lambda: defaultdict(lambda: {'wins': 0, 'losses': 0, 'ties': 0, 'points_for': 0, 'points_against': 0}))
-
-        for matchup in self.processed_data['matchups']:
-            year = matchup['year']
-            home_team = matchup['home_team']
-            away_team = matchup['away_team']
-            home_score = matchup['home_score']
-            away_score = matchup['away_score']
-
-            # Get owners for this matchup
-            home_owner = team_to_owner.get((year, home_team), home_team)
-            away_owner = team_to_owner.get((year, away_team), away_team)
-
-            # Update owner's record vs other owner
-            if home_score > away_score:
-                h2h[home_owner][away_owner]['wins'] += 1
-                h2h[away_owner][home_owner]['losses'] += 1
-            elif away_score > home_score:
-                h2h[away_owner][home_owner]['wins'] += 1
-                h2h[home_owner][away_owner]['losses'] += 1
-            else:
-                h2h[home_owner][away_owner]['ties'] += 1
-                h2h[away_owner][home_owner]['ties'] += 1
+        h2h = HeadToHead.combine([part['head_to_head'] for part in self._season_parts('process_head_to_head').values()])
+        self.processed_data['head_to_head'] = h2h.to_nested()
+        self.processed_data['head_to_head_matrix'] = h2h.to_dict()
+        print(f"Processed head-to-head records for {len(h2h.owners)} owners")
+
+    @staticmethod
+    def _all_play(scores):
+        """
+        Every team's all-play results in every week, from one sort per week
+
+        Args:
+            scores: weeks x teams score matrix, NaN where a team didn't play
+
+        Returns:
+            (wins, losses, ties): weeks x teams counts of the other teams that
+            played that week which each team outscored, lost to and tied
+            (all 0 where the team didn't play)
+        """
+        weeks, teams = scores.shape
+        order = np.argsort(scores, axis=1, kind='stable')  # NaN sorts last
+        ranked = np.take_along_axis(scores, order, axis=1)
+        position = np.broadcast_to(np.arange(teams), ranked.shape)
+
+        # First and last position of each run of equal scores (NaN never equals)
+        starts = np.ones(ranked.shape, dtype=bool)
+        starts[:, 1:] = ranked[:, 1:] != ranked[:, :-1]
+        ends = np.ones(ranked.shape, dtype=bool)
+        ends[:, :-1] = starts[:, 1:]
+        first = np.maximum.accumulate(np.where(starts, position, 0), axis=1)
+        last = np.minimum.accumulate(np.where(ends, position, teams - 1)[:, ::-1], axis=1)[:, ::-1]
+
+        played = ~np.isnan(scores)
+        wins = np.empty((weeks, teams), dtype=np.int64)
+        np.put_along_axis(wins, order, first, axis=1)
+        ties = np.empty((weeks, teams), dtype=np.int64)
+        np.put_along_axis(ties, order, last - first, axis=1)
+        losses = played.sum(axis=1, keepdims=True) - 1 - wins - ties
+        return wins * played, losses * played, ties * played
+
+    @staticmethod
+    def played_matchups(matchups):
+        """Matchups that have been played (unplayed weeks of a season in progress come through as 0-0)"""
+        return [matchup for matchup in matchups if matchup['home_score'] or matchup['away_score']]
+
+    @staticmethod
+    def season_score_matrix(matchups):
+        """
+        Week x team score matrix of one season's regular season
+
+        Args:
+            matchups: The season's processed matchups
+
+        Returns:
+            dict with 'weeks' and 'team_ids' (sorted; the matrix's rows and
+            columns), 'team_names' (team_id -> name it first played under),
+            'scores' (NaN where a team didn't play that week) and 'results'
+            (actual wins, losses and ties of each team), or None without
+            regular season matchups
+        """
+        regular = [matchup for matchup in matchups if not matchup['is_playoff']]
+        if not regular:
+            return None
+
+        table = FantasyDataProcessor._matchup_table(regular)
+        team_names = {}
+        for matchup in regular:
+            team_names.setdefault(matchup['home_team_id'], matchup['home_team'])
+            team_names.setdefault(matchup['away_team_id'], matchup['away_team'])
+        team_ids, team_index = np.unique([[matchup['home_team_id'], matchup['away_team_id']] for matchup in regular],
+                                         return_inverse=True)
+        team_index = team_index.reshape(len(regular), 2)
+        weeks, week_index = np.unique(table['week'], return_inverse=True)
+
+        scores = np.full((len(weeks), len(team_ids)), np.nan)
+        scores[week_index, team_index[:, 0]] = table['home_score']
+        scores[week_index, team_index[:, 1]] = table['away_score']
+
+        # results[outcome, team], outcome 0 = win, 1 = loss, 2 = tie
+        results = np.zeros((3, len(team_ids)), dtype=np.int64)
+        for side, sign in ((0, 1), (1, -1)):
+            outcome = np.where(table['winner'] == sign, 0, np.where(table['winner'] == -sign, 1, 2))
+            np.add.at(results, (outcome, team_index[:, side]), 1)
+
+        return {'weeks': weeks, 'team_ids': team_ids, 'team_names': team_names, 'scores': scores, 'results': results}
+
+    @staticmethod
+    def _luck_rows(year, matchups, owner_of):
+        """
+        All-play record, expected wins and luck of each team over the played
+        weeks of one season's regular season, ranked from its season_score_matrix
+
+        Expected wins are the weekly all-play win rates summed (ties count
+        half), and luck is actual wins (ties count half) minus expected wins.
+
+        Args:
+            matchups: The season's processed matchups
+            owner_of: Callable (team_id, team_name) -> owner
+
+        Returns:
+            One row per team that played a regular season matchup, in team id order
+        """
+        matrix = FantasyDataProcessor.season_score_matrix(FantasyDataProcessor.played_matchups(matchups))
+        if matrix is None:
+            return []
+
+        scores, results, team_names = matrix['scores'], matrix['results'], matrix['team_names']
+        all_play_wins, all_play_losses, all_play_ties = FantasyDataProcessor._all_play(scores)
+        opponents = all_play_wins + all_play_losses + all_play_ties
+        expected_wins = np.divide(all_play_wins + 0.5 * all_play_ties, opponents,
+                                  out=np.zeros(scores.shape), where=opponents > 0).sum(axis=0)
+
+        rows = []
+        for i, team_id in enumerate(matrix['team_ids'].tolist()):
+            wins, losses, ties = results[:, i].tolist()
+            all_play = [int(counts[:, i].sum()) for counts in (all_play_wins, all_play_losses, all_play_ties)]
+            rows.append({
+                'year': year,
+                'team_id': team_id,
+                'team_name': team_names[team_id],
+                'owner': owner_of(team_id, team_names[team_id]),
+                'weeks': int((~np.isnan(scores[:, i])).sum()),
+                'wins': wins,
+                'losses': losses,
+                'ties': ties,
+                'all_play_wins': all_play[0],
+                'all_play_losses': all_play[1],
+                'all_play_ties': all_play[2],
+                'all_play_win_percentage': round(all_play[0] / (all_play[0] + all_play[1]) * 100, 1) if (all_play[0] + all_play[1]) > 0 else 0,
+                'expected_wins': round(float(expected_wins[i]), 2),
+                'luck': round(wins + 0.5 * ties - float(expected_wins[i]), 2)
+            })
+        return rows
+
+    @staticmethod
+    def _luck_by_team(luck):
+        """(year, team_id) -> calculate_luck row, first row wins on duplicate ids"""
+        by_team = {}
+        for row in luck:
+            by_team.setdefault((row['year'], row['team_id']), row)
+        return by_team
 
-            h2h[home_owner][away_owner]['points_for'] += home_score
-            h2h[home_owner][away_owner]['points_against'] += away_score
-            h2h[away_owner][home_owner]['points_for'] += away_score
-            h2h[away_owner][home_owner]['points_against'] += home_score
+    def _season_luck(self, year, season_data, parts):
+        """One season's calculate_luck rows (_luck_rows)"""
+        owners = self.season_owners(year, season_data)
+        return {'luck': self._luck_rows(year, parts['matchups']['matchups'],
+                                        lambda team_id, team_name: self._team_owner(owners, team_id, team_name))}
 
-        # Convert to regular dict for JSON serialization
-        self.processed_data['head_to_head'] = {
-            owner: dict(opponents) for owner, opponents in h2h.items()
+    def calculate_luck(self):
+        """All-play records, expected wins and luck of every team-season (regular season only)"""
+        self.processed_data['luck'] = [row for part in self._season_parts('calculate_luck').values() for row in part['luck']]
+
+        print(f"Calculated all-play records and luck for {len(self.processed_data['luck'])} team-seasons")
+
+    @staticmethod
+    def _with_loser(matchup):
+        """Copy of a decided matchup with loser, winner_score and loser_score added"""
+        matchup_copy = matchup.copy()
+        if matchup['winner'] == matchup['home_team']:
+            matchup_copy['loser'] = matchup['away_team']
+            matchup_copy['winner_score'] = matchup['home_score']
+            matchup_copy['loser_score'] = matchup['away_score']
+        else:
+            matchup_copy['loser'] = matchup['home_team']
+            matchup_copy['winner_score'] = matchup['away_score']
+            matchup_copy['loser_score'] = matchup['home_score']
+        return matchup_copy
+
+    @staticmethod
+    def _matchup_table(matchups):
+        """
+        Columnar view of processed matchups: one NumPy array per field, row i
+        describing matchups[i]. 'winner' is 1 for a home win, -1 for an away
+        win and 0 for a tie.
+        """
+        count = len(matchups)
+
+        def column(field, dtype):
+            return np.fromiter((matchup[field] for matchup in matchups), dtype=dtype, count=count)
+
+        return {
+            'year': column('year', np.int32),
+            'week': column('week', np.int32),
+            'home_score': column('home_score', np.float64),
+            'away_score': column('away_score', np.float64),
+            'point_differential': column('point_differential', np.float64),
+            'winner': np.fromiter((1 if matchup['winner'] == matchup['home_team']
+                                   else -1 if matchup['winner'] == matchup['away_team'] else 0
+                                   for matchup in matchups), dtype=np.int8, count=count),
         }
 
-        print(f"Processed head-to-head records for {len(h2h)} owners")
+    @staticmethod
+    def _matchup_records(matchups, table):
+        """
+        Single-game records of a list of matchups, each found with one
+        argmax/argmin over its _matchup_table (first entry wins ties, like max/min)
 
-    def calculate_records(self):
-        """Calculate various league records and milestones"""
-        if not self.processed_data['matchups']:
-            print("No matchups to calculate records from")
-            return
+        Returns:
+            dict with the MATCHUP_RECORD_FIELDS records and 'biggest_blowout' /
+            'closest_game' as indexes into matchups (None where there is no entry)
+        """
+        records = dict.fromkeys([*MATCHUP_RECORD_FIELDS, 'biggest_blowout', 'closest_game'])
+        if not matchups:
+            return records
+
+        def score_entry(row, side, with_opponent_score=False):
+            return FantasyDataProcessor._score_entry(matchups[row], side, with_opponent_score)
+
+        # Row-major scores list every game's home score, then its away score
+        scores = np.column_stack((table['home_score'], table['away_score']))
+        records['highest_score'] = score_entry(*divmod(int(np.argmax(scores)), 2))
+        records['lowest_score'] = score_entry(*divmod(int(np.argmin(scores)), 2))
+
+        decided = np.flatnonzero(table['winner'] != 0)
+        if decided.size:
+            winner_side = (table['winner'][decided] == -1).astype(np.intp)  # 0 = home, 1 = away
+            best = int(np.argmax(scores[decided, 1 - winner_side]))
+            records['highest_scoring_loss'] = score_entry(int(decided[best]), 1 - winner_side[best], True)
+            best = int(np.argmin(scores[decided, winner_side]))
+            records['lowest_scoring_win'] = score_entry(int(decided[best]), winner_side[best], True)
+            records['closest_game'] = int(decided[np.argmin(table['point_differential'][decided])])
+
+        combined = table['home_score'] + table['away_score']
+        records['most_combined_points'] = FantasyDataProcessor._combined_points_entry(matchups[int(np.argmax(combined))])
+        records['biggest_blowout'] = int(np.argmax(table['point_differential']))
+        return records
 
-        records = {
-            'highest_score': None,
-            'lowest_score': None,
-            'biggest_blowout': None,
-            'closest_game': None,
-            'most_points_season': None,
-            'most_wins_season': None,
-            'most_points_against_season': None,
-            'fewest_wins_season': None,
-            'fewest_points_season': None,
-            'longest_win_streak': None,
-            'longest_loss_streak': None,
-            'highest_scoring_loss': None,
-            'most_combined_points': None,
-            'lowest_scoring_win': None
+    @staticmethod
+    def _score_entry(matchup, side, with_opponent_score=False):
+        """One team's score in a matchup (side 0 = home, 1 = away)"""
+        team, opponent = ('home', 'away') if side == 0 else ('away', 'home')
+        entry = {
+            'team': matchup[f'{team}_team'],
+            'score': matchup[f'{team}_score'],
+            'week': matchup['week'],
+            'year': matchup['year'],
+            'opponent': matchup[f'{opponent}_team']
         }
+        if with_opponent_score:
+            entry['opponent_score'] = matchup[f'{opponent}_score']
+        return entry
 
-        # Highest and lowest scores
-        all_scores = []
-        for matchup in self.processed_data['matchups']:
-            all_scores.append({
-                'team': matchup['home_team'],
-                'score': matchup['home_score'],
-                'week': matchup['week'],
-                'year': matchup['year'],
-                'opponent': matchup['away_team']
-            })
-            all_scores.append({
-                'team': matchup['away_team'],
-                'score': matchup['away_score'],
-                'week': matchup['week'],
-                'year': matchup['year'],
-                'opponent': matchup['home_team']
-            })
+    @staticmethod
+    def _combined_points_entry(matchup):
+        return {
+            'year': matchup['year'],
+            'week': matchup['week'],
+            'home_team': matchup['home_team'],
+            'away_team': matchup['away_team'],
+            'home_score': matchup['home_score'],
+            'away_score': matchup['away_score'],
+            'combined_points': matchup['home_score'] + matchup['away_score']
+        }
+
+    def _matchup_leaderboard_candidates(self, matchups):
+        """
+        Top and bottom leaderboards of every MATCHUP_LEADERBOARDS category,
+        streamed over matchups in one pass
 
-        if all_scores:
-            records['highest_score'] = max(all_scores, key=lambda x: x['score'])
-            records['lowest_score'] = min(all_scores, key=lambda x: x['score'])
-
-        # Biggest blowout and closest game - add loser info
-        if self.processed_data['matchups']:
-            blowout = max(self.processed_data['matchups'], key=lambda x: x['point_differential'])
-            # Add loser information
-            blowout_copy = blowout.copy()
-            if blowout['winner'] == blowout['home_team']:
-                blowout_copy['loser'] = blowout['away_team']
-                blowout_copy['winner_score'] = blowout['home_score']
-                blowout_copy['loser_score'] = blowout['away_score']
+        Returns:
+            {category: {'top': [[value, entry], ...], 'bottom': [...]}} with the
+            kept entries in matchup order, ready for _merge_leaderboards
+        """
+        size = self.leaderboard_size
+        boards = {category: (Leaderboard(size), Leaderboard(size, largest=False)) for category in MATCHUP_LEADERBOARDS}
+        scores, combined, differentials, losing, winning = boards.values()
+
+        # Entries are (row, side) references until they make a final list
+        for row, matchup in enumerate(matchups):
+            home_score, away_score = matchup['home_score'], matchup['away_score']
+            for board in scores:
+                board.add(home_score, (row, 0))
+                board.add(away_score, (row, 1))
+            for board in combined:
+                board.add(home_score + away_score, (row, None))
+
+            differentials[0].add(matchup['point_differential'], (row, None))
+            if matchup['winner'] == matchup['home_team']:
+                winner_side = 0
+            elif matchup['winner'] == matchup['away_team']:
+                winner_side = 1
             else:
-                blowout_copy['loser'] = blowout['home_team']
-                blowout_copy['winner_score'] = blowout['away_score']
-                blowout_copy['loser_score'] = blowout['home_score']
-            records['biggest_blowout'] = blowout_copy
-
-            non_ties = [m for m in self.processed_data['matchups'] if m['winner'] != 'TIE']
-            if non_ties:
-                closest = min(non_ties, key=lambda x: x['point_differential'])
-                # Add loser information
-                closest_copy = closest.copy()
-                if closest['winner'] == closest['home_team']:
-                    closest_copy['loser'] = closest['away_team']
-                    closest_copy['winner_score'] = closest['home_score']
-                    closest_copy['loser_score'] = closest['away_score']
-                else:
-                    closest_copy['loser'] = closest['home_team']
-                    closest_copy['winner_score'] = closest['away_score']
-                    closest_copy['loser_score'] = closest['home_score']
-                records['closest_game'] = closest_copy
-
-        # Season records
-        if self.processed_data['standings']:
-            records['most_points_season'] = max(self.processed_data['standings'], key=lambda x: x['points_for'])
-            records['most_wins_season'] = max(self.processed_data['standings'], key=lambda x: x['wins'])
-            records['most_points_against_season'] = max(self.processed_data['standings'], key=lambda x: x['points_against'])
-            # Fewest wins (but only teams that played a full season)
-            full_season_teams = [s for s in self.processed_data['standings'] if s['wins'] + s['losses'] >= 10]
-            if full_season_teams:
-                records['fewest_wins_season'] = min(full_season_teams, key=lambda x: x['wins'])
-                records['fewest_points_season'] = min(full_season_teams, key=lambda x: x['points_for'])
-
-        # Calculate win/loss streaks
-        # Build mapping of team_name -> owner for each year
-        team_to_owner = {}
-        for year, season_data in self.raw_data.items():
-            for team in season_data.get('teams', []):
-                key = (year, team['team_name'])
-                team_to_owner[key] = self.normalize_owner_name(team['owner'], year)
-
-        # Calculate streaks by owner across all matchups chronologically
-        from collections import defaultdict
-        owner_results = defaultdict(list)  # owner -> [(year, week, result)]
-
-        for matchup in sorted(self.processed_data['matchups'], key=lambda x: (x['year'], x['week'])):
-            year = matchup['year']
-            week = matchup['week']
-            home_team = matchup['home_team']
-            away_team = matchup['away_team']
-
-            home_owner = team_to_owner.get((year, home_team), home_team)
-            away_owner = team_to_owner.get((year, away_team), away_team)
-
-            if matchup['winner'] == home_team:
-                owner_results[home_owner].append((year, week, 'W', home_team))
-                owner_results[away_owner].append((year, week, 'L', away_team))
-            elif matchup['winner'] == away_team:
-                owner_results[away_owner].append((year, week, 'W', away_team))
-                owner_results[home_owner].append((year, week, 'L', home_team))
-            else:  # Tie
-                owner_results[home_owner].append((year, week, 'T', home_team))
-                owner_results[away_owner].append((year, week, 'T', away_team))
-
-        # Find longest streaks
-        max_win_streak = {'owner': None, 'streak': 0, 'start_year': None, 'end_year': None, 'start_week': None, 'end_week': None}
-        max_loss_streak = {'owner': None, 'streak': 0, 'start_year': None, 'end_year': None, 'start_week': None, 'end_week': None}
-
-        for owner, results in owner_results.items():
-            current_win_streak = 0
-            current_loss_streak = 0
-            win_start_year = win_start_week = None
-            loss_start_year = loss_start_week = None
-
-            for year, week, result, team in results:
-                if result == 'W':
-                    if current_win_streak == 0:
-                        win_start_year, win_start_week = year, week
-                    current_win_streak += 1
-                    current_loss_streak = 0
-
-                    if current_win_streak > max_win_streak['streak']:
-                        max_win_streak = {
-                            'owner': owner,
-                            'streak': current_win_streak,
-                            'start_year': win_start_year,
-                            'end_year': year,
-                            'start_week': win_start_week,
-                            'end_week': week
-                        }
-                elif result == 'L':
-                    if current_loss_streak == 0:
-                        loss_start_year, loss_start_week = year, week
-                    current_loss_streak += 1
-                    current_win_streak = 0
-
-                    if current_loss_streak > max_loss_streak['streak']:
-                        max_loss_streak = {
-                            'owner': owner,
-                            'streak': current_loss_streak,
-                            'start_year': loss_start_year,
-                            'end_year': year,
-                            'start_week': loss_start_week,
-                            'end_week': week
-                        }
-                else:  # Tie breaks both streaks
-                    current_win_streak = 0
-                    current_loss_streak = 0
-
-        if max_win_streak['streak'] > 0:
-            records['longest_win_streak'] = max_win_streak
-        if max_loss_streak['streak'] > 0:
-            records['longest_loss_streak'] = max_loss_streak
-
-        # Fun records from matchup data
-        if self.processed_data['matchups']:
-            # Highest scoring loss - team that scored high but still lost
-            losing_scores = []
-            for matchup in self.processed_data['matchups']:
-                if matchup['winner'] == matchup['home_team']:
-                    losing_scores.append({
-                        'team': matchup['away_team'],
-                        'score': matchup['away_score'],
-                        'week': matchup['week'],
-                        'year': matchup['year'],
-                        'opponent': matchup['home_team'],
-                        'opponent_score': matchup['home_score']
-                    })
-                elif matchup['winner'] == matchup['away_team']:
-                    losing_scores.append({
-                        'team': matchup['home_team'],
-                        'score': matchup['home_score'],
-                        'week': matchup['week'],
-                        'year': matchup['year'],
-                        'opponent': matchup['away_team'],
-                        'opponent_score': matchup['away_score']
-                    })
-
-            if losing_scores:
-                records['highest_scoring_loss'] = max(losing_scores, key=lambda x: x['score'])
-
-            # Most combined points in a game
-            combined_points_games = []
-            for matchup in self.processed_data['matchups']:
-                combined_points_games.append({
-                    'year': matchup['year'],
-                    'week': matchup['week'],
-                    'home_team': matchup['home_team'],
-                    'away_team': matchup['away_team'],
-                    'home_score': matchup['home_score'],
-                    'away_score': matchup['away_score'],
-                    'combined_points': matchup['home_score'] + matchup['away_score']
-                })
+                continue
+            differentials[1].add(matchup['point_differential'], (row, None))
+            for board in winning:
+                board.add(matchup['away_score' if winner_side else 'home_score'], (row, winner_side))
+            for board in losing:
+                board.add(matchup['home_score' if winner_side else 'away_score'], (row, 1 - winner_side))
+
+        entry_for = {
+            'score': lambda row, side: self._score_entry(matchups[row], side),
+            'combined_points': lambda row, side: self._combined_points_entry(matchups[row]),
+            'point_differential': lambda row, side: self._with_loser(matchups[row]),
+            'losing_score': lambda row, side: self._score_entry(matchups[row], side, True),
+            'winning_score': lambda row, side: self._score_entry(matchups[row], side, True),
+        }
+        return {
+            category: {
+                end: [[value, entry_for[category](*ref)] for value, ref in board.in_arrival_order()]
+                for end, board in zip(('top', 'bottom'), boards[category])
+            }
+            for category in MATCHUP_LEADERBOARDS
+        }
 
-            if combined_points_games:
-                records['most_combined_points'] = max(combined_points_games, key=lambda x: x['combined_points'])
-
-            # Lowest scoring win - team that won despite low score
-            winning_scores = []
-            for matchup in self.processed_data['matchups']:
-                if matchup['winner'] == matchup['home_team']:
-                    winning_scores.append({
-                        'team': matchup['home_team'],
-                        'score': matchup['home_score'],
-                        'week': matchup['week'],
-                        'year': matchup['year'],
-                        'opponent': matchup['away_team'],
-                        'opponent_score': matchup['away_score']
-                    })
-                elif matchup['winner'] == matchup['away_team']:
-                    winning_scores.append({
-                        'team': matchup['away_team'],
-                        'score': matchup['away_score'],
-                        'week': matchup['week'],
-                        'year': matchup['year'],
-                        'opponent': matchup['home_team'],
-                        'opponent_score': matchup['home_score']
-                    })
-
-            if winning_scores:
-                records['lowest_scoring_win'] = min(winning_scores, key=lambda x: x['score'])
+    def _season_leaderboard_candidates(self, standings):
+        """SEASON_LEADERBOARDS candidates from standings, like _matchup_leaderboard_candidates"""
+        candidates = {}
+        for category, (field, _, _) in SEASON_LEADERBOARDS.items():
+            top = Leaderboard(self.leaderboard_size)
+            bottom = Leaderboard(self.leaderboard_size, largest=False)
+            for standing in standings:
+                top.add(standing[field], standing)
+                if standing['wins'] + standing['losses'] >= 10:
+                    bottom.add(standing[field], standing)
+            candidates[category] = {'top': top.in_arrival_order(), 'bottom': bottom.in_arrival_order()}
+        return candidates
+
+    def _merge_leaderboards(self, candidate_sets):
+        """
+        Final leaderboards from candidate sets given in stream order (e.g. one
+        per season): {category: {'top': [entry, ...], 'bottom': [...]}}, best
+        first, with the ends the candidates have
+        """
+        boards = {}
+        for candidates in candidate_sets:
+            for category, ends in candidates.items():
+                category_boards = boards.setdefault(category, {})
+                for end, kept in ends.items():
+                    board = category_boards.get(end)
+                    if board is None:
+                        board = category_boards[end] = Leaderboard(self.leaderboard_size, largest=end == 'top')
+                    for value, entry in kept:
+                        board.add(value, entry)
+        return {category: {end: board.ranked() for end, board in ends.items()} for category, ends in boards.items()}
+
+    def _streak_leaderboards(self, runs):
+        """
+        Longest win and loss streaks from (owner, result, length, first game,
+        last game) runs in per-owner scan order: {'win_streak': {'top': [...]},
+        'loss_streak': {'top': [...]}}, where a game is a (year, week) pair
+        """
+        boards = {'W': Leaderboard(self.leaderboard_size), 'L': Leaderboard(self.leaderboard_size)}
+        for owner, result, length, first_game, last_game in runs:
+            if result in boards:
+                boards[result].add(length, (owner, length, first_game, last_game))
+
+        leaderboards = {}
+        for category, result in (('win_streak', 'W'), ('loss_streak', 'L')):
+            leaderboards[category] = {'top': [{
+                'owner': owner,
+                'streak': length,
+                'start_year': first_game[0],
+                'end_year': last_game[0],
+                'start_week': first_game[1],
+                'end_week': last_game[1]
+            } for owner, length, first_game, last_game in boards[result].ranked()]}
+        return leaderboards
+
+    @staticmethod
+    def _streak_runs(matchups, table, owner_of):
+        """
+        Each owner's runs of equal results over one season's matchups, for
+        _join_streak_runs
+
+        Every game gives each side a W, L or T in (year, week) order. Owners are
+        coded in the order they first appear, so after a stable sort by owner the
+        results are in the order a per-owner scan would visit them, and runs of
+        equal results fall out as boundaries in the sorted arrays.
+
+        Args:
+            owner_of: Callable (team_id, team_name) -> owner
+
+        Returns:
+            {owner: [(result, length, (start_year, start_week), (end_year, end_week)), ...]}
+            with owners in the order they first appear and each owner's runs in
+            order; tie ('T') runs are kept so runs can be joined across seasons
+        """
+        if not matchups:
+            return {}
+
+        order = np.lexsort((table['week'], table['year']))  # stable: same-week games keep matchup order
+        winners = table['winner'].tolist()
+        owner_codes = {}  # owner name -> code
+        owner = []
+        for i in order.tolist():
+            matchup = matchups[i]
+            home_owner = owner_of(matchup['home_team_id'], matchup['home_team'])
+            away_owner = owner_of(matchup['away_team_id'], matchup['away_team'])
+            # The winner's result is recorded first
+            first, second = (away_owner, home_owner) if winners[i] == -1 else (home_owner, away_owner)
+            owner.append(owner_codes.setdefault(first, len(owner_codes)))
+            owner.append(owner_codes.setdefault(second, len(owner_codes)))
+
+        # Each game's first entry is the winner (1, or 0 for a tie), the second the loser (-1 or 0)
+        decided = (table['winner'][order] != 0).astype(np.int8)
+        result = np.column_stack((decided, -decided)).ravel()
+        row = np.repeat(order, 2)
+
+        owner = np.array(owner, dtype=np.int32)
+        by_owner = np.argsort(owner, kind='stable')
+        owner, result, row = owner[by_owner], result[by_owner], row[by_owner]
+        starts = np.flatnonzero(np.concatenate(([True], (owner[1:] != owner[:-1]) | (result[1:] != result[:-1]))))
+        lengths = np.diff(np.append(starts, len(owner)))
+        ends = starts + lengths - 1
+
+        owner_names = list(owner_codes)
+        runs = {}
+        for start, end, length in zip(starts.tolist(), ends.tolist(), lengths.tolist()):
+            first_game, last_game = matchups[row[start]], matchups[row[end]]
+            runs.setdefault(owner_names[owner[start]], []).append((
+                'W' if result[start] == 1 else 'L' if result[start] == -1 else 'T', length,
+                (first_game['year'], first_game['week']), (last_game['year'], last_game['week'])))
+        return runs
+
+    @staticmethod
+    def _join_streak_runs(season_runs):
+        """
+        Each owner's win and loss runs across seasons, from every season's
+        _streak_runs in season order: an owner's last run of one season and
+        their first run of the next season they play are one run when the
+        results match
+
+        Returns:
+            [(owner, 'W' or 'L', length, first game, last game)] in per-owner
+            scan order, for _streak_leaderboards
+        """
+        joined = {}
+        for runs in season_runs:
+            for owner, owner_runs in runs.items():
+                owner_joined = joined.setdefault(owner, [])
+                for result, length, first_game, last_game in owner_runs:
+                    if owner_joined and owner_joined[-1][0] == result:
+                        _, joined_length, first_game, _ = owner_joined[-1]
+                        owner_joined[-1] = (result, joined_length + length, first_game, last_game)
+                    else:
+                        owner_joined.append((result, length, first_game, last_game))
+        return [(owner, result, length, first_game, last_game)
+                for owner, owner_runs in joined.items()
+                for result, length, first_game, last_game in owner_runs if result != 'T']
+
+    def _champion_leaderboard_candidates(self, standings):
+        """
+        CHAMPION_LEADERBOARDS candidates from the season's standing rows (with
+        the rank index process_standings adds)
+
+        Returns:
+            {category: {'top': [[value, entry], ...]}} in standings order, ready
+            for _merge_leaderboards
+        """
+        boards = {category: Leaderboard(self.leaderboard_size) for category in CHAMPION_LEADERBOARDS}
+        by_points_rank = {standing['points_rank']: standing for standing in standings}
+        # The champion by final standing, since team names can repeat
+        champion = next((standing for standing in standings if standing.get('final_standing') == 1), None)
 
         # Best team that didn't win championship (or finish top 3)
         # Look at teams with best points ranking in their season who finished 4th-6th
         # (Exclude consolation bracket results which can be misleading)
-        best_team_worst_result = None
-        if self.processed_data['standings']:
-            # Group standings by year to compare within seasons
-            standings_by_year = {}
-            for standing in self.processed_data['standings']:
-                year = standing['year']
-                if year not in standings_by_year:
-                    standings_by_year[year] = []
-                standings_by_year[year].append(standing)
-
-            # For each year, rank teams by points and find teams that finished 4th-6th despite high points ranking
-            best_gap = 0
-            for year, year_standings in standings_by_year.items():
-                # Sort by points to get points ranking
-                sorted_by_points = sorted(year_standings, key=lambda x: x['points_for'], reverse=True)
-
-                # Find teams that finished 4th-6th (playoff teams that didn't medal)
-                # Exclude 7th+ as those are often consolation bracket results
-                for standing in year_standings:
-                    final_standing = standing.get('final_standing')
-                    if final_standing and 4 <= final_standing <= 6:
-                        # Find this team's points ranking
-                        points_rank = next((i+1 for i, s in enumerate(sorted_by_points) if s['team_name'] == standing['team_name']), None)
-
-                        if points_rank:
-                            # Calculate gap between points ranking and final standing
-                            gap = final_standing - points_rank
-                            if gap > best_gap or (gap == best_gap and standing['points_for'] > (best_team_worst_result or {}).get('points_for', 0)):
-                                best_gap = gap
-                                standing_copy = standing.copy()
-                                standing_copy['points_rank'] = points_rank
-                                standing_copy['standing_gap'] = gap
-                                best_team_worst_result = standing_copy
-
-        records['best_team_worst_result'] = best_team_worst_result
-
-        # Worst team that won championship
-        # Look at champions who had worst points ranking relative to their season
-        worst_champion = None
-        if self.processed_data['playoffs']:
-            # Group standings by year
-            standings_by_year = {}
-            for standing in self.processed_data['standings']:
-                year = standing['year']
-                if year not in standings_by_year:
-                    standings_by_year[year] = []
-                standings_by_year[year].append(standing)
-
-            worst_points_rank = 0
-            for playoff in self.processed_data['playoffs']:
-                year = playoff['year']
-                champion_team = playoff.get('champion')
-
-                if champion_team and year in standings_by_year:
-                    # Find this champion's standing
-                    champion_standing = next(
-                        (s for s in standings_by_year[year] if s['team_name'] == champion_team),
-                        None
-                    )
-
-                    if champion_standing:
-                        # Sort teams by points to get ranking
-                        sorted_by_points = sorted(standings_by_year[year], key=lambda x: x['points_for'], reverse=True)
-                        points_rank = next((i+1 for i, s in enumerate(sorted_by_points) if s['team_name'] == champion_team), None)
-
-                        if points_rank and points_rank > worst_points_rank:
-                            worst_points_rank = points_rank
-                            champion_copy = champion_standing.copy()
-                            champion_copy['points_rank'] = points_rank
-                            champion_copy['total_teams'] = len(standings_by_year[year])
-                            worst_champion = champion_copy
-
-        records['worst_team_best_result'] = worst_champion
-
-        # Best champion - champion with biggest gap in regular season points over 2nd place
-        best_champion = None
-        if self.processed_data['playoffs']:
-            standings_by_year = {}
-            for standing in self.processed_data['standings']:
-                year = standing['year']
-                if year not in standings_by_year:
-                    standings_by_year[year] = []
-                standings_by_year[year].append(standing)
-
-            max_gap = 0
-            for playoff in self.processed_data['playoffs']:
-                year = playoff['year']
-                champion_team = playoff.get('champion')
-                champion_owner = playoff.get('champion_owner')
-
-                if champion_team and year in standings_by_year:
-                    # Sort teams by regular season points
-                    sorted_by_points = sorted(standings_by_year[year], key=lambda x: x['points_for'], reverse=True)
-
-                    # Find champion's standing
-                    champion_standing = next(
-                        (s for s in standings_by_year[year] if s['team_name'] == champion_team),
-                        None
-                    )
-
-                    if champion_standing and len(sorted_by_points) >= 2:
-                        # Find champion's rank in points
-                        champion_points_rank = next((i for i, s in enumerate(sorted_by_points) if s['team_name'] == champion_team), None)
-
-                        if champion_points_rank is not None:
-                            # Get the points of the second-place points scorer
-                            if champion_points_rank == 0:
-                                # Champion was #1 in points, compare to #2
-                                second_place_points = sorted_by_points[1]['points_for']
-                                points_gap = champion_standing['points_for'] - second_place_points
-
-                                if points_gap > max_gap:
-                                    max_gap = points_gap
-                                    champion_copy = champion_standing.copy()
-                                    champion_copy['points_gap'] = round(points_gap, 2)
-                                    champion_copy['second_place_points'] = round(second_place_points, 2)
-                                    best_champion = champion_copy
-
-        records['best_champion'] = best_champion
+        for standing in standings:
+            final_standing = standing.get('final_standing')
+            if final_standing and 4 <= final_standing <= 6:
+                # Gap between points ranking and final standing, then points for
+                key = (final_standing - standing['points_rank'], standing['points_for'])
+                if key > (0, 0):
+                    boards['best_team_worst_result'].add(key, {**standing, 'standing_gap': key[0]})
+
+        # Worst team that won championship (worst points ranking in its season)
+        # and best champion (biggest regular season points gap over 2nd place)
+        if champion:
+            boards['worst_team_best_result'].add(champion['points_rank'],
+                                                 {**champion, 'total_teams': len(standings)})
+            if champion['points_rank'] == 1 and len(standings) >= 2:
+                second_place_points = by_points_rank[2]['points_for']
+                points_gap = champion['points_for'] - second_place_points
+                if points_gap > 0:
+                    boards['best_champion'].add(points_gap, {**champion, 'points_gap': round(points_gap, 2),
+                                                             'second_place_points': round(second_place_points, 2)})
 
         # Unluckiest regular season winner - team with biggest points gap over 2nd place but didn't win championship
-        unluckiest_reg_season_winner = None
-        if self.processed_data['standings']:
-            standings_by_year = {}
-            for standing in self.processed_data['standings']:
-                year = standing['year']
-                if year not in standings_by_year:
-                    standings_by_year[year] = []
-                standings_by_year[year].append(standing)
-
-            max_gap = 0
-            for year, year_standings in standings_by_year.items():
-                # Sort by points to get top scorer
-                sorted_by_points = sorted(year_standings, key=lambda x: x['points_for'], reverse=True)
-
-                if len(sorted_by_points) >= 2:
-                    top_scorer = sorted_by_points[0]
-                    second_scorer = sorted_by_points[1]
-
-                    # Check if top scorer didn't win championship (final_standing != 1)
-                    if top_scorer.get('final_standing') != 1:
-                        points_gap = top_scorer['points_for'] - second_scorer['points_for']
-
-                        if points_gap > max_gap:
-                            max_gap = points_gap
-                            top_scorer_copy = top_scorer.copy()
-                            top_scorer_copy['points_gap'] = round(points_gap, 2)
-                            top_scorer_copy['second_place_points'] = round(second_scorer['points_for'], 2)
-                            unluckiest_reg_season_winner = top_scorer_copy
-
-        records['unluckiest_reg_season_winner'] = unluckiest_reg_season_winner
+        if len(standings) >= 2:
+            top_scorer, second_scorer = by_points_rank[1], by_points_rank[2]
+            if top_scorer.get('final_standing') != 1:
+                points_gap = top_scorer['points_for'] - second_scorer['points_for']
+                if points_gap > 0:
+                    boards['unluckiest_reg_season_winner'].add(points_gap, {
+                        **top_scorer, 'points_gap': round(points_gap, 2),
+                        'second_place_points': round(second_scorer['points_for'], 2)})
+
+        return {category: {'top': board.in_arrival_order()} for category, board in boards.items()}
+
+    def _season_records(self, year, season_data, parts):
+        """
+        One season's record candidates
+
+        Returns:
+            dict with 'matchup_records' and 'season_records' ({name: (value,
+            entry)}, the season's best entry of each record), their
+            leaderboard candidates ('matchup_leaderboards',
+            'season_leaderboards' and 'champion_leaderboards') and the season's
+            'streaks' (_streak_runs)
+        """
+        matchups = parts['matchups']['matchups']
+        standings = parts['standings']['standings']
+
+        # Single-game records from one columnar table of the matchups
+        matchup_records = {}
+        streaks = {}
+        if matchups:
+            table = self._matchup_table(matchups)
+            best = self._matchup_records(matchups, table)
+            for name, (field, _) in MATCHUP_RECORD_FIELDS.items():
+                if best[name] is not None:
+                    matchup_records[name] = (best[name][field], best[name])
+            for name in ('biggest_blowout', 'closest_game'):
+                if best[name] is not None:
+                    entry = self._with_loser(matchups[best[name]])
+                    matchup_records[name] = (entry['point_differential'], entry)
+
+            owners = self.season_owners(year, season_data)
+            streaks = self._streak_runs(matchups, table,
+                                        lambda team_id, team_name: self._team_owner(owners, team_id, team_name))
+
+        # Season records (fewest wins and points only count teams that played a full season)
+        season_records = {}
+        full_seasons = [standing for standing in standings if standing['wins'] + standing['losses'] >= 10]
+        for name, (field, best) in SEASON_RECORD_FIELDS.items():
+            rows = standings if best is max else full_seasons
+            if rows:
+                entry = best(rows, key=operator.itemgetter(field))
+                season_records[name] = (entry[field], entry)
+
+        return {
+            'matchup_records': matchup_records,
+            'season_records': season_records,
+            'matchup_leaderboards': self._matchup_leaderboard_candidates(matchups),
+            'season_leaderboards': self._season_leaderboard_candidates(standings),
+            'champion_leaderboards': self._champion_leaderboard_candidates(standings),
+            'streaks': streaks,
+        }
+
+    @staticmethod
+    def _merge_records(records, candidate_sets):
+        """
+        Fold {name: (value, entry)} candidate sets, given in stream order (e.g.
+        one per season), into records: the first strictly best entry of each
+        (see RECORD_DIRECTIONS)
+        """
+        best = {}
+        for candidates in candidate_sets:
+            for name, (value, entry) in candidates.items():
+                current = best.get(name)
+                if current is None or (value > current[0] if RECORD_DIRECTIONS[name] is max else value < current[0]):
+                    best[name] = (value, entry)
+        for name, (_, entry) in best.items():
+            records[name] = entry
+
+    def calculate_records(self):
+        """Calculate various league records and milestones"""
+        if not self.processed_data['matchups']:
+            self.processed_data['records'] = {}
+            self.processed_data['leaderboards'] = {}
+            print("No matchups to calculate records from")
+            return
+
+        # Single-game candidates merge in matchup order, and season ones
+        # (like standings and streaks) by year
+        parts = self._season_parts('calculate_records')
+        by_year = [parts[year] for year in sorted(parts)]
+        records = dict.fromkeys(RECORD_DIRECTIONS)
+        self._merge_records(records, [part['matchup_records'] for part in parts.values()])
+        self._merge_records(records, [part['season_records'] for part in by_year])
+
+        # Top and bottom entries of every record category
+        leaderboards = self._merge_leaderboards([part['matchup_leaderboards'] for part in parts.values()] +
+                                                [part['season_leaderboards'] for part in by_year] +
+                                                [part['champion_leaderboards'] for part in by_year])
+        for name in CHAMPION_LEADERBOARDS:
+            records[name] = next(iter(leaderboards[name]['top']), None)
+
+        # Longest win/loss streaks by owner across all matchups chronologically
+        streaks = self._streak_leaderboards(self._join_streak_runs([part['streaks'] for part in by_year]))
+        records['longest_win_streak'] = next(iter(streaks['win_streak']['top']), None)
+        records['longest_loss_streak'] = next(iter(streaks['loss_streak']['top']), None)
 
         self.processed_data['records'] = records
+        leaderboards.update(streaks)
+        self.processed_data['leaderboards'] = leaderboards
+
+        print(f"Calculated league records and top {self.leaderboard_size} leaderboards")
 
-        print("Calculated league records")
+    def _season_metadata(self, year, season_data, parts):
+        """The season's league name"""
+        return {'league_name': season_data.get('league_name', 'Unknown')}
 
     def add_metadata(self):
         """Add metadata about the processed data"""
-        years = sorted(self.raw_data.keys())
+        parts = self._season_parts('add_metadata')
+        years = sorted(parts)
+        # League name from the first season processed
+        league_name = next(iter(parts.values()))['league_name'] if parts else 'Unknown'
 
         self.processed_data['metadata'] = {
             'total_seasons': len(years),
@@ -855,158 +1513,233 @@ class FantasyDataProcessor:
             'total_owners': len(self.processed_data['owners']),
             'total_matchups': len(self.processed_data['matchups']),
             'processed_at': datetime.now().isoformat(),
-            'league_name': list(self.raw_data.values())[0].get('league_name', 'Unknown') if self.raw_data else 'Unknown'
+            'league_name': league_name
         }
 
         print(f"Added metadata: {self.processed_data['metadata']['total_seasons']} seasons, "
               f"{self.processed_data['metadata']['total_teams']} teams, "
               f"{self.processed_data['metadata']['total_owners']} owners")
 
+    def _season_draft(self, year, season_data, parts):
+        """One season's draft picks with year and owner, keepers excluded"""
+        owner_by_team_id = self.season_owners(year, season_data)['by_team_id']
+        picks = []
+        for pick in season_data.get('draft', []):
+            # Skip keepers - only include actual draft picks
+            if pick.get('keeper_status', False):
+                continue
+
+            # Add year and normalized owner name
+            pick_data = pick.copy()
+            pick_data['year'] = year
+            if pick.get('team_name') and pick.get('team_id') in owner_by_team_id:
+                pick_data['owner'] = owner_by_team_id[pick.get('team_id')]
+            picks.append(pick_data)
+        return {'draft': picks}
+
     def process_draft(self):
         """Process draft data across all years"""
-        all_drafts = []
-
-        for year, season_data in self.raw_data.items():
-            draft_picks = season_data.get('draft', [])
-            for pick in draft_picks:
-                # Skip keepers - only include actual draft picks
-                if pick.get('keeper_status', False):
-                    continue
-
-                # Add year and normalized owner name
-                pick_data = pick.copy()
-                pick_data['year'] = year
-                if pick.get('team_name'):
-                    # Find owner for this team
-                    for team in season_data.get('teams', []):
-                        if team['team_id'] == pick.get('team_id'):
-                            pick_data['owner'] = self.normalize_owner_name(team['owner'], year)
-                            break
-                all_drafts.append(pick_data)
+        all_drafts = [pick for part in self._season_parts('process_draft').values() for pick in part['draft']]
 
         self.processed_data['draft'] = all_drafts
         print(f"Processed {len(all_drafts)} draft picks across all years (keepers excluded)")
 
+    def _season_rosters(self, year, season_data, parts):
+        """One season's roster entries, one per team with a roster"""
+        rosters_by_team = season_data.get('rosters', {})
+        teams = season_data.get('teams', [])
+
+        rosters = []
+        for team, owner in zip(teams, self.season_owners(year, season_data)['owners']):
+            team_id = team['team_id']
+            roster = rosters_by_team.get(str(team_id), [])
+
+            if roster:
+                roster_entry = {
+                    'year': year,
+                    'team_id': team_id,
+                    'team_name': team['team_name'],
+                    'owner': owner,
+                    'roster': roster
+                }
+                rosters.append(roster_entry)
+        return {'rosters': rosters}
+
     def process_rosters(self):
         """Process roster data across all years"""
-        all_rosters = []
-
-        for year, season_data in self.raw_data.items():
-            rosters_by_team = season_data.get('rosters', {})
-            teams = season_data.get('teams', [])
-
-            for team in teams:
-                team_id = team['team_id']
-                roster = rosters_by_team.get(str(team_id), [])
-
-                if roster:
-                    roster_entry = {
-                        'year': year,
-                        'team_id': team_id,
-                        'team_name': team['team_name'],
-                        'owner': self.normalize_owner_name(team['owner'], year),
-                        'roster': roster
-                    }
-                    all_rosters.append(roster_entry)
+        all_rosters = [roster for part in self._season_parts('process_rosters').values() for roster in part['rosters']]
 
         self.processed_data['rosters'] = all_rosters
         print(f"Processed rosters for {len(all_rosters)} team-seasons")
 
-    def process_player_stats(self):
-        """Process player performance data and calculate optimal lineups"""
-        all_player_stats = []
-        optimal_lineups = []
-
-        for year, season_data in self.raw_data.items():
-            player_stats = season_data.get('player_stats', [])
-
-            # Add year and normalized owner to each stat
-            for stat in player_stats:
-                stat_data = stat.copy()
-                stat_data['year'] = year
+    def _season_player_stats(self, year, season_data, parts):
+        """
+        One season's PlayerStat records, optimal lineups and player totals:
+        {'player_stats': [...], 'optimal_lineups': [...], 'player_totals': _player_season_totals}
+        """
+        player_stats = season_data.get('player_stats', [])
+        owner_by_team_id = self.season_owners(year, season_data)['by_team_id']
 
-                # Find owner for this team
-                for team in season_data.get('teams', []):
-                    if team['team_id'] == stat.get('team_id'):
-                        stat_data['owner'] = self.normalize_owner_name(team['owner'], year)
-                        break
+        # Add year and normalized owner to each stat
+        records = [PlayerStat(*PlayerStat.row(stat, year, owner_by_team_id.get(stat.get('team_id'))))
+                   for stat in player_stats]
 
-                all_player_stats.append(stat_data)
+        # Calculate optimal lineups (only for years with player stats)
+        lineup_slots = season_data.get('settings', {}).get('lineup_slot_counts')
+        optimal_lineups = self._optimal_lineups(year, player_stats, owner_by_team_id, lineup_slots)
+        return {'player_stats': records, 'optimal_lineups': optimal_lineups,
+                'player_totals': self._player_season_totals(records)}
 
-            # Calculate optimal lineups (only for years with player stats)
-            if player_stats:
-                optimal_lineups.extend(self.calculate_optimal_lineups(year, player_stats))
+    def process_player_stats(self):
+        """Process player performance data and calculate optimal lineups"""
+        parts = self._season_parts('process_player_stats').values()
+        all_player_stats = [stat for part in parts for stat in part['player_stats']]
+        optimal_lineups = [lineup for part in parts for lineup in part['optimal_lineups']]
 
         self.processed_data['player_stats'] = all_player_stats
         self.processed_data['optimal_lineups'] = optimal_lineups
         print(f"Processed {len(all_player_stats)} player performances")
         print(f"Calculated {len(optimal_lineups)} optimal lineups")
 
-    def calculate_optimal_lineups(self, year, player_stats):
+    def calculate_optimal_lineups(self, year, player_stats, lineup_slots=None):
         """Calculate optimal lineup for each team each week"""
-        # Group by team and week
-        from collections import defaultdict
-        team_week_players = defaultdict(list)
+        return self._optimal_lineups(year, player_stats, self.season_owners(year)['by_team_id'], lineup_slots)
+
+    @staticmethod
+    def _optimal_lineups(year, player_stats, owner_by_team_id, lineup_slots=None):
+        """
+        Optimal lineup entries for every team-week of a season, respecting
+        which positions each lineup slot accepts
+
+        The starting slots come from the league's lineup settings; seasons
+        extracted without them use the most of each slot any team-week
+        started. Players of one position are interchangeable, so a best lineup
+        always starts the top scorers of each position and only the number of
+        starters per position has to be chosen. For each group of positions
+        that share slots, every feasible choice (_lineup_shapes) is scored
+        against all of the season's team-weeks at once from per-position
+        prefix sums; lineups that fill more slots win, then the highest total.
+        A group with too many choices to enumerate is filled greedily per
+        team-week (_greedy_lineup_points).
 
+        Args:
+            year: Season year
+            player_stats: The season's raw player stats
+            owner_by_team_id: team_id -> owner for the season
+            lineup_slots: slot -> count from the season's settings
+                (lineup_slot_counts), bench slots included or not
+        """
+        if not player_stats:
+            return []
+
+        # Team-weeks in the order they first appear, with their team name
+        team_weeks = {}
+        team_names = {}
+        slot_use = defaultdict(int)
+        rows = []
         for stat in player_stats:
             key = (stat['team_id'], stat['week'])
-            team_week_players[key].append(stat)
-
-        optimal_lineups = []
-
-        # Lineup slot definitions (non-bench slots)
-        # Slots like 'QB', 'RB', 'WR', 'TE', 'FLEX', 'D/ST', 'K' are starters
-        # Slot 'BE' or 'Bench' or 'IR' are bench slots
-        BENCH_SLOTS = ['BE', 'Bench', 'IR']
-
-        for (team_id, week), players in team_week_players.items():
-            # Calculate actual points (starters only)
-            actual_points = sum(p['points'] for p in players if p['slot'] not in BENCH_SLOTS)
-
-            # Calculate optimal points (all players sorted by points, taking top starters)
-            # This is simplified - ideally would respect position constraints
-            all_points = sorted([p['points'] for p in players], reverse=True)
-            num_starters = len([p for p in players if p['slot'] not in BENCH_SLOTS])
-            optimal_points = sum(all_points[:num_starters]) if all_points else 0
-
-            bench_points = sum(p['points'] for p in players if p['slot'] in BENCH_SLOTS)
+            row = team_weeks.setdefault(key, len(team_weeks))
+            rows.append(row)
+            if 'team_name' in stat:
+                team_names.setdefault(row, stat['team_name'])
+            if stat['slot'] and stat['slot'] not in BENCH_SLOTS:
+                slot_use[(row, stat['slot'])] += 1
+
+        if lineup_slots:
+            slots = {slot: count for slot, count in lineup_slots.items() if count and slot not in BENCH_SLOTS}
+        else:
+            slots = {}
+            for (_, slot), count in slot_use.items():
+                slots[slot] = max(slots.get(slot, 0), count)
+        groups = _lineup_shapes(tuple(sorted(slots.items())))
+        class_index = {position: (group, i)
+                       for group, (classes, _, _) in enumerate(groups)
+                       for i, positions in enumerate(classes) for position in positions}
+
+        count = len(player_stats)
+        rows = np.array(rows, dtype=np.intp)
+        points = np.fromiter((stat['points'] for stat in player_stats), dtype=np.float64, count=count)
+        bench = np.fromiter((stat['slot'] in BENCH_SLOTS for stat in player_stats), dtype=bool, count=count)
+        group_of, class_of = np.array([class_index.get(stat.get('position'), (-1, -1)) for stat in player_stats],
+                                      dtype=np.intp).reshape(count, 2).T
+
+        # bincount adds each team-week's points in stat order, like sum()
+        actual_points = np.bincount(rows, weights=np.where(bench, 0.0, points), minlength=len(team_weeks))
+        bench_points = np.bincount(rows, weights=np.where(bench, points, 0.0), minlength=len(team_weeks))
+
+        # Any extra starter outweighs every possible points difference
+        fill_bonus = 1.0 + np.abs(points).sum()
+        optimal_points = np.zeros(len(team_weeks))
+        for group, (classes, group_slots, shapes) in enumerate(groups):
+            members = np.flatnonzero(group_of == group)
+            if shapes is None:
+                players = defaultdict(list)
+                for i in members.tolist():
+                    players[rows[i]].append((player_stats[i].get('position'), points[i]))
+                for row, row_players in players.items():
+                    optimal_points[row] += _greedy_lineup_points(row_players, group_slots)
+                continue
 
-            # Find team info
-            team_name = next((p['team_name'] for p in players if 'team_name' in p), None)
-            owner = next((p.get('owner') for p in players if p.get('owner')), None)
+            # best[t, c, k] = k-th best score in class c of team-week t (-inf past the last player)
+            limits = shapes.max(axis=0)
+            best = np.full((len(team_weeks), len(classes), int(limits.max())), -np.inf)
+            if best.shape[2]:
+                order = members[np.lexsort((-points[members], class_of[members], rows[members]))]
+                row, pos = rows[order], class_of[order]
+                index = np.arange(len(order))
+                group_start = np.maximum.accumulate(np.where(
+                    np.concatenate(([True], (row[1:] != row[:-1]) | (pos[1:] != pos[:-1]))), index, 0))
+                rank = index - group_start
+                kept = rank < limits[pos]
+                best[row[kept], pos[kept], rank[kept]] = points[order][kept]
+
+            prefix = np.concatenate((np.zeros(best.shape[:2] + (1,)), np.cumsum(best, axis=2)), axis=2)
+            totals = prefix[:, np.arange(len(classes)), shapes].sum(axis=2)  # (team-weeks, shapes)
+            chosen = np.argmax(totals + fill_bonus * shapes.sum(axis=1), axis=1)
+            optimal_points += totals[np.arange(len(team_weeks)), chosen]
 
+        optimal_lineups = []
+        for (team_id, week), row in team_weeks.items():
             optimal_lineups.append({
                 'year': year,
                 'week': week,
                 'team_id': team_id,
-                'team_name': team_name,
-                'owner': owner,
-                'actual_points': round(actual_points, 2),
-                'optimal_points': round(optimal_points, 2),
-                'bench_points': round(bench_points, 2),
-                'points_left_on_bench': round(optimal_points - actual_points, 2)
+                'team_name': team_names.get(row),
+                'owner': owner_by_team_id.get(team_id),
+                'actual_points': round(float(actual_points[row]), 2),
+                'optimal_points': round(float(optimal_points[row]), 2),
+                'bench_points': round(float(bench_points[row]), 2),
+                'points_left_on_bench': round(float(optimal_points[row] - actual_points[row]), 2)
             })
 
         return optimal_lineups
 
-    def calculate_best_draft_picks(self):
-        """Analyze draft picks to find best and worst value picks (excluding keepers - $0 or $1)"""
-        # Group player stats by year and player
-        from collections import defaultdict
-        player_season_stats = defaultdict(lambda: {'total_points': 0, 'games': 0, 'position': None})
-
-        for stat in self.processed_data['player_stats']:
-            key = (stat['year'], stat.get('player_id') or stat['player_name'])
-            player_season_stats[key]['total_points'] += stat.get('points', 0)
-            player_season_stats[key]['games'] += 1
+    @staticmethod
+    def _player_season_totals(player_stats):
+        """(year, player) -> total points, games and first known position from PlayerStat records"""
+        player_season_stats = {}
+
+        for stat in player_stats:
+            key = (stat.year, stat.player_id or stat.player_name)
+            totals = player_season_stats.get(key)
+            if totals is None:
+                totals = player_season_stats[key] = {'total_points': 0, 'games': 0, 'position': None}
+            totals['total_points'] += stat.points if stat.points is not None else 0
+            totals['games'] += 1
             # Capture position from player stats
-            if not player_season_stats[key]['position']:
-                player_season_stats[key]['position'] = stat.get('position')
+            if not totals['position']:
+                totals['position'] = stat.position
 
+        return player_season_stats
+
+    @staticmethod
+    def _draft_pick_values(draft, player_season_stats):
+        """Season totals and points per dollar for each non-keeper pick with stats"""
         # Match draft picks with their season performance
         all_picks = []
 
-        for draft_pick in self.processed_data['draft']:
+        for draft_pick in draft:
             year = draft_pick['year']
             player_id = draft_pick.get('player_id') or draft_pick['player_name']
             auction_cost = draft_pick.get('bid_amount', 0)
@@ -1038,6 +1771,10 @@ class FantasyDataProcessor:
                     'value': value  # Points per dollar
                 })
 
+        return all_picks
+
+    def _rank_draft_picks(self, all_picks):
+        """Fill best_draft_picks and worst_draft_picks from valued picks"""
         # Sort by value (points per dollar)
         all_picks.sort(key=lambda x: x['value'], reverse=True)
 
@@ -1061,18 +1798,26 @@ class FantasyDataProcessor:
         print(f"  - {len(best_picks)} picks ($20+, excluding QBs from 2019-2021) for best value analysis")
         print(f"  - {len(worst_picks)} picks ($20+, positive points) for worst value analysis")
 
-    def enrich_draft_with_positions(self):
-        """Add position information to draft picks by matching with player stats"""
-        # Create a mapping of (year, player_id) -> position from player stats
-        player_positions = {}
-        for stat in self.processed_data['player_stats']:
-            key = (stat['year'], stat.get('player_id') or stat['player_name'])
-            if key not in player_positions and stat.get('position'):
-                player_positions[key] = stat['position']
+    def _season_draft_values(self, year, season_data, parts):
+        """One season's valued draft picks (_draft_pick_values)"""
+        return {'draft_values': self._draft_pick_values(parts['draft']['draft'],
+                                                        parts['player_stats']['player_totals'])}
+
+    def calculate_best_draft_picks(self):
+        """Analyze draft picks to find best and worst value picks (excluding keepers - $0 or $1)"""
+        all_picks = [pick for part in self._season_parts('calculate_best_draft_picks').values()
+                     for pick in part['draft_values']]
+        self._rank_draft_picks(all_picks)
+
+    @staticmethod
+    def _enrich_draft(draft, player_season_stats):
+        """Set position on draft picks from player stats; returns the number matched"""
+        # Mapping of (year, player_id) -> first known position from player stats
+        player_positions = {key: stats['position'] for key, stats in player_season_stats.items() if stats['position']}
 
         # Enrich draft picks with position data
         enriched_count = 0
-        for pick in self.processed_data['draft']:
+        for pick in draft:
             year = pick['year']
             player_id = pick.get('player_id') or pick['player_name']
             key = (year, player_id)
@@ -1084,41 +1829,396 @@ class FantasyDataProcessor:
                 # Only set to None if position doesn't already exist
                 pick['position'] = None  # Position unknown
 
-        print(f"Enriched {enriched_count}/{len(self.processed_data['draft'])} draft picks with position data")
-
-    def process_all(self):
-        """Run all processing steps"""
-        print("\n=== Processing Fantasy Football Data ===\n")
-
-        self.process_teams()
-        self.process_owners()
-        self.process_matchups()
-        self.process_standings()
-        self.process_playoffs()
-        self.process_head_to_head()
-        self.calculate_records()
-        self.process_draft()
-        self.process_rosters()
-        self.process_player_stats()
-        self.enrich_draft_with_positions()  # Add positions to draft picks
-        self.calculate_best_draft_picks()
-        self.add_metadata()
+        return enriched_count
+
+    def _season_enriched_draft(self, year, season_data, parts):
+        """One season's draft picks with positions: {'draft': [...], 'enriched': picks matched}"""
+        # Enrich copies, so process_draft's cached picks stay as it made them
+        draft = [pick.copy() for pick in parts['draft']['draft']]
+        return {'draft': draft, 'enriched': self._enrich_draft(draft, parts['player_stats']['player_totals'])}
+
+    def enrich_draft_with_positions(self):
+        """Add position information to draft picks by matching with player stats"""
+        parts = self._season_parts('enrich_draft_with_positions').values()
+        draft = [pick for part in parts for pick in part['draft']]
+        enriched_count = sum(part['enriched'] for part in parts)
+        self.processed_data['draft'] = draft
+        print(f"Enriched {enriched_count}/{len(draft)} draft picks with position data")
+
+    def _years(self):
+        """Seasons to process, in raw data order"""
+        return list(self.raw_data) if self._season_years is None else self._season_years
+
+    def _season_data(self, year):
+        """
+        A season's raw data; a season process_incremental didn't load is read
+        from data/raw the first time one of its parts has to be recomputed
+        """
+        season_data = self.raw_data.get(year)
+        if season_data is None:
+            season_data = self.raw_data[year] = load_season(year, raw_dir=RAW_DATA_DIR)
+        return season_data
+
+    def _section_hash(self, year, section):
+        """
+        Hash of one raw section of a season, memoized for the current process()
+        run. A season whose raw file is unchanged since its partials were saved
+        uses the hashes saved with them, without loading the season.
+        """
+        key = (year, section)
+        if self._section_hashes is not None and key in self._section_hashes:
+            return self._section_hashes[key]
+
+        saved = self._file_section_hashes.get(year)
+        if saved is not None and section in saved:
+            section_hash = saved[section]
+        else:
+            section_hash = _content_hash(self._season_data(year).get(section))
+        if self._section_hashes is not None:
+            self._section_hashes[key] = section_hash
+        return section_hash
+
+    def _settings(self):
+        """Values of the non-data STAGES inputs"""
+        return {
+            'owner_names': _owner_aliases_json(),
+            'leaderboard_size': self.leaderboard_size,
+        }
+
+    def _part_key(self, stage, year):
+        """
+        Hash of everything one season's part of a stage is computed from: the
+        season's raw sections the stage reads, the settings it uses and the
+        keys of the parts its component inputs come from (memoized for the
+        current process() run)
+        """
+        if self._part_keys is not None and (stage, year) in self._part_keys:
+            return self._part_keys[(stage, year)]
+
+        settings = self._setting_values or self._settings()
+        producers = STAGE_PRODUCERS[stage]
+        inputs = [self._section_hash(year, name[len('raw:'):]) if name.startswith('raw:')
+                  else self._part_key(producers[name], year) if name in producers
+                  else settings[name]
+                  for name in STAGES[stage][0]]
+        key = _content_hash([PARTIAL_VERSION, stage, year] + inputs)
+        if self._part_keys is not None:
+            self._part_keys[(stage, year)] = key
+        return key
+
+    def _cached_part(self, stage, year):
+        """A season's cached part of a stage, or None if its inputs changed since it was computed"""
+        cached = self._season_cache.get((stage, year))
+        if cached and cached[0] == self._part_key(stage, year):
+            return cached[1]
+        return None
+
+    def _season_inputs(self, stage, year):
+        """The raw sections of a season that a stage's season method reads"""
+        season_data = self._season_data(year)
+        sections = [name[len('raw:'):] for name in STAGES[stage][0] if name.startswith('raw:')]
+        return {section: season_data[section] for section in sections if section in season_data}
+
+    def _season_parts(self, stage):
+        """
+        The SEASON_STAGES method of a stage applied to every season: {year:
+        part} in raw data order
+
+        A season's part is reused while the hash of its inputs is unchanged
+        (_part_key), including parts loaded by load_partials. The others are
+        computed together, in worker processes during process(jobs=N).
+        """
+        years = self._years()
+        parts = {year: self._cached_part(stage, year) for year in years}
+        changed = [year for year in years if parts[year] is None]
+        if changed:
+            producers = {component: self._season_parts(producer) for component, producer in STAGE_PRODUCERS[stage].items()}
+            seasons = [(year, self._season_inputs(stage, year),
+                        {component: producer_parts[year] for component, producer_parts in producers.items()})
+                       for year in changed]
+            for (year, _, _), part in zip(seasons, self._map_seasons(SEASON_STAGES[stage], seasons)):
+                self._season_cache[(stage, year)] = (self._part_key(stage, year), part)
+                parts[year] = part
+            self.changed_seasons.update(changed)
+        return parts
+
+    def _season_chain(self, stages, year, season_data, parts):
+        """
+        Several stages' SEASON_STAGES methods applied to one season back to
+        back, each getting the parts of the stages before it
+
+        Args:
+            stages: Stages to compute, in STAGES order
+            season_data: The raw sections the stages read
+            parts: stage -> the season's part of the earlier stages they read
+                that are not computed here
+
+        Returns:
+            {stage: part} for the given stages
+        """
+        parts = dict(parts)
+        computed = {}
+        for stage in stages:
+            inputs = {component: parts[producer] for component, producer in STAGE_PRODUCERS[stage].items()}
+            parts[stage] = computed[stage] = getattr(self, SEASON_STAGES[stage])(year, season_data, inputs)
+        return computed
+
+    def _process_seasons(self, stages):
+        """
+        Fused mode: compute every missing part of the given stages season by
+        season, so each season is visited once (one worker task per season
+        during process(jobs=N)), before the stages merge them
+        """
+        seasons = []
+        for year in self._years():
+            missing = [stage for stage in stages if self._cached_part(stage, year) is None]
+            if not missing:
+                continue
+            # Parts the missing stages read that are still current
+            needed = {producer for stage in missing for producer in STAGE_PRODUCERS[stage].values()}
+            parts = {producer: self._cached_part(producer, year) for producer in needed if producer not in missing}
+            season_data = {}
+            for stage in missing:
+                season_data.update(self._season_inputs(stage, year))
+            seasons.append((missing, year, season_data, parts))
+
+        for (missing, year, _, _), computed in zip(seasons, self._map_seasons('_season_chain', seasons)):
+            for stage in missing:
+                self._season_cache[(stage, year)] = (self._part_key(stage, year), computed[stage])
+            self.changed_seasons.add(year)
+
+    def _map_seasons(self, method, seasons):
+        """
+        method(*arguments) for each tuple of arguments in seasons, in order
+
+        Runs in the process pool of the current process(jobs=N) run when there
+        is one, and falls back to this process if a pool can't be used.
+        """
+        if self._jobs > 1 and len(seasons) > 1:
+            try:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(max_workers=self._jobs)
+                # map() yields in submission order, whichever season finishes first
+                return list(self._pool.map(_season_job, [method] * len(seasons), seasons,
+                                           [self.leaderboard_size] * len(seasons)))
+            except (OSError, NotImplementedError, BrokenProcessPool) as e:
+                print(f"⚠ Process pool unavailable ({e}); processing seasons serially")
+                self._jobs = 1
+
+        return [getattr(self, method)(*arguments) for arguments in seasons]
+
+    def load_partials(self, file_hashes):
+        """
+        Reuse the parts saved by save_partials; a part is only used while its
+        inputs are unchanged. Seasons whose raw file has the hash it had when
+        their partials were saved keep the section hashes saved with them, so
+        they are only loaded if one of their parts has to be recomputed.
+
+        Args:
+            file_hashes: year -> hash of the season's raw file (season_hash)
+
+        Returns:
+            Number of seasons with saved parts
+        """
+        loaded = 0
+        for year, file_hash in file_hashes.items():
+            self._file_section_hashes.pop(year, None)
+            path = PARTIALS_DIR / f'season_{year}.pickle'
+            if not path.exists():
+                continue
+            # The partials hold no reference cycles, and the cyclic collector
+            # would otherwise rescan the objects loaded so far many times over
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                with open(path, 'rb') as f:
+                    version, partial = pickle.load(f)
+            finally:
+                if gc_enabled:
+                    gc.enable()
+            if version != PARTIAL_VERSION:
+                continue
+            for stage, (key, part) in partial['parts'].items():
+                self._season_cache[(stage, year)] = (key, part)
+            if partial['file_hash'] == file_hash:
+                self._file_section_hashes[year] = partial['sections']
+            loaded += 1
+        return loaded
+
+    def save_partials(self, years, file_hashes):
+        """
+        Write the parts of the given seasons next to the processed output,
+        with the hashes of the raw file and sections they were computed from.
+        They are a cache rather than published data, so they are pickled,
+        which loads several times faster than JSON.
+
+        Args:
+            years: Seasons to save
+            file_hashes: year -> hash of the season's raw file (season_hash)
+        """
+        PARTIALS_DIR.mkdir(parents=True, exist_ok=True)
+        for year in years:
+            partial = {
+                'file_hash': file_hashes[year],
+                'sections': {section: self._section_hash(year, section) for section in RAW_SECTIONS},
+                'parts': {stage: self._season_cache[(stage, year)] for stage in SEASON_STAGES
+                          if (stage, year) in self._season_cache},
+            }
+            path = PARTIALS_DIR / f'season_{year}.pickle'
+            tmp_path = path.with_name(path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((PARTIAL_VERSION, partial), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+
+    def process_incremental(self, years=None, jobs=1):
+        """
+        Staged processing that only redoes the per-season work of seasons
+        whose raw data changed since the last incremental run
+
+        Each season's part of every stage (SEASON_STAGES) is saved in
+        data/processed/partials (save_partials) with the hash of its raw file.
+        On the next run only seasons whose raw file hash changed are loaded;
+        every other season's parts are reused while the owner name mapping
+        and settings are unchanged, and the stages merge the parts of every
+        season, giving the same processed_data as process_all.
+
+        Args:
+            years: Seasons to process (default: every season in data/raw)
+            jobs: Worker processes to process changed seasons in (see process)
+
+        Returns:
+            Number of seasons processed
+        """
+        print("\n=== Processing Fantasy Football Data (incremental) ===\n")
+        file_hashes = {}
+        for year in available_years(RAW_DATA_DIR) if years is None else years:
+            file_hash = season_hash(year, RAW_DATA_DIR)
+            if file_hash is None:
+                print(f"Warning: No data found for {year}")
+                continue
+            file_hashes[year] = file_hash
+        if not file_hashes:
+            return 0
+        self._season_years = list(file_hashes)
+        saved = self.load_partials(file_hashes)
+
+        # Load the seasons whose raw file changed (or that have no partials);
+        # the others are loaded only if one of their parts has to be recomputed
+        self.load_raw_data([year for year in file_hashes if year not in self._file_section_hashes])
+
+        self.process(jobs=jobs, fused=True)
+        changed = sorted(self.changed_seasons)
+        self.save_partials(sorted(self.changed_seasons | {year for year in file_hashes
+                                                          if year not in self._file_section_hashes}), file_hashes)
+
+        print(f"Reprocessed {len(changed)} changed season(s){': ' + ', '.join(map(str, changed)) if changed else ''}; "
+              f"reused saved results for {len(file_hashes) - len(changed)} of {saved} saved season(s)")
+        print("\n✓ All processing complete!\n")
+        return len(file_hashes)
+
+    def process_all(self, jobs=1, fused=False):
+        """
+        Run all processing steps
+
+        Args:
+            jobs: Worker processes for the per-season work (see process)
+            fused: Visit each season once for all stages (see process)
+        """
+        mode = ', '.join(filter(None, ['fused' if fused else None, f'{jobs} jobs' if jobs > 1 else None]))
+        print(f"\n=== Processing Fantasy Football Data{f' ({mode})' if mode else ''} ===\n")
+
+        ran = self.process(jobs=jobs, fused=fused)
+        if len(ran) < len(STAGES):
+            print(f"Reused cached results for {len(STAGES) - len(ran)} unchanged stages")
 
         print("\n✓ All processing complete!\n")
 
+    def process(self, components=None, jobs=1, fused=False):
+        """
+        Run the stages the given processed_data components depend on (see
+        STAGES), reusing a stage's cached outputs while the hashes of its
+        seasons' parts are unchanged. Cached outputs are shared with
+        processed_data, not copied. Within a stage that does run, only the
+        seasons whose inputs changed are processed again (see _season_parts)
+        before the parts are merged.
+
+        Args:
+            components: processed_data keys to compute, e.g. ['records'] (default: all)
+            jobs: Worker processes to run the per-season work in (1 = in this
+                process). Output is the same for any number.
+            fused: Compute every season's parts for all the stages in one
+                visit to the season (one task per season with jobs > 1)
+                instead of stage by stage, then merge. Same output.
+
+        Returns:
+            Names of the stages that ran, in order
+        """
+        produced = {output for _, outputs in STAGES.values() for output in outputs}
+        needed = set(produced if components is None else components)
+        if needed - produced:
+            raise ValueError(f"Unknown processed_data components: {sorted(needed - produced)}")
+
+        # Walk back from the requested components to every stage they depend on
+        selected = []
+        for stage in reversed(list(STAGES)):
+            inputs, outputs = STAGES[stage]
+            if needed.intersection(outputs):
+                selected.append(stage)
+                needed.update(inputs)
+        selected.reverse()
+
+        # Raw sections are hashed by content, season by season, settings by
+        # value and components by the keys of the parts that produced them
+        self._section_hashes = {}
+        self._part_keys = {}
+        self._setting_values = self._settings()
+        self.changed_seasons = set()
+        years = self._years()
+
+        owners_key = (_content_hash([(year, self._section_hash(year, 'teams')) for year in years]),
+                      self._setting_values['owner_names'])
+        if owners_key != self._season_owners_key:
+            self._season_owners = {}
+            self._season_owners_key = owners_key
+
+        ran = []
+        self._jobs = max(1, jobs or 1)
+        try:
+            if fused:
+                self._process_seasons(selected)
+            for stage in selected:
+                key = _content_hash([stage] + [(year, self._part_key(stage, year)) for year in years])
+                cached = self._stage_cache.get(stage)
+                if cached and cached[0] == key:
+                    self.processed_data.update(cached[1])
+                else:
+                    getattr(self, stage)()
+                    self._stage_cache[stage] = (key, {output: self.processed_data[output] for output in STAGES[stage][1]})
+                    ran.append(stage)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+            self._jobs = 1
+            self._section_hashes = None
+            self._part_keys = None
+            self._setting_values = None
+
+        return ran
+
     def save_processed_data(self):
         """Save all processed data to JSON files"""
         # Save complete dataset
         complete_file = PROCESSED_DATA_DIR / 'complete_data.json'
         with open(complete_file, 'w') as f:
-            json.dump(self.processed_data, f, indent=2)
+            json.dump(self.processed_data, f, indent=2, default=_json_default)
         print(f"✓ Saved complete data to {complete_file}")
 
         # Save individual components for easier API access
-        for key in ['teams', 'owners', 'matchups', 'standings', 'playoffs', 'head_to_head', 'records', 'draft', 'rosters', 'player_stats', 'best_draft_picks', 'worst_draft_picks', 'optimal_lineups', 'metadata']:
+        for key in ['teams', 'owners', 'matchups', 'standings', 'playoffs', 'head_to_head', 'head_to_head_matrix', 'luck', 'records', 'leaderboards', 'draft', 'rosters', 'player_stats', 'best_draft_picks', 'worst_draft_picks', 'optimal_lineups', 'metadata']:
             component_file = PROCESSED_DATA_DIR / f'{key}.json'
             with open(component_file, 'w') as f:
-                json.dump(self.processed_data[key], f, indent=2)
+                json.dump(self.processed_data[key], f, indent=2, default=_json_default)
             print(f"  - Saved {key}.json")
 
         print("\n✓ All processed data saved!\n")
@@ -1129,14 +2229,119 @@ class FantasyDataProcessor:
         if complete_file.exists():
             with open(complete_file, 'r') as f:
                 self.processed_data = json.load(f)
+            self.processed_data['player_stats'] = [PlayerStat.from_dict(stat)
+                                                   for stat in self.processed_data.get('player_stats', [])]
             print(f"Loaded processed data from {complete_file}")
             return True
         return False
 
 
+@lru_cache(maxsize=None)
+def _lineup_shapes(slots):
+    """
+    Every feasible number of starters per position class for a set of lineup
+    slots, split into groups of classes that share no slot
+
+    Positions accepted by exactly the same slots are interchangeable and form
+    one class (with DL and DP slots, DT, DE and DL are one class). Groups are
+    enumerated separately, so offense, kicker, D/ST and IDP slots never
+    multiply each other's shapes.
+
+    Args:
+        slots: Sorted tuple of (slot, count) starting slots
+
+    Returns:
+        Tuple of (classes, group_slots, shapes) per group: classes is a tuple
+        of position tuples, group_slots the group's (slot, count) pairs, and
+        shapes an int array with one row per feasible shape giving how many
+        of each class start, or None when checking every shape of the group
+        would take more than MAX_LINEUP_CHECKS comparisons
+    """
+    counts = dict(slots)
+    accepts = {slot: set(FLEX_SLOT_POSITIONS.get(slot, (slot,))) for slot in counts}
+    classes = defaultdict(list)
+    for position in sorted(set().union(*accepts.values())):
+        classes[frozenset(slot for slot in counts if position in accepts[slot])].append(position)
+
+    # Join classes that share a slot, directly or through other classes
+    groups = []  # [slots, [(class slots, positions)]]
+    for class_slots, positions in classes.items():
+        group = [set(class_slots), [(class_slots, tuple(positions))]]
+        for other in [other for other in groups if other[0] & class_slots]:
+            groups.remove(other)
+            group[0] |= other[0]
+            group[1] += other[1]
+        groups.append(group)
+
+    result = []
+    for group_slots, members in sorted(groups, key=lambda group: min(slot for slot in group[0])):
+        members.sort(key=lambda member: member[1])
+        limits = [sum(counts[slot] for slot in class_slots) for class_slots, _ in members]
+        shapes = None
+        if math.prod(limit + 1 for limit in limits) * (2 ** len(members) - 1) <= MAX_LINEUP_CHECKS:
+            # Hall's condition: every subset of classes needs at least as many
+            # slots accepting one of them as it has starters
+            subsets = np.array(list(product((0, 1), repeat=len(members)))[1:], dtype=np.intp)
+            capacity = np.array([sum(counts[slot] for slot in set().union(
+                *(class_slots for member, (class_slots, _) in zip(subset, members) if member)))
+                for subset in subsets])
+            shapes = np.array(list(product(*(range(limit + 1) for limit in limits))), dtype=np.intp)
+            shapes = shapes[(shapes @ subsets.T <= capacity).all(axis=1)]
+        result.append((tuple(positions for _, positions in members),
+                       tuple(sorted((slot, counts[slot]) for slot in group_slots)), shapes))
+    return tuple(result)
+
+
+def _greedy_lineup_points(players, group_slots):
+    """
+    Points of a lineup filled slot by slot, narrowest slot first, each with
+    the best remaining player it accepts. The fallback for slot groups too
+    large for _lineup_shapes; exact when slot acceptances nest.
+
+    Args:
+        players: (position, points) of a team-week's players in the group
+        group_slots: The group's (slot, count) starting slots
+    """
+    remaining = sorted(players, key=lambda player: -player[1])
+    total = 0.0
+    for slot, count in sorted(group_slots, key=lambda item: len(FLEX_SLOT_POSITIONS.get(item[0], (item[0],)))):
+        accepted = FLEX_SLOT_POSITIONS.get(slot, (slot,))
+        for _ in range(count):
+            pick = next((i for i, (position, _) in enumerate(remaining) if position in accepted), None)
+            if pick is None:
+                break
+            total += remaining.pop(pick)[1]
+    return total
+
+
+def _season_job(method, arguments, leaderboard_size):
+    """Process pool entry point: one season's part of a stage (or of several, with _season_chain)"""
+    return getattr(FantasyDataProcessor(leaderboard_size=leaderboard_size), method)(*arguments)
+
+
 def main():
     """Main entry point for data processing"""
-    processor = FantasyDataProcessor()
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Process raw season data')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only reprocess seasons whose raw data changed since the last incremental run (same output)')
+    parser.add_argument('--fused', action='store_true',
+                        help='Process each season in a single visit instead of stage by stage (same output)')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Process seasons in this many worker processes (default: 1, same output)')
+    parser.add_argument('--leaderboard-size', type=int, default=LEADERBOARD_SIZE,
+                        help=f'Entries kept at each end of every leaderboard (default: {LEADERBOARD_SIZE})')
+    args = parser.parse_args()
+
+    processor = FantasyDataProcessor(leaderboard_size=args.leaderboard_size)
+
+    if args.incremental:
+        if processor.process_incremental(jobs=args.jobs) == 0:
+            print("No raw data found. Run data_extractor.py first.")
+            return
+        processor.save_processed_data()
+        return
 
     # Load raw data
     years_loaded = processor.load_raw_data()
@@ -1146,7 +2351,7 @@ def main():
         return
 
     # Process all data
-    processor.process_all()
+    processor.process_all(jobs=args.jobs, fused=args.fused)
 
     # Save processed data
     processor.save_processed_data()
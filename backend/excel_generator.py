@@ -13,6 +13,8 @@ from openpyxl import load_workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 
+from head_to_head import HeadToHead
+
 BASE_DIR = Path(__file__).parent.parent
 PROCESSED_DATA_DIR = BASE_DIR / 'data' / 'processed'
 EXPORTS_DIR = BASE_DIR / 'data' / 'exports'
@@ -86,14 +88,16 @@ class ExcelGenerator:
 
         df = pd.DataFrame(standings)
 
-        # Reorder columns
-        columns = ['year', 'standing', 'team_name', 'owner', 'wins', 'losses', 'ties',
-                   'points_for', 'points_against', 'final_standing', 'playoff_seed']
-        df = df[columns]
-
-        # Rename for readability
-        df.columns = ['Year', 'Standing', 'Team', 'Owner', 'Wins', 'Losses', 'Ties',
-                      'Points For', 'Points Against', 'Final Standing', 'Playoff Seed']
+        # Reorder and rename columns for readability (standings processed
+        # before ranks were published have no rank columns)
+        columns = {
+            'year': 'Year', 'standing': 'Standing', 'team_name': 'Team', 'owner': 'Owner',
+            'wins': 'Wins', 'losses': 'Losses', 'ties': 'Ties',
+            'points_for': 'Points For', 'points_against': 'Points Against',
+            'final_standing': 'Final Standing', 'playoff_seed': 'Playoff Seed',
+            'points_rank': 'Points Rank', 'wins_rank': 'Wins Rank',
+        }
+        df = df[[column for column in columns if column in df.columns]].rename(columns=columns)
 
         df.to_excel(self.writer, sheet_name='Season Standings', index=False)
 
@@ -124,35 +128,20 @@ class ExcelGenerator:
 
     def create_head_to_head_sheet(self):
         """Sheet 4: Head-to-Head Records Matrix (by Owner)"""
-        h2h = self.data.get('head_to_head', {})
+        matrix = self.data.get('head_to_head_matrix')
 
-        if not h2h:
+        if not matrix or not matrix.get('owners'):
             print("  ⚠ No head-to-head data available")
             return
 
         # Get all unique owners
-        all_owners = sorted(set(h2h.keys()))
+        h2h = HeadToHead.from_dict(matrix)
+        all_owners = sorted(h2h.owners)
 
         # Create matrix data
-        matrix_data = []
-        header = ['Owner'] + all_owners
-        matrix_data.append(header)
-
-        for owner1 in all_owners:
-            row = [owner1]
-            for owner2 in all_owners:
-                if owner1 == owner2:
-                    row.append('-')
-                else:
-                    record = h2h.get(owner1, {}).get(owner2, {'wins': 0, 'losses': 0, 'ties': 0})
-                    w = record['wins']
-                    l = record['losses']
-                    t = record['ties']
-                    if t > 0:
-                        row.append(f"{w}-{l}-{t}")
-                    else:
-                        row.append(f"{w}-{l}")
-            matrix_data.append(row)
+        matrix_data = [['Owner'] + all_owners]
+        for owner, row in zip(all_owners, h2h.win_loss_matrix(all_owners)):
+            matrix_data.append([owner] + row)
 
         df = pd.DataFrame(matrix_data[1:], columns=matrix_data[0])
         df.to_excel(self.writer, sheet_name='Head-to-Head Records', index=False)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Head-to-Head Matrix
+
+Owner-vs-owner records held in one dense NumPy array, split into regular
+season and playoff games, so any pair's record is a single lookup. The saved
+forms are views of it:
+
+    head_to_head_matrix.json  - compact: the owner list plus an owner x owner
+                                matrix per segment and field (to_dict)
+    head_to_head.json         - owner -> opponent -> record for every pair that
+                                met, both segments combined (to_nested)
+"""
+
+import numpy as np
+
+FIELDS = ('wins', 'losses', 'ties', 'points_for', 'points_against')
+SEGMENTS = ('regular_season', 'playoffs')
+COUNT_FIELDS = 3  # wins, losses and ties are counts; the rest are points
+
+
+class HeadToHead:
+    """
+    records[segment, field, owner, opponent] for every pair of owners
+
+    Owner indexes follow `owners`, and `index` maps an owner back to its row.
+    """
+
+    def __init__(self, owners, records=None):
+        self.owners = list(owners)
+        self.index = {owner: i for i, owner in enumerate(self.owners)}
+        if records is None:
+            records = np.zeros((len(SEGMENTS), len(FIELDS), len(self.owners), len(self.owners)))
+        self.records = records
+
+    @classmethod
+    def from_games(cls, home, away, home_score, away_score, is_playoff):
+        """
+        Fill the matrix from one entry per game with a scatter-add per field
+
+        Owners are indexed in the order they first appear (home before away).
+        Each game adds its home side and then its away side, so a cell's points
+        are summed in game order.
+
+        Args:
+            home, away: Owner of each game's home and away team
+            home_score, away_score: Each game's scores
+            is_playoff: Whether each game was a playoff game
+        """
+        h2h = cls(dict.fromkeys(owner for pair in zip(home, away) for owner in pair))
+        if not h2h.owners:
+            return h2h
+
+        index = h2h.index
+        home = np.array([index[owner] for owner in home], dtype=np.intp)
+        away = np.array([index[owner] for owner in away], dtype=np.intp)
+        home_score = np.asarray(home_score, dtype=np.float64)
+        away_score = np.asarray(away_score, dtype=np.float64)
+
+        owner = np.column_stack((home, away)).ravel()
+        opponent = np.column_stack((away, home)).ravel()
+        scored = np.column_stack((home_score, away_score)).ravel()
+        allowed = np.column_stack((away_score, home_score)).ravel()
+        segment = np.repeat(np.asarray(is_playoff, dtype=bool).astype(np.intp), 2)
+
+        won = scored > allowed
+        lost = scored < allowed
+        for field, values in enumerate((won, lost, ~(won | lost), scored, allowed)):
+            np.add.at(h2h.records, (segment, field, owner, opponent), values)
+        return h2h
+
+    @classmethod
+    def combine(cls, parts):
+        """
+        One matrix from several over separate games (e.g. one per season)
+
+        Owners are indexed in the order they first appear across the parts,
+        and each part's cells are added in part order.
+        """
+        h2h = cls(dict.fromkeys(owner for part in parts for owner in part.owners))
+        for part in parts:
+            if part.owners:
+                rows = np.array([h2h.index[owner] for owner in part.owners], dtype=np.intp)
+                h2h.records[:, :, rows[:, None], rows] += part.records
+        return h2h
+
+    @classmethod
+    def from_dict(cls, data):
+        """HeadToHead from its compact form (to_dict)"""
+        records = np.array([[data[segment][field] for field in FIELDS] for segment in SEGMENTS], dtype=np.float64)
+        return cls(data['owners'], records.reshape(len(SEGMENTS), len(FIELDS), len(data['owners']), len(data['owners'])))
+
+    def to_dict(self):
+        """Compact JSON form: the owner list and an owner x owner matrix per segment and field"""
+        compact = {'owners': self.owners}
+        for segment, fields in zip(SEGMENTS, self.records):
+            compact[segment] = {field: self._values(field_index, matrix).tolist()
+                                for field_index, (field, matrix) in enumerate(zip(FIELDS, fields))}
+        return compact
+
+    def _totals(self, segment=None):
+        """records[field, owner, opponent] for one segment, or both combined"""
+        if segment is None:
+            return self.records.sum(axis=0)
+        return self.records[SEGMENTS.index(segment)]
+
+    @staticmethod
+    def _values(field_index, values):
+        """Counts as ints and points rounded to cents, ready for JSON"""
+        if field_index < COUNT_FIELDS:
+            return values.astype(np.int64)
+        return np.round(values, 2)
+
+    def _record(self, cells):
+        return {field: self._values(i, cells[i]).item() for i, field in enumerate(FIELDS)}
+
+    def record(self, owner, opponent, segment=None):
+        """
+        Record of owner against opponent
+
+        Args:
+            segment: 'regular_season', 'playoffs' or None for both combined
+        """
+        i, j = self.index.get(owner), self.index.get(opponent)
+        if i is None or j is None:
+            return self._record(np.zeros(len(FIELDS)))
+        return self._record(self._totals(segment)[:, i, j])
+
+    def to_nested(self, segment=None):
+        """owner -> opponent -> record for every pair that met, in owner order"""
+        totals = self._totals(segment)
+        games = totals[:COUNT_FIELDS].sum(axis=0)
+        nested = {}
+        for i, j in zip(*np.nonzero(games)):
+            nested.setdefault(self.owners[i], {})[self.owners[j]] = self._record(totals[:, i, j])
+        return nested
+
+    def win_loss_matrix(self, owners):
+        """'W-L' (or 'W-L-T' with ties) of every owner against every other, '-' against themselves"""
+        totals = self._totals()
+        rows = []
+        for owner in owners:
+            row = []
+            for opponent in owners:
+                if owner == opponent:
+                    row.append('-')
+                    continue
+                wins, losses, ties = (int(value) for value in
+                                      totals[:COUNT_FIELDS, self.index[owner], self.index[opponent]])
+                row.append(f"{wins}-{losses}-{ties}" if ties > 0 else f"{wins}-{losses}")
+            rows.append(row)
+        return rows
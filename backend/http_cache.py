@@ -0,0 +1,207 @@
+"""
+HTTP Response Cache
+
+Content-addressed on-disk cache for the GET requests made by espn_api and
+SleeperExtractor. Responses are stored under a hash of the request, so runs can
+be recorded once and replayed later without any network access.
+
+Modes:
+    record - serve fresh cached responses, fetch and store everything else
+    replay - serve only recorded responses (stale or not); a miss is an error
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import requests
+
+BASE_DIR = Path(__file__).parent.parent
+HTTP_CACHE_DIR = BASE_DIR / 'data' / 'cache' / 'http'
+
+DEFAULT_TTL = 24 * 60 * 60  # seconds
+
+# ESPN encodes the season in the path (modern seasons) or query (leagueHistory)
+SEASON_PATTERN = re.compile(r'/seasons/(\d{4})/|seasonId=(\d{4})')
+
+
+def season_closed_at(year):
+    """When an ESPN season's results stop changing: fantasy seasons wrap up by early January of the following year"""
+    return datetime(year + 1, 2, 1)
+
+
+class CacheMissError(Exception):
+    """Raised in replay mode when a request was never recorded"""
+
+
+class CachedResponse:
+    """Recorded response exposing the parts of requests.Response the extractors use"""
+
+    def __init__(self, url, status_code, text):
+        self.url = url
+        self.status_code = status_code
+        self.text = text
+        self.from_cache = True
+
+    @property
+    def content(self):
+        return self.text.encode('utf-8')
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class ResponseCache:
+    """On-disk response cache with TTL, record/replay modes and hit/miss stats"""
+
+    MODES = ('record', 'replay')
+
+    def __init__(self, cache_dir=HTTP_CACHE_DIR, mode='record', ttl=DEFAULT_TTL):
+        """
+        Args:
+            cache_dir: Directory holding recorded responses
+            mode: 'record' or 'replay'
+            ttl: Seconds a recorded response stays fresh in record mode (None = forever).
+                Responses recorded after an ESPN season ended never expire.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown cache mode '{mode}' (expected one of {self.MODES})")
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.mode = mode
+        self.ttl = ttl
+        self.stats = {'hits': 0, 'misses': 0, 'expired': 0, 'stored': 0}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def request_key(url, params=None, headers=None):
+        """Hash a request into a stable cache key (cookies are deliberately excluded)"""
+        canonical = json.dumps(
+            {'method': 'GET', 'url': url, 'params': params or {}, 'headers': headers or {}},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return self.cache_dir / key[:2] / f'{key}.json'
+
+    @staticmethod
+    def _is_closed_season(url, stored_at):
+        """
+        True if the request is for an ESPN season that had already ended when
+        the response was recorded (see season_closed_at)
+        """
+        match = SEASON_PATTERN.search(url)
+        if not match:
+            return False
+        year = int(match.group(1) or match.group(2))
+        return stored_at >= season_closed_at(year).timestamp()
+
+    def _is_fresh(self, entry, url):
+        if self.ttl is None or self._is_closed_season(url, entry['stored_at']):
+            return True
+        return time.time() - entry['stored_at'] < self.ttl
+
+    def _count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def lookup(self, url, params=None, headers=None):
+        """Return the recorded response for a request, or None"""
+        path = self._path(self.request_key(url, params, headers))
+        if not path.exists():
+            return None
+
+        with open(path, 'r') as f:
+            entry = json.load(f)
+
+        if self.mode == 'record' and not self._is_fresh(entry, url):
+            self._count('expired')
+            return None
+
+        return CachedResponse(entry['url'], entry['status_code'], entry['body'])
+
+    def store(self, url, params, headers, response):
+        """
+        Record a response. Only successes (2xx) are stored: errors such as a
+        401 from expired cookies or a 404 for a season that doesn't exist yet
+        would otherwise be replayed for the whole TTL.
+        """
+        if not 200 <= response.status_code < 300:
+            return
+
+        path = self._path(self.request_key(url, params, headers))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            'url': url,
+            'params': params,
+            'status_code': response.status_code,
+            'stored_at': time.time(),
+            'body': response.text,
+        }
+
+        # Write atomically so parallel extraction never sees a partial file
+        tmp_path = path.with_suffix(f'.{threading.get_ident()}.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(entry, f, default=str)
+        os.replace(tmp_path, path)
+        self._count('stored')
+
+    def get(self, get_func, url, params=None, headers=None, **kwargs):
+        """Serve a GET from the cache, falling back to get_func in record mode"""
+        cached = self.lookup(url, params, headers)
+        if cached is not None:
+            self._count('hits')
+            return cached
+
+        self._count('misses')
+        if self.mode == 'replay':
+            raise CacheMissError(f"No recorded response for {url} (params={params})")
+
+        response = get_func(url, params=params, headers=headers, **kwargs)
+        self.store(url, params, headers, response)
+        return response
+
+    def wrap(self, get_func):
+        """Return a requests.get-compatible function that goes through this cache"""
+        def cached_get(url, params=None, headers=None, **kwargs):
+            return self.get(get_func, url, params=params, headers=headers, **kwargs)
+        return cached_get
+
+    def report(self):
+        """One-line summary of cache activity"""
+        lookups = self.stats['hits'] + self.stats['misses']
+        hit_rate = (self.stats['hits'] / lookups * 100) if lookups else 0
+        return (f"HTTP cache ({self.mode}): {self.stats['hits']} hits, {self.stats['misses']} misses "
+                f"({hit_rate:.1f}% hit rate), {self.stats['expired']} expired, {self.stats['stored']} stored")
+
+
+class _RequestsProxy:
+    """Stands in for the requests module inside espn_api, routing get() elsewhere"""
+
+    def __init__(self, get):
+        self.get = get
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+def install_espn_transport(get):
+    """Route every HTTP GET made by espn_api through `get`"""
+    from espn_api.requests import espn_requests
+    espn_requests.requests = _RequestsProxy(get)
@@ -0,0 +1,55 @@
+"""
+Owner Aliases
+
+Display names and usernames seen in ESPN and Sleeper data, mapped to each
+owner's actual name. Kept apart from the extractors so the processor can
+resolve owners without importing them.
+"""
+
+# Username mapping from Sleeper to standardized owner names
+USERNAME_MAPPING = {
+    'Brydome17': 'Bryan Whitaker',
+    'FortyChiners': 'Brendan Romale',
+    'JeremySettles13': 'Jeremy Settles',
+    'KCoffis': 'Kellen Coffis',
+    'LunaCorp': 'Jacob Luna',
+    'NamasYe': 'Chris Vitale',
+    'RapmasterRordogg': 'Rory McKee',
+    'SmiPi': 'Nick Smielak',
+    'T1GHTSTEVE': 'Steve Keller',
+    'gchildnl': 'Garrett Ulrich',
+    'gswens83': 'Greg Swenson',
+    'jamiecoffis': 'Jamie Coffis',
+    'kpop': 'Kyle Poppen',
+    'milmansion': 'Ryan Milhous'
+}
+
+# Owner display name to actual name mapping
+OWNER_NAME_MAPPING = {
+    'scson': 'Chris Vitale',
+    'Kcoff07': 'Kellen Coffis',
+    'Jamie Coffis': 'Jamie Coffis',
+    'touchcoffis86': 'Jamie Coffis',  # Old username (2010-2019)
+    'gchildnl': 'Garrett Ulrich',
+    'gswens83': 'Greg Swenson',
+    'JeremySettles13': 'Jeremy Settles',
+    '2muchdutch': 'Nick Smielak',
+    'RapmasterRordogg': 'Rory McKee',
+    'jmluna5020': 'Jacob Luna',
+    '17whitaker': 'Bryan Whitaker',
+    'brom66': 'Brendan Romele',
+    'Brendan Romale': 'Brendan Romele',  # Fix typo in raw data
+    'Ryan Milhous': 'Ryan Milhous',
+    'kweezy31': 'Kyle Morris',  # 2010-2019
+    'HIS TIGHTNESS': 'Ben Beck',
+    'kpop027': 'Kyle Poppen',
+    'Benbasketball101': 'Ben Beck',  # Alternative username for Ben Beck
+    'bvitale1313': 'Brian Vitale',  # 2010-2014
+    'bryanvitale': 'Brian Vitale',  # 2017
+    '12inchnick': 'Nick Smielak',  # 2010-2012
+    'TPUSNESS': 'Tyler Fullerton',  # 2010-2014
+    'pkentstoll': 'Peter Kent-Stoll',
+    'DylanAndr3ws': 'Dylan Andrews',
+    'SLVBaller3189': 'Tanner Clark',
+    'ilovebammer24': 'Tanner Clark'
+}
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Playoff Odds Simulator
+
+Monte Carlo seeding under shuffled schedules. Each season's regular season
+scores (FantasyDataProcessor.season_score_matrix) stay as they were and only
+who played whom is redrawn: every simulated week pairs the teams at random.
+Seeds go to the most wins (ties count half), then the most points for, and
+each season's playoff_team_count (processed_data['playoffs']) make the playoffs.
+
+    simulate_seasons        - seed distribution, playoff odds and schedule
+                              luck of every team in every season
+    simulate_current_season - mid-season playoff odds for the latest season:
+                              weeks played so far count as they happened, and
+                              each remaining week resamples every team's score
+                              from its own played weeks
+
+Simulations run in vectorized NumPy batches, optionally spread over worker
+processes. Every batch draws from its own child of one SeedSequence, so a
+seed gives the same odds however many processes run the batches.
+
+Usage:
+    python playoff_simulator.py
+    python playoff_simulator.py --simulations 50000 --jobs 4 --seed 7
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import groupby
+
+import numpy as np
+
+from data_processor import PROCESSED_DATA_DIR, FantasyDataProcessor
+
+DEFAULT_SIMULATIONS = 20000
+BATCH_SIZE = 2000  # simulations per vectorized batch
+PLAYOFF_TEAMS = 6  # for seasons processed without a playoff_team_count
+
+
+def _pairing_results(rng, week_scores):
+    """
+    Wins and ties of every team over weeks of random pairings
+
+    Args:
+        week_scores: simulations x weeks x teams scores. With an odd number of
+            teams one team sits out each week, and a NaN score (a week the
+            team didn't play) gives neither side a result.
+
+    Returns:
+        (wins, ties): simulations x teams counts
+    """
+    simulations, weeks, teams = week_scores.shape
+    if teams % 2:
+        week_scores = np.concatenate((week_scores, np.full((simulations, weeks, 1), np.nan)), axis=2)
+    slots = week_scores.shape[2]
+
+    # Slots 0-1, 2-3, ... play each other; order[s, w, slot] is the team in a slot
+    order = rng.permuted(np.broadcast_to(np.arange(slots), (simulations, weeks, slots)), axis=2)
+    pairs = np.take_along_axis(week_scores, order, axis=2).reshape(simulations, weeks, slots // 2, 2)
+    margin = pairs[..., 0] - pairs[..., 1]
+
+    # Slot results, scattered back to the teams in those slots
+    wins = np.empty(order.shape, dtype=bool)
+    np.put_along_axis(wins, order, np.stack((margin > 0, margin < 0), axis=-1).reshape(order.shape), axis=2)
+    ties = np.empty(order.shape, dtype=bool)
+    np.put_along_axis(ties, order, np.repeat(margin == 0, 2, axis=-1), axis=2)
+    return wins.sum(axis=1)[:, :teams], ties.sum(axis=1)[:, :teams]
+
+
+def _seeds(wins, points_for):
+    """
+    1-based seed of every team in every simulation (simulations x teams):
+    most wins, then most points for, then team order
+    """
+    points_for = np.broadcast_to(points_for, wins.shape)
+    order = np.lexsort((-points_for, -wins), axis=-1)
+    seeds = np.empty(wins.shape, dtype=np.int64)
+    np.put_along_axis(seeds, order, np.broadcast_to(np.arange(1, wins.shape[-1] + 1), wins.shape), axis=-1)
+    return seeds
+
+
+def _simulate_batch(scores, simulations, seed, fixed=None, remaining_weeks=0):
+    """
+    One batch of simulated seasons
+
+    Args:
+        scores: weeks x teams regular season scores
+        simulations: Seasons to simulate
+        seed: SeedSequence the batch draws from
+        fixed: None to reshuffle every week of scores; for a season in
+            progress, (wins, points_for) of each team so far, with scores
+            the weeks played
+        remaining_weeks: Weeks left to simulate when fixed is given
+
+    Returns:
+        (seed_counts, win_totals): teams x teams count of each team finishing
+        at each seed, and each team's simulated wins summed over the batch
+    """
+    rng = np.random.default_rng(seed)
+    teams = scores.shape[1]
+    if fixed is None:
+        week_scores = np.broadcast_to(scores, (simulations, *scores.shape))
+        wins, points_for = 0, np.nansum(scores, axis=0)
+    else:
+        # Every remaining week, each team scores like one of its played weeks
+        drawn = rng.integers(0, scores.shape[0], size=(simulations, remaining_weeks, teams))
+        week_scores = scores[drawn, np.arange(teams)]
+        wins, points_for = fixed[0], fixed[1] + np.nansum(week_scores, axis=1)
+
+    pairing_wins, pairing_ties = _pairing_results(rng, week_scores)
+    wins = wins + pairing_wins + 0.5 * pairing_ties
+    seeds = _seeds(wins, points_for)
+    seed_counts = np.bincount((np.arange(teams) * teams + seeds - 1).ravel(), minlength=teams * teams)
+    return seed_counts.reshape(teams, teams), wins.sum(axis=0)
+
+
+class PlayoffSimulator:
+    """Seed distributions and playoff odds from shuffled schedules"""
+
+    def __init__(self, simulations=DEFAULT_SIMULATIONS, playoff_teams=None, seed=None,
+                 batch_size=BATCH_SIZE, jobs=1):
+        """
+        Args:
+            simulations: Seasons simulated per report
+            playoff_teams: Seeds that make the playoffs in every season
+                (default: each season's playoff_team_count)
+            seed: RNG seed (None for fresh entropy). Results for a seed
+                depend on simulations and batch_size, not on jobs.
+            batch_size: Simulations per vectorized batch (bounds memory)
+            jobs: Worker processes to run batches in (1 = in this process)
+        """
+        self.simulations = max(1, simulations)
+        self.playoff_teams = playoff_teams
+        self.seed = seed
+        self.batch_size = max(1, batch_size)
+        self.jobs = max(1, jobs or 1)
+
+    def run(self, scores, fixed=None, remaining_weeks=0):
+        """
+        Simulate self.simulations seasons in batches (see _simulate_batch);
+        returns the summed (seed_counts, win_totals)
+        """
+        sizes = [min(self.batch_size, self.simulations - start) for start in range(0, self.simulations, self.batch_size)]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        count = len(sizes)
+
+        batches = None
+        if self.jobs > 1 and count > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=min(self.jobs, count)) as executor:
+                    batches = list(executor.map(_simulate_batch, [scores] * count, sizes, seeds,
+                                                [fixed] * count, [remaining_weeks] * count))
+            except (OSError, NotImplementedError, BrokenProcessPool) as e:
+                print(f"⚠ Process pool unavailable ({e}); simulating serially")
+        if batches is None:
+            batches = [_simulate_batch(scores, size, seed, fixed, remaining_weeks) for size, seed in zip(sizes, seeds)]
+
+        seed_counts = sum(counts for counts, _ in batches)
+        win_totals = sum(totals for _, totals in batches)
+        return seed_counts, win_totals
+
+    @staticmethod
+    def _owners(processed_data):
+        """(year, team_id) -> owner from the luck rows, first row wins on duplicate ids"""
+        owners = {}
+        for row in processed_data.get('luck', []):
+            owners.setdefault((row['year'], row['team_id']), row['owner'])
+        return owners
+
+    def _playoff_teams(self, processed_data):
+        """
+        year -> seeds that make the playoffs: the override given to the
+        simulator, else each season's playoff_team_count
+        """
+        playoff_teams = {}
+        for playoff in processed_data.get('playoffs', []):
+            playoff_teams[playoff['year']] = self.playoff_teams or playoff.get('playoff_team_count') or PLAYOFF_TEAMS
+        return playoff_teams
+
+    def _report(self, year, matrix, owners, wins, points_for, seed_counts, win_totals, playoff_teams):
+        """
+        One season's teams ordered by actual seed, with their simulated seed
+        distribution, playoff odds (the top playoff_teams seeds) and mean wins
+        """
+        actual_seeds = _seeds(wins[np.newaxis], points_for[np.newaxis])[0]
+        odds = seed_counts / self.simulations * 100
+        teams = []
+        for i, team_id in enumerate(matrix['team_ids'].tolist()):
+            mean_wins = win_totals[i] / self.simulations
+            teams.append({
+                'team_id': team_id,
+                'team_name': matrix['team_names'][team_id],
+                'owner': owners.get((year, team_id), matrix['team_names'][team_id]),
+                'wins': float(wins[i]),
+                'points_for': round(float(points_for[i]), 2),
+                'seed': int(actual_seeds[i]),
+                'mean_wins': round(float(mean_wins), 2),
+                'schedule_luck': round(float(wins[i] - mean_wins), 2),
+                'playoff_odds': round(float(odds[i, :playoff_teams].sum()), 1),
+                'seed_odds': [round(float(pct), 1) for pct in odds[i]]
+            })
+        return sorted(teams, key=lambda x: x['seed'])
+
+    @staticmethod
+    def _actual(matrix):
+        """Actual (wins, points_for) of each team in a season_score_matrix; ties count half"""
+        results = matrix['results']
+        return results[0] + 0.5 * results[2], np.nansum(matrix['scores'], axis=0)
+
+    def simulate_seasons(self, processed_data, years=None):
+        """
+        Seed distribution, playoff odds and schedule luck (actual wins minus
+        mean simulated wins) of every team, with the whole regular season's
+        schedule reshuffled
+
+        Args:
+            processed_data: FantasyDataProcessor.processed_data (matchups,
+                playoffs for playoff team counts and luck for owner names)
+            years: Seasons to simulate (default: all)
+
+        Returns:
+            One report per season, in matchup order
+        """
+        owners = self._owners(processed_data)
+        playoff_teams = self._playoff_teams(processed_data)
+        reports = []
+        for year, matchups in groupby(processed_data['matchups'], key=lambda x: x['year']):
+            if years is not None and year not in years:
+                continue
+            matrix = FantasyDataProcessor.season_score_matrix(FantasyDataProcessor.played_matchups(matchups))
+            if matrix is None:
+                continue
+
+            wins, points_for = self._actual(matrix)
+            seed_counts, win_totals = self.run(matrix['scores'])
+            season_playoff_teams = playoff_teams.get(year, self.playoff_teams or PLAYOFF_TEAMS)
+            reports.append({
+                'year': year,
+                'weeks': len(matrix['weeks']),
+                'playoff_teams': season_playoff_teams,
+                'teams': self._report(year, matrix, owners, wins, points_for, seed_counts, win_totals,
+                                      season_playoff_teams)
+            })
+        return reports
+
+    def simulate_current_season(self, processed_data, regular_season_weeks=None):
+        """
+        Playoff odds for the latest season from the weeks played so far
+
+        Args:
+            processed_data: FantasyDataProcessor.processed_data
+            regular_season_weeks: Length of the regular season (default: the
+                previous season's)
+
+        Returns:
+            Report for the latest season with weeks_played and weeks_remaining,
+            or None without regular season matchups. Playoff odds use the
+            season's playoff_team_count, or the latest earlier season's.
+        """
+        seasons = {year: FantasyDataProcessor.played_matchups(matchups)
+                   for year, matchups in groupby(processed_data['matchups'], key=lambda x: x['year'])}
+        if not seasons:
+            return None
+        year = max(seasons)
+        matrix = FantasyDataProcessor.season_score_matrix(seasons[year])
+        if matrix is None:
+            return None
+
+        weeks_played = len(matrix['weeks'])
+        if regular_season_weeks is None:
+            previous = FantasyDataProcessor.season_score_matrix(seasons.get(year - 1, []))
+            regular_season_weeks = len(previous['weeks']) if previous is not None else weeks_played
+        weeks_remaining = max(0, regular_season_weeks - weeks_played)
+
+        counts = self._playoff_teams(processed_data)
+        known = [count_year for count_year in counts if count_year <= year]
+        playoff_teams = counts[max(known)] if known else self.playoff_teams or PLAYOFF_TEAMS
+
+        wins, points_for = self._actual(matrix)
+        seed_counts, win_totals = self.run(matrix['scores'], (wins, points_for), weeks_remaining)
+        return {
+            'year': year,
+            'weeks_played': weeks_played,
+            'weeks_remaining': weeks_remaining,
+            'playoff_teams': playoff_teams,
+            'teams': self._report(year, matrix, self._owners(processed_data), wins, points_for, seed_counts, win_totals,
+                                  playoff_teams)
+        }
+
+
+def main():
+    """Simulate every season and the current one from the processed data"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Monte Carlo playoff odds from shuffled schedules')
+    parser.add_argument('--simulations', type=int, default=DEFAULT_SIMULATIONS,
+                        help=f'Simulated seasons per report (default: {DEFAULT_SIMULATIONS})')
+    parser.add_argument('--playoff-teams', type=int, default=None,
+                        help="Seeds that make the playoffs in every season (default: each season's playoff_team_count)")
+    parser.add_argument('--weeks', type=int, default=None,
+                        help="Regular season length for the current season (default: the previous season's)")
+    parser.add_argument('--seed', type=int, default=None, help='RNG seed for reproducible odds')
+    parser.add_argument('--jobs', type=int, default=1, help='Worker processes to simulate in (default: 1)')
+    args = parser.parse_args()
+
+    processor = FantasyDataProcessor()
+    if not processor.load_processed_data():
+        print("No processed data found. Run 'python data_processor.py' first.")
+        return
+
+    simulator = PlayoffSimulator(args.simulations, args.playoff_teams, args.seed, jobs=args.jobs)
+    print(f"\n=== Simulating {args.simulations} schedules per season ===\n")
+    odds = {
+        'simulations': args.simulations,
+        'playoff_teams': args.playoff_teams,
+        'seed': args.seed,
+        'seasons': simulator.simulate_seasons(processor.processed_data),
+        'current_season': simulator.simulate_current_season(processor.processed_data, args.weeks)
+    }
+    print(f"✓ Simulated {len(odds['seasons'])} seasons")
+
+    current = odds['current_season']
+    if current:
+        print(f"\n{current['year']} playoff odds after {current['weeks_played']} weeks "
+              f"({current['weeks_remaining']} remaining):")
+        for team in current['teams']:
+            print(f"  {team['seed']:>2}. {team['owner']:<24} {team['wins']:>5g} W  {team['playoff_odds']:5.1f}%")
+
+    path = PROCESSED_DATA_DIR / 'playoff_odds.json'
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(odds, f, indent=2)
+    os.replace(tmp_path, path)
+    print(f"\n✓ Saved playoff odds to {path}\n")
+
+
+if __name__ == '__main__':
+    main()
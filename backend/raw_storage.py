@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Raw Season Storage
+
+Reads and writes the raw season_{year} files in any of these formats:
+
+    json  - season_{year}.json, pretty-printed (original format)
+    gzip  - season_{year}.ndjson.gz, gzip-compressed NDJSON
+    zstd  - season_{year}.ndjson.zst, zstd-compressed NDJSON (requires zstandard)
+
+NDJSON files hold a header line with the season's scalar fields, teams, draft,
+rosters and settings, followed by one line per matchup and one per player stat.
+Loaders find whichever format exists, so callers never need to know which one
+was written.
+
+Usage (migrate existing files):
+    python raw_storage.py --format gzip
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+try:
+    import zstandard
+except ImportError:  # Optional: only needed for the zstd format
+    zstandard = None
+
+# RAW_DATA_FORMAT may come from .env
+load_dotenv()
+
+BASE_DIR = Path(__file__).parent.parent
+RAW_DATA_DIR = BASE_DIR / 'data' / 'raw'
+
+FORMAT_SUFFIXES = {
+    'json': '.json',
+    'gzip': '.ndjson.gz',
+    'zstd': '.ndjson.zst',
+}
+DEFAULT_FORMAT = os.getenv('RAW_DATA_FORMAT', 'json')
+
+# Sections written one record per line after the header
+STREAMED_SECTIONS = ('matchups', 'player_stats')
+
+SEASON_FILE_PATTERN = re.compile(r'^season_(\d{4})(\.json|\.ndjson\.gz|\.ndjson\.zst)$')
+
+
+def season_path(year, fmt=DEFAULT_FORMAT, raw_dir=RAW_DATA_DIR):
+    """Path of a season file in the given format"""
+    if fmt not in FORMAT_SUFFIXES:
+        raise ValueError(f"Unknown raw data format '{fmt}' (expected one of {list(FORMAT_SUFFIXES)})")
+    return Path(raw_dir) / f'season_{year}{FORMAT_SUFFIXES[fmt]}'
+
+
+def _season_files(raw_dir):
+    """Yield (year, path) for every season file in any format"""
+    raw_dir = Path(raw_dir)
+    if not raw_dir.exists():
+        return
+    for path in raw_dir.iterdir():
+        match = SEASON_FILE_PATTERN.match(path.name)
+        if match:
+            yield int(match.group(1)), path
+
+
+def find_season_file(year, raw_dir=RAW_DATA_DIR):
+    """Most recently written file for a season, or None"""
+    paths = [path for file_year, path in _season_files(raw_dir) if file_year == year]
+    if not paths:
+        return None
+    return max(paths, key=lambda p: p.stat().st_mtime)
+
+
+def available_years(raw_dir=RAW_DATA_DIR):
+    """Sorted years that have a season file in any format"""
+    return sorted({year for year, _ in _season_files(raw_dir)})
+
+
+def season_hash(year, raw_dir=RAW_DATA_DIR):
+    """SHA-256 of the file load_season would read for a season, or None"""
+    path = find_season_file(year, raw_dir)
+    if path is None:
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _open_compressed(path, mode, fmt):
+    """Open a gzip or zstd NDJSON file for text reading ('r') or writing ('w')"""
+    if fmt == 'gzip':
+        return gzip.open(path, mode + 't', encoding='utf-8', compresslevel=6)
+
+    if zstandard is None:
+        raise RuntimeError("The zstd raw format requires the 'zstandard' package (pip install zstandard)")
+    if mode == 'r':
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(open(path, 'rb')), encoding='utf-8')
+    return io.TextIOWrapper(zstandard.ZstdCompressor(level=10).stream_writer(open(path, 'wb')), encoding='utf-8')
+
+
+def _write_ndjson(path, data, fmt):
+    header = {key: value for key, value in data.items() if key not in STREAMED_SECTIONS}
+    header['_sections'] = {section: len(data.get(section, [])) for section in STREAMED_SECTIONS}
+
+    with _open_compressed(path, 'w', fmt) as f:
+        f.write(json.dumps(header, separators=(',', ':')) + '\n')
+        for section in STREAMED_SECTIONS:
+            for record in data.get(section, []):
+                f.write(json.dumps(record, separators=(',', ':')) + '\n')
+
+
+def _read_ndjson(path):
+    fmt = 'gzip' if path.name.endswith('.gz') else 'zstd'
+    with _open_compressed(path, 'r', fmt) as f:
+        data = json.loads(f.readline())
+        sections = data.pop('_sections')
+        for section in STREAMED_SECTIONS:
+            data[section] = [json.loads(f.readline()) for _ in range(sections.get(section, 0))]
+    return data
+
+
+def save_season(year, data, fmt=DEFAULT_FORMAT, raw_dir=RAW_DATA_DIR):
+    """
+    Write a season in the given format and remove copies in other formats,
+    so loaders never see a stale file. Returns the written path.
+    """
+    path = season_path(year, fmt, raw_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+
+    if fmt == 'json':
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+    else:
+        _write_ndjson(tmp_path, data, fmt)
+    os.replace(tmp_path, path)
+
+    for file_year, other in _season_files(raw_dir):
+        if file_year == year and other != path:
+            other.unlink()
+
+    return path
+
+
+def load_season(year, raw_dir=RAW_DATA_DIR):
+    """Load a season from whichever format exists, or None"""
+    path = find_season_file(year, raw_dir)
+    if path is None:
+        return None
+
+    if path.suffix == '.json':
+        with open(path, 'r') as f:
+            return json.load(f)
+    return _read_ndjson(path)
+
+
+def migrate(fmt, raw_dir=RAW_DATA_DIR):
+    """Rewrite every season file in the given format; returns (bytes before, bytes after)"""
+    before = after = 0
+    for year in available_years(raw_dir):
+        old_path = find_season_file(year, raw_dir)
+        size = old_path.stat().st_size
+        data = load_season(year, raw_dir)
+        new_path = save_season(year, data, fmt, raw_dir)
+        before += size
+        after += new_path.stat().st_size
+        print(f"  {year}: {old_path.name} ({size / 1024:.0f} KB) -> {new_path.name} "
+              f"({new_path.stat().st_size / 1024:.0f} KB)")
+    return before, after
+
+
+def main():
+    """Migrate existing raw season files to another format"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Convert raw season files between storage formats')
+    parser.add_argument('--format', choices=list(FORMAT_SUFFIXES), default='gzip',
+                        help='Target format (default: gzip)')
+    args = parser.parse_args()
+
+    print(f"=== Migrating raw season files to {args.format} ===\n")
+    before, after = migrate(args.format)
+    if before:
+        print(f"\n✓ {before / 1024:.0f} KB -> {after / 1024:.0f} KB ({after / before * 100:.0f}%)")
+    else:
+        print("No raw season files found.")
+
+
+if __name__ == '__main__':
+    main()
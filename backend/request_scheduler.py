@@ -0,0 +1,153 @@
+"""
+Request Scheduler
+
+Shared rate limiting for the ESPN and Sleeper extractors: a token bucket caps
+the request rate, a semaphore caps concurrent requests, and throttled or failed
+requests are retried with jittered exponential backoff.
+"""
+
+import random
+import threading
+import time
+
+import requests
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_EXCEPTIONS = (requests.ConnectionError, requests.Timeout)
+
+
+class RequestScheduler:
+    """Token bucket + concurrency cap + retry with backoff, shared across threads"""
+
+    def __init__(self, rate=10.0, burst=20, max_concurrency=8, max_retries=5,
+                 base_delay=0.5, max_delay=30.0, seed=None):
+        """
+        Args:
+            rate: Sustained requests per second (None = unlimited)
+            burst: Requests allowed back-to-back before the rate applies
+            max_concurrency: Maximum requests in flight at once
+            max_retries: Retries after the first attempt before giving up
+            base_delay: Backoff before the first retry, doubled on each attempt
+            max_delay: Upper bound on a single backoff
+            seed: Optional seed for the backoff jitter
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._bucket_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._rng = random.Random(seed)
+
+        self._metrics_lock = threading.Lock()
+        self.metrics = {
+            'requests': 0,      # attempts sent, including retries
+            'throttled': 0,     # attempts that had to wait for a token
+            'rate_limited': 0,  # 429 responses from the server
+            'retried': 0,       # attempts that were retried
+            'failed': 0,        # calls that still failed after all retries
+            'wait_seconds': 0.0,
+        }
+
+    def _record(self, metric, amount=1):
+        with self._metrics_lock:
+            self.metrics[metric] += amount
+
+    def _take_token(self):
+        """Block until the bucket has a token; returns seconds spent waiting"""
+        if not self.rate:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._bucket_lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def backoff(self, attempt, retry_after=None):
+        """Full-jitter exponential backoff, never shorter than a server Retry-After"""
+        delay = self._rng.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    @staticmethod
+    def _retry_after(response):
+        try:
+            return float(response.headers.get('Retry-After'))
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+    def call(self, func, *args, **kwargs):
+        """
+        Run func under the rate limit, retrying connection errors, timeouts and
+        retryable HTTP statuses. After the last retry a retryable response is
+        returned (and an exception re-raised) for the caller to handle.
+        """
+        for attempt in range(self.max_retries + 1):
+            waited = self._take_token()
+            if waited:
+                self._record('throttled')
+                self._record('wait_seconds', waited)
+
+            with self._slots:
+                self._record('requests')
+                try:
+                    response = func(*args, **kwargs)
+                except RETRY_EXCEPTIONS:
+                    if attempt == self.max_retries:
+                        self._record('failed')
+                        raise
+                    retry_after = None
+                else:
+                    status = getattr(response, 'status_code', None)
+                    if status not in RETRY_STATUSES:
+                        return response
+                    if status == 429:
+                        self._record('rate_limited')
+                    if attempt == self.max_retries:
+                        self._record('failed')
+                        return response
+                    retry_after = self._retry_after(response)
+
+            self._record('retried')
+            delay = self.backoff(attempt, retry_after)
+            self._record('wait_seconds', delay)
+            time.sleep(delay)
+
+    def wrap(self, get_func):
+        """Return a requests.get-compatible function that goes through this scheduler"""
+        def scheduled_get(url, *args, **kwargs):
+            return self.call(get_func, url, *args, **kwargs)
+        return scheduled_get
+
+    def report(self):
+        """One-line summary of scheduler activity"""
+        m = self.metrics
+        return (f"Requests: {m['requests']} sent, {m['throttled']} throttled, {m['rate_limited']} rate limited, "
+                f"{m['retried']} retried, {m['failed']} failed ({m['wait_seconds']:.1f}s waiting)")
+
+
+_shared_scheduler = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_scheduler():
+    """Scheduler shared by every extractor in the process unless one is passed in"""
+    global _shared_scheduler
+    with _shared_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = RequestScheduler()
+        return _shared_scheduler
@@ -10,11 +10,16 @@ Runs the complete data pipeline:
 
 import sys
 from data_extractor import ESPNDataExtractor
+from http_cache import ResponseCache, DEFAULT_TTL
+from raw_storage import DEFAULT_FORMAT, FORMAT_SUFFIXES
+from request_scheduler import RequestScheduler
 from data_processor import FantasyDataProcessor
 from excel_generator import ExcelGenerator
 
 
-def run_pipeline(start_year=None, end_year=None, force_refresh=False):
+def run_pipeline(start_year=None, end_year=None, force_refresh=False, workers=1, incremental=False,
+                 http_cache=None, cache_ttl=DEFAULT_TTL, rate_limit=10.0, max_concurrency=8,
+                 batch_views=False, raw_format=DEFAULT_FORMAT, fused=False, jobs=1):
     """Run the complete data pipeline"""
 
     print("\n" + "=" * 60)
@@ -24,11 +29,17 @@ def run_pipeline(start_year=None, end_year=None, force_refresh=False):
     # Step 1: Extract data
     print("STEP 1: Extracting data from ESPN API...")
     print("-" * 60)
-    extractor = ESPNDataExtractor()
+    cache = ResponseCache(mode=http_cache, ttl=cache_ttl) if http_cache else None
+    scheduler = RequestScheduler(rate=rate_limit, max_concurrency=max_concurrency)
+    extractor = ESPNDataExtractor(http_cache=cache, scheduler=scheduler, batch_views=batch_views,
+                                  raw_format=raw_format)
+    extractor.install_transport()
     successful, failed = extractor.extract_all_seasons(
         start_year=start_year,
         end_year=end_year,
-        force_refresh=force_refresh
+        force_refresh=force_refresh,
+        workers=workers,
+        incremental=incremental
     )
 
     if not successful:
@@ -40,8 +51,12 @@ def run_pipeline(start_year=None, end_year=None, force_refresh=False):
     print("\nSTEP 2: Processing data...")
     print("-" * 60)
     processor = FantasyDataProcessor()
-    processor.load_raw_data()
-    processor.process_all()
+    if incremental:
+        # Only seasons whose raw file changed are reprocessed
+        processor.process_incremental(jobs=jobs)
+    else:
+        processor.load_raw_data()
+        processor.process_all(jobs=jobs, fused=fused)
     processor.save_processed_data()
 
     # Step 3: Generate Excel
@@ -72,13 +87,42 @@ def main():
     parser.add_argument('--start-year', type=int, help='First year to extract (default: 2014)')
     parser.add_argument('--end-year', type=int, help='Last year to extract (default: current year)')
     parser.add_argument('--force-refresh', action='store_true', help='Re-fetch data even if cached')
+    parser.add_argument('--incremental', action='store_true', help='Only fetch missing or live weeks of in-progress seasons and '
+                             'only reprocess seasons whose raw data changed')
+    parser.add_argument('--http-cache', choices=ResponseCache.MODES,
+                        help='Record ESPN responses to, or replay them from, the on-disk HTTP cache')
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_TTL / 3600,
+                        help='Hours a recorded response stays fresh (default: 24, responses recorded after a season ended never expire)')
+    parser.add_argument('--rate-limit', type=float, default=10.0,
+                        help='Maximum API requests per second (default: 10)')
+    parser.add_argument('--max-concurrency', type=int, default=8,
+                        help='Maximum API requests in flight at once (default: 8)')
+    parser.add_argument('--batch-views', action='store_true',
+                        help='Fetch several weeks per request from raw ESPN schedule views')
+    parser.add_argument('--raw-format', choices=list(FORMAT_SUFFIXES), default=DEFAULT_FORMAT,
+                        help=f'Storage format for raw season files (default: {DEFAULT_FORMAT})')
+    parser.add_argument('--workers', type=int, default=1, help='Number of seasons to extract in parallel (default: 1)')
+    parser.add_argument('--fused', action='store_true',
+                        help='Process each season in a single visit instead of stage by stage (same output)')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Process seasons in this many worker processes (default: 1, same output)')
 
     args = parser.parse_args()
 
     success = run_pipeline(
         start_year=args.start_year,
         end_year=args.end_year,
-        force_refresh=args.force_refresh
+        force_refresh=args.force_refresh,
+        workers=args.workers,
+        incremental=args.incremental,
+        http_cache=args.http_cache,
+        cache_ttl=args.cache_ttl * 3600,
+        rate_limit=args.rate_limit,
+        max_concurrency=args.max_concurrency,
+        batch_views=args.batch_views,
+        raw_format=args.raw_format,
+        fused=args.fused,
+        jobs=args.jobs
     )
 
     sys.exit(0 if success else 1)
@@ -5,92 +5,198 @@ Extracts fantasy football data from Sleeper API and saves to JSON
 """
 
 import requests
+import gzip
 import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any
 
+from http_cache import ResponseCache, DEFAULT_TTL
+from owner_aliases import USERNAME_MAPPING
+from raw_storage import DEFAULT_FORMAT, FORMAT_SUFFIXES, load_season, save_season
+from request_scheduler import get_shared_scheduler
+
 # Configuration
 LEAGUE_ID = "1264338570127097857"
 BASE_URL = "https://api.sleeper.app/v1"
 RAW_DATA_DIR = Path(__file__).parent.parent / 'data' / 'raw'
+PLAYERS_CACHE_DIR = Path(__file__).parent.parent / 'data' / 'cache' / 'sleeper'
+PLAYERS_DUMP_PATH = PLAYERS_CACHE_DIR / 'players_nfl.json.gz'
+PLAYER_INDEX_PATH = PLAYERS_CACHE_DIR / 'players_index.json'
+
+# The /players/nfl dump is several MB and Sleeper asks for at most one download a day
+PLAYERS_TTL = 24 * 60 * 60  # seconds
+# Fields kept per player in the slim index, in stored order
+PLAYER_INDEX_FIELDS = ('position', 'name', 'team')
+# Seasons extracted in parallel share one download of the player dump
+_players_lock = threading.Lock()
+
+# Connections kept alive per host; also the number of weeks fetched at once
+SESSION_POOL_SIZE = 8
+
+
+def create_session(pool_size: int = SESSION_POOL_SIZE) -> requests.Session:
+    """HTTP session that keeps up to pool_size connections alive per host"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
-# Username mapping from Sleeper to standardized owner names
-USERNAME_MAPPING = {
-    'Brydome17': 'Bryan Whitaker',
-    'FortyChiners': 'Brendan Romale',
-    'JeremySettles13': 'Jeremy Settles',
-    'KCoffis': 'Kellen Coffis',
-    'LunaCorp': 'Jacob Luna',
-    'NamasYe': 'Chris Vitale',
-    'RapmasterRordogg': 'Rory McKee',
-    'SmiPi': 'Nick Smielak',
-    'T1GHTSTEVE': 'Steve Keller',
-    'gchildnl': 'Garrett Ulrich',
-    'gswens83': 'Greg Swenson',
-    'jamiecoffis': 'Jamie Coffis',
-    'kpop': 'Kyle Poppen',
-    'milmansion': 'Ryan Milhous'
-}
 
 class SleeperExtractor:
-    def __init__(self, league_id: str):
+    def __init__(self, league_id: str, http_cache=None, scheduler=None, session=None,
+                 max_workers: int = SESSION_POOL_SIZE):
+        """
+        Args:
+            league_id: Sleeper league ID
+            http_cache: Optional http_cache.ResponseCache to record or replay requests
+            scheduler: request_scheduler.RequestScheduler that rate limits and
+                retries requests (defaults to the process-wide shared scheduler)
+            session: requests.Session to reuse (a pooled keep-alive session is
+                created if not given)
+            max_workers: Requests fetched concurrently for weekly matchups and
+                brackets (1 = one at a time)
+        """
         self.league_id = league_id
         self.base_url = BASE_URL
+        self.http_cache = http_cache
+        self.scheduler = scheduler or get_shared_scheduler()
+        self.session = session or create_session()
+        self.max_workers = max(1, max_workers)
+        self._get = self.scheduler.wrap(self.session.get)
+        if http_cache:
+            self._get = http_cache.wrap(self._get)
+
+    def for_league(self, league_id: str) -> 'SleeperExtractor':
+        """Extractor for another league (e.g. an earlier season) sharing this one's connections and limits"""
+        extractor = SleeperExtractor(league_id, http_cache=self.http_cache, scheduler=self.scheduler,
+                                     session=self.session, max_workers=self.max_workers)
+        extractor.base_url = self.base_url
+        return extractor
+
+    def _fetch_all(self, calls):
+        """
+        Run zero-argument callables concurrently and return their outcomes in order
+
+        Each outcome is (result, None) or (None, exception), so callers can report
+        failures in the same order a sequential loop would.
+        """
+        def outcome(call):
+            try:
+                return call(), None
+            except Exception as e:
+                return None, e
+
+        if self.max_workers == 1 or len(calls) <= 1:
+            return [outcome(call) for call in calls]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(calls))) as executor:
+            return list(executor.map(outcome, calls))
 
     def get_league_info(self) -> Dict[str, Any]:
         """Get league information"""
-        response = requests.get(f"{self.base_url}/league/{self.league_id}")
+        response = self._get(f"{self.base_url}/league/{self.league_id}")
         response.raise_for_status()
         return response.json()
 
     def get_users(self) -> List[Dict[str, Any]]:
         """Get all users in the league"""
-        response = requests.get(f"{self.base_url}/league/{self.league_id}/users")
+        response = self._get(f"{self.base_url}/league/{self.league_id}/users")
         response.raise_for_status()
         return response.json()
 
     def get_rosters(self) -> List[Dict[str, Any]]:
         """Get all rosters"""
-        response = requests.get(f"{self.base_url}/league/{self.league_id}/rosters")
+        response = self._get(f"{self.base_url}/league/{self.league_id}/rosters")
         response.raise_for_status()
         return response.json()
 
     def get_matchups(self, week: int) -> List[Dict[str, Any]]:
         """Get matchups for a specific week"""
-        response = requests.get(f"{self.base_url}/league/{self.league_id}/matchups/{week}")
+        response = self._get(f"{self.base_url}/league/{self.league_id}/matchups/{week}")
         response.raise_for_status()
         return response.json()
 
     def get_all_matchups(self, num_weeks: int = 18) -> Dict[int, List[Dict[str, Any]]]:
-        """Get matchups for all weeks"""
+        """Get matchups for all weeks (fetched concurrently, returned in week order)"""
+        weeks = list(range(1, num_weeks + 1))
+        outcomes = self._fetch_all([lambda week=week: self.get_matchups(week) for week in weeks])
+
         all_matchups = {}
-        for week in range(1, num_weeks + 1):
-            try:
-                matchups = self.get_matchups(week)
-                if matchups:
-                    all_matchups[week] = matchups
-            except Exception as e:
-                print(f"Warning: Could not get matchups for week {week}: {e}")
+        for week, (matchups, error) in zip(weeks, outcomes):
+            if error is not None:
+                print(f"Warning: Could not get matchups for week {week}: {error}")
+            elif matchups:
+                all_matchups[week] = matchups
         return all_matchups
 
     def get_drafts(self) -> List[Dict[str, Any]]:
         """Get all drafts for the league"""
-        response = requests.get(f"{self.base_url}/league/{self.league_id}/drafts")
+        response = self._get(f"{self.base_url}/league/{self.league_id}/drafts")
         response.raise_for_status()
         return response.json()
 
     def get_draft_picks(self, draft_id: str) -> List[Dict[str, Any]]:
         """Get all picks for a specific draft"""
-        response = requests.get(f"{self.base_url}/draft/{draft_id}/picks")
+        response = self._get(f"{self.base_url}/draft/{draft_id}/picks")
         response.raise_for_status()
         return response.json()
 
-    def get_players_map(self) -> Dict[str, Any]:
-        """Get player information (cached by Sleeper)"""
-        response = requests.get(f"{self.base_url}/players/nfl")
+    def get_players_map(self, max_age: float = PLAYERS_TTL) -> Dict[str, Any]:
+        """
+        Get the full player dump, downloading it at most once per max_age seconds
+        (kept gzip-compressed at PLAYERS_DUMP_PATH)
+        """
+        if PLAYERS_DUMP_PATH.exists() and time.time() - PLAYERS_DUMP_PATH.stat().st_mtime < max_age:
+            with gzip.open(PLAYERS_DUMP_PATH, 'rt', encoding='utf-8') as f:
+                return json.load(f)
+
+        response = self._get(f"{self.base_url}/players/nfl")
         response.raise_for_status()
-        return response.json()
+        players = response.json()
+
+        PLAYERS_DUMP_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = PLAYERS_DUMP_PATH.with_name(f'{PLAYERS_DUMP_PATH.name}.{threading.get_ident()}.tmp')
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(players, f, separators=(',', ':'))
+        os.replace(tmp_path, PLAYERS_DUMP_PATH)
+        return players
+
+    def get_player_index(self, max_age: float = PLAYERS_TTL) -> Dict[str, List[str]]:
+        """
+        Get player_id -> [position, name, team] (see PLAYER_INDEX_FIELDS)
+
+        Served from a slim on-disk index while it is fresh, which loads in a few
+        milliseconds; otherwise rebuilt from the (cached or downloaded) full dump.
+        """
+        with _players_lock:
+            return self._load_player_index(max_age)
+
+    def _load_player_index(self, max_age: float) -> Dict[str, List[str]]:
+        if PLAYER_INDEX_PATH.exists():
+            with open(PLAYER_INDEX_PATH, 'r') as f:
+                cached = json.load(f)
+            if tuple(cached['fields']) == PLAYER_INDEX_FIELDS and time.time() - cached['fetched_at'] < max_age:
+                return cached['players']
+
+        players = self.get_players_map(max_age)
+        index = {}
+        for player_id, player in players.items():
+            name = player.get('full_name') or f"{player.get('first_name', '')} {player.get('last_name', '')}".strip()
+            index[player_id] = [player.get('position') or '', name, player.get('team') or '']
+
+        tmp_path = PLAYER_INDEX_PATH.with_name(f'{PLAYER_INDEX_PATH.name}.{threading.get_ident()}.tmp')
+        with open(tmp_path, 'w') as f:
+            # Stamped with the dump's age so the index never outlives it
+            json.dump({'fields': PLAYER_INDEX_FIELDS, 'fetched_at': PLAYERS_DUMP_PATH.stat().st_mtime,
+                       'players': index}, f, separators=(',', ':'))
+        os.replace(tmp_path, PLAYER_INDEX_PATH)
+        return index
 
     def normalize_owner_name(self, display_name: str) -> str:
         """Map Sleeper username to standardized owner name"""
@@ -98,16 +204,24 @@ class SleeperExtractor:
 
     def get_winners_bracket(self) -> List[Dict[str, Any]]:
         """Get winners bracket (playoff) data"""
-        response = requests.get(f"{self.base_url}/league/{self.league_id}/winners_bracket")
+        response = self._get(f"{self.base_url}/league/{self.league_id}/winners_bracket")
         response.raise_for_status()
         return response.json()
 
     def get_losers_bracket(self) -> List[Dict[str, Any]]:
         """Get losers bracket (toilet bowl) data"""
-        response = requests.get(f"{self.base_url}/league/{self.league_id}/losers_bracket")
+        response = self._get(f"{self.base_url}/league/{self.league_id}/losers_bracket")
         response.raise_for_status()
         return response.json()
 
+    def get_brackets(self):
+        """Get winners and losers brackets concurrently; raises the first failure"""
+        outcomes = self._fetch_all([self.get_winners_bracket, self.get_losers_bracket])
+        for _, error in outcomes:
+            if error is not None:
+                raise error
+        return outcomes[0][0], outcomes[1][0]
+
     def decode_playoff_standings(self, winners_bracket: List[Dict], losers_bracket: List[Dict]) -> Dict[int, int]:
         """Decode playoff brackets to determine final standings
         Returns a dict mapping roster_id -> final_standing (1-14)
@@ -154,8 +268,7 @@ class SleeperExtractor:
         # Get playoff bracket data and decode final standings
         print("  Fetching playoff brackets...")
         try:
-            winners_bracket = self.get_winners_bracket()
-            losers_bracket = self.get_losers_bracket()
+            winners_bracket, losers_bracket = self.get_brackets()
             playoff_standings = self.decode_playoff_standings(winners_bracket, losers_bracket)
             print(f"  Decoded playoff standings for {len(playoff_standings)} teams")
         except Exception as e:
@@ -246,9 +359,9 @@ class SleeperExtractor:
         draft_picks = []
 
         if drafts:
-            # Fetch players map to get position data
-            print("  Fetching players map for position data...")
-            players_map = self.get_players_map()
+            # Slim player index (refreshed at most daily) for position data
+            print("  Loading player index for position data...")
+            player_index = self.get_player_index()
 
             draft_id = drafts[0].get('draft_id')
             picks = self.get_draft_picks(draft_id)
@@ -259,9 +372,8 @@ class SleeperExtractor:
                 team_info = next((t for t in teams if t['team_id'] == roster_id), {})
                 player_id = pick.get('player_id')
 
-                # Look up player position from players map
-                player_data = players_map.get(player_id, {})
-                position = player_data.get('position', '')
+                # Look up player position from the player index
+                position = player_index.get(player_id, [''])[0]
 
                 draft_picks.append({
                     'player_name': f"{metadata.get('first_name', '')} {metadata.get('last_name', '')}".strip(),
@@ -294,37 +406,143 @@ class SleeperExtractor:
 
         return season_data
 
-    def save_season_data(self, year: int, data: Dict[str, Any]):
-        """Save season data to JSON file"""
-        RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
-        filename = RAW_DATA_DIR / f'season_{year}.json'
-
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+    def save_season_data(self, year: int, data: Dict[str, Any], raw_format: str = DEFAULT_FORMAT):
+        """Save season data in the configured raw format (see raw_storage)"""
+        filename = save_season(year, data, fmt=raw_format, raw_dir=RAW_DATA_DIR)
 
         print(f"✓ Saved data to {filename}")
 
-def main():
-    """Main extraction function"""
-    print("=== Sleeper Data Extractor ===\n")
+    def get_league_history(self) -> List[Dict[str, Any]]:
+        """
+        League info for this league and every earlier season, oldest first
 
-    extractor = SleeperExtractor(LEAGUE_ID)
+        Sleeper creates a new league each season and links it to the previous
+        one through previous_league_id.
+        """
+        history = []
+        seen = set()
+        league_id = self.league_id
+        while league_id and league_id != '0' and league_id not in seen:
+            seen.add(league_id)
+            league_info = self.for_league(league_id).get_league_info()
+            history.append(league_info)
+            league_id = league_info.get('previous_league_id')
+        return list(reversed(history))
+
+    @staticmethod
+    def is_season_closed(cached: Dict[str, Any]) -> bool:
+        """True if a cached season was extracted from Sleeper after the league completed"""
+        return bool(cached) and cached.get('source') == 'sleeper' and cached.get('status') == 'complete'
+
+    def _extract_league(self, league_info: Dict[str, Any], force_refresh: bool = False,
+                        raw_format: str = DEFAULT_FORMAT) -> bool:
+        """Extract and save one season of the history, returning True on success"""
+        year = int(league_info['season'])
+
+        # Closed seasons never change, so their first complete extraction is kept
+        if not force_refresh and self.is_season_closed(load_season(year, raw_dir=RAW_DATA_DIR)):
+            print(f"\n{year}: Season complete and cached")
+            return True
 
-    # Extract 2025 season (Sleeper's 2025 season = 2024-2025 NFL season)
-    league_info = extractor.get_league_info()
-    season = league_info.get('season')
+        try:
+            extractor = self.for_league(league_info['league_id'])
+            data = extractor.extract_season_data(year)
+        except Exception as e:
+            print(f"\n{year}: Extraction failed: {e}")
+            return False
 
-    print(f"League: {league_info.get('name')}")
-    print(f"Season: {season}")
-    print(f"Status: {league_info.get('status')}\n")
+        data['league_id'] = league_info['league_id']
+        data['status'] = league_info.get('status')
+        extractor.save_season_data(year, data, raw_format)
+        return True
 
-    # Use 2025 as the year (the fantasy season year)
-    year = 2025
+    def extract_all_seasons(self, force_refresh: bool = False, workers: int = 1,
+                            raw_format: str = DEFAULT_FORMAT):
+        """
+        Extract every season in the league's history
 
-    season_data = extractor.extract_season_data(year)
-    extractor.save_season_data(year, season_data)
+        Args:
+            force_refresh: If True, re-fetch closed seasons that are already cached
+            workers: Number of seasons to extract in parallel (1 = one at a time)
+            raw_format: Raw storage format for saved seasons (see raw_storage)
 
-    print("\n✓ Sleeper data extraction complete!")
+        Returns:
+            (successful years, failed years)
+        """
+        workers = max(1, workers or 1)
+        history = self.get_league_history()
+        years = [int(league_info['season']) for league_info in history]
+
+        print(f"=== Sleeper Fantasy Football Data Extraction ===")
+        print(f"League ID: {self.league_id}")
+        print(f"Seasons: {', '.join(str(year) for year in years)}")
+        if workers > 1:
+            print(f"Workers: {workers}")
+        print(f"=" * 48)
+
+        results = {}
+        if workers == 1:
+            for league_info in history:
+                results[int(league_info['season'])] = self._extract_league(league_info, force_refresh, raw_format)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._extract_league, league_info, force_refresh, raw_format):
+                        int(league_info['season'])
+                    for league_info in history
+                }
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    year = futures[future]
+                    results[year] = future.result()
+                    print(f"  [{completed}/{len(years)}] {'✓' if results[year] else '✗'} {year}")
+
+        # Report in year order regardless of completion order
+        successful = [year for year in years if results[year]]
+        failed = [year for year in years if not results[year]]
+
+        print(f"\n{'=' * 48}")
+        print(f"Extraction Complete!")
+        print(f"  Successful: {len(successful)} seasons")
+        if failed:
+            print(f"  Failed: {len(failed)} seasons - {failed}")
+        print(f"  {self.scheduler.report()}")
+        if self.http_cache:
+            print(f"  {self.http_cache.report()}")
+        print(f"{'=' * 48}\n")
+
+        return successful, failed
+
+def main():
+    """Main extraction function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Extract Sleeper league data')
+    parser.add_argument('--league-id', default=LEAGUE_ID,
+                        help='Current Sleeper league ID; earlier seasons are found from it (default: %(default)s)')
+    parser.add_argument('--force-refresh', action='store_true',
+                        help='Re-fetch completed seasons that are already cached')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='Seasons extracted in parallel (default: 4, 1 = one at a time)')
+    parser.add_argument('--week-workers', type=int, default=SESSION_POOL_SIZE,
+                        help=f'Weeks fetched concurrently per season (default: {SESSION_POOL_SIZE}, 1 = one at a time)')
+    parser.add_argument('--raw-format', choices=list(FORMAT_SUFFIXES), default=DEFAULT_FORMAT,
+                        help=f'Storage format for raw season files (default: {DEFAULT_FORMAT})')
+    parser.add_argument('--http-cache', choices=ResponseCache.MODES,
+                        help='Record responses to, or replay them from, the on-disk HTTP cache')
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_TTL / 3600,
+                        help='Hours a recorded response stays fresh (default: 24)')
+    args = parser.parse_args()
+
+    http_cache = None
+    if args.http_cache:
+        http_cache = ResponseCache(mode=args.http_cache, ttl=args.cache_ttl * 3600)
+
+    extractor = SleeperExtractor(args.league_id, http_cache=http_cache, max_workers=args.week_workers)
+    successful, failed = extractor.extract_all_seasons(force_refresh=args.force_refresh, workers=args.workers,
+                                                       raw_format=args.raw_format)
+
+    if not failed:
+        print("✓ Sleeper data extraction complete!")
 
 if __name__ == '__main__':
     main()
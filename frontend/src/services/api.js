@@ -96,6 +96,10 @@ export const apiService = {
     const data = await fetchJSON('records.json');
     return { data };
   },
+  getLeaderboards: async () => {
+    const data = await fetchJSON('leaderboards.json');
+    return { data };
+  },
 
   // Draft
   getDraft: async () => {